@@ -0,0 +1,418 @@
+# benchmarks.py
+"""
+Benchmark suite for the match engines, league bookkeeping and renderers.
+
+    python benchmarks.py                          # run everything, print a table
+    python benchmarks.py -o results.json          # ...and save the results as JSON
+    python benchmarks.py --compare baseline.json  # compare against a saved run
+    python benchmarks.py -k league                # only names containing "league"
+
+Rendering runs on an offscreen surface with SDL's dummy video driver, so no window is
+needed.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+# Headless pygame: must be set before anything imports pygame (constants does)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pygame
+from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Each benchmark is timed for at least this long per repeat, best repeat wins
+MIN_TIME_S = 0.2
+REPEATS = 3
+# Relative slowdown reported as a regression when comparing against a baseline
+REGRESSION_THRESHOLD = 0.10
+LEAGUE_SIZES = (10, 100, 1000)
+# Steps a dynamic match is advanced before timing mid-match work
+MATCH_WARMUP_STEPS = 100
+SEED = 1234
+
+BENCHMARKS = {}  # {name: setup function returning the callable to time}
+
+
+def benchmark(name):
+    """Registers a setup function returning a zero-argument op (one call = one op)."""
+
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def time_op(op, min_time=MIN_TIME_S, repeats=REPEATS):
+    """Best-of-repeats seconds per call of op (each repeat lasts at least min_time)."""
+    op()  # Warm up caches and lazy imports
+    number = 1
+    while True:  # Calibrate how many calls fill min_time
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    best = elapsed / number
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            op()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best, number
+
+
+# --- Fixtures ---
+def _teams(num_teams, seed=SEED):
+    from player import PlayerStore
+    from team import create_initial_teams
+
+    return create_initial_teams(num_teams, rng=random.Random(seed), store=PlayerStore())
+
+
+def _screen():
+    pygame.init()
+    pygame.display.set_mode((1, 1))  # Needed for convert()-style surface formats
+    return pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+# --- Match engines ---
+@benchmark("simulate_match")
+def bench_simulate_match():
+    from match_engine import simulate_match
+
+    home, away = _teams(2)
+    rng = random.Random(SEED)
+    return lambda: simulate_match(home, away, rng=rng)
+
+
+@benchmark("simulate_matches_batch_1000")
+def bench_simulate_matches_batch():
+    from match_engine import simulate_matches_batch
+
+    home, away = _teams(2)
+    home_ratings = np.tile(home.get_rating_vector(), (1000, 1))
+    away_ratings = np.tile(away.get_rating_vector(), (1000, 1))
+    rng = np.random.default_rng(SEED)
+    return lambda: simulate_matches_batch(home_ratings, away_ratings, rng=rng)
+
+
+def _engine_stepper():
+    """An op running one dynamic engine step, starting a new match when one finishes."""
+    from dynamic_engine import DynamicMatchEngine
+
+    home, away = _teams(2)
+    rng = random.Random(SEED)
+    state = {"engine": DynamicMatchEngine(home, away, rng=rng)}
+
+    def new_match():
+        state["engine"] = DynamicMatchEngine(home, away, rng=rng)
+
+    return state, new_match
+
+
+@benchmark("dynamic_engine_step")
+def bench_dynamic_step():
+    """One MatchView simulation step, headless (the engine's _simulate_step)."""
+    state, new_match = _engine_stepper()
+
+    def op():
+        if not state["engine"].step():
+            new_match()
+
+    return op
+
+
+@benchmark("dynamic_update_player_targets")
+def bench_update_player_targets():
+    state, _ = _engine_stepper()
+    engine = state["engine"]
+    engine.run(
+        MATCH_WARMUP_STEPS
+    )  # Mid-match positions rather than the kickoff formation
+    while engine.ball_carrier is None and engine.step():
+        pass  # Targets are only computed while someone carries the ball
+
+    def op():
+        engine._proximity = None  # Each real step pays for a fresh proximity index
+        engine._update_player_targets()
+
+    return op
+
+
+@benchmark("dynamic_full_match")
+def bench_dynamic_full_match():
+    from dynamic_engine import simulate_dynamic_match
+
+    home, away = _teams(2)
+    rng = random.Random(SEED)
+    return lambda: simulate_dynamic_match(home, away, rng=rng)
+
+
+# --- League ---
+def _league(num_teams):
+    from league import League
+
+    return League(_teams(num_teams), rng=random.Random(SEED))
+
+
+def _bench_update_table(num_teams):
+    league = _league(num_teams)
+    rng = random.Random(SEED)
+    fixtures = league.fixtures[:5000]
+    state = {"i": 0}
+
+    def op():
+        home, away = fixtures[state["i"] % len(fixtures)]
+        state["i"] += 1
+        league.update_table(home, away, rng.randint(0, 40), rng.randint(0, 40))
+
+    return op
+
+
+def _bench_sorted_table(num_teams):
+    league = _league(num_teams)
+    rng = random.Random(SEED)
+    for home, away in league.fixtures[: num_teams * 2]:
+        league.update_table(home, away, rng.randint(0, 40), rng.randint(0, 40))
+
+    def op():
+        league.table_version += (
+            1  # As if a result came in: the cached list must be rebuilt
+        )
+        return league.get_sorted_table()
+
+    return op
+
+
+def _bench_sorted_table_tied(num_teams):
+    """Season start: one result in, every other team level (one big tie-break group)."""
+    league = _league(num_teams)
+    home, away = league.fixtures[0]
+    league.update_table(home, away, 20, 10)
+
+    def op():
+        league.table_version += 1
+        return league.get_sorted_table()
+
+    return op
+
+
+for _size in LEAGUE_SIZES:
+    benchmark(f"league_update_table_{_size}")(
+        lambda size=_size: _bench_update_table(size)
+    )
+    benchmark(f"league_get_sorted_table_{_size}")(
+        lambda size=_size: _bench_sorted_table(size)
+    )
+    benchmark(f"league_get_sorted_table_tied_{_size}")(
+        lambda size=_size: _bench_sorted_table_tied(size)
+    )
+
+
+# --- Rendering ---
+@benchmark("draw_league_table")
+def bench_draw_league_table():
+    """Per frame, with the table unchanged (cached path)."""
+    from ui import draw_league_table
+
+    screen = _screen()
+    league = _league(10)
+    return lambda: draw_league_table(screen, league, (50, 80))
+
+
+@benchmark("draw_league_table_changed")
+def bench_draw_league_table_changed():
+    """Per frame, with the table changing every frame (full re-render)."""
+    from ui import draw_league_table
+
+    screen = _screen()
+    league = _league(10)
+
+    def op():
+        league.table_version += 1
+        draw_league_table(screen, league, (50, 80))
+
+    return op
+
+
+@benchmark("draw_player_list")
+def bench_draw_player_list():
+    from ui import draw_player_list
+
+    screen = _screen()
+    team = _teams(1)[0]
+    return lambda: draw_player_list(screen, team, (50, 20))
+
+
+def _match_view(dirty_rects):
+    from match_view import MatchView
+
+    screen = _screen()
+    home, away = _teams(2)
+    view = MatchView(
+        screen,
+        home,
+        away,
+        lambda home_score, away_score: None,
+        dirty_rects=dirty_rects,
+        rng=random.Random(SEED),
+    )
+    view.engine.run(MATCH_WARMUP_STEPS)
+    view.draw()
+    return view
+
+
+@benchmark("match_view_draw")
+def bench_match_view_draw():
+    view = _match_view(dirty_rects=True)
+    return view.draw
+
+
+@benchmark("match_view_draw_full")
+def bench_match_view_draw_full():
+    view = _match_view(dirty_rects=False)
+    return view.draw
+
+
+# --- Running and comparing ---
+def run(names, min_time=MIN_TIME_S, repeats=REPEATS, stream=sys.stdout):
+    results = {}
+    for name in names:
+        op = BENCHMARKS[name]()
+        seconds, number = time_op(op, min_time, repeats)
+        results[name] = {
+            "seconds_per_op": seconds,
+            "ops_per_second": 1 / seconds,
+            "calls_per_repeat": number,
+        }
+        print(
+            f"{name:<36} {_format_time(seconds):>12}/op {1 / seconds:>14,.1f} ops/s",
+            file=stream,
+        )
+    return results
+
+
+def compare(results, baseline, threshold=REGRESSION_THRESHOLD, stream=sys.stdout):
+    """Prints new vs baseline timings. Returns the names of regressed benchmarks."""
+    regressions = []
+    print(
+        f"\n{'benchmark':<36} {'baseline':>12} {'current':>12} {'change':>9}",
+        file=stream,
+    )
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None:
+            new_time = _format_time(result["seconds_per_op"])
+            print(f"{name:<36} {'-':>12} {new_time:>12} {'new':>9}", file=stream)
+            continue
+        change = result["seconds_per_op"] / old["seconds_per_op"] - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "  faster"
+        print(
+            f"{name:<36} {_format_time(old['seconds_per_op']):>12} "
+            f"{_format_time(result['seconds_per_op']):>12} {change:>+9.1%}{flag}",
+            file=stream,
+        )
+    return regressions
+
+
+def _format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def _metadata():
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[1],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("-o", "--output", help="save results to this JSON file")
+    parser.add_argument(
+        "--compare", metavar="BASELINE", help="compare against a saved JSON run"
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        default="",
+        help="only run benchmarks whose name contains this",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=MIN_TIME_S,
+        help="seconds per repeat (default %(default)s)",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=REPEATS,
+        help="repeats, best wins (default %(default)s)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=REGRESSION_THRESHOLD,
+        help="regression threshold (default %(default)s)",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="exit with status 1 if anything regressed",
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="list benchmark names and exit"
+    )
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return 0
+    # MatchView and the engines print progress; keep the benchmark output readable
+    stdout = sys.stdout
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results = run(names, args.min_time, args.repeats, stream=stdout)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"metadata": _metadata(), "results": results}, f, indent=2)
+        print(f"\nSaved {len(results)} results to {args.output}")
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
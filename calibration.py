@@ -0,0 +1,415 @@
+# calibration.py
+"""
+Calibrates the instant engine (match_engine) against the dynamic engine.
+
+    python calibration.py                         # play both engines, fit, report
+    python calibration.py -o instant_params.json  # ...and save the fitted parameters
+    python calibration.py --pairings 500 --workers 4
+
+Both engines play the same team pairings. The dynamic engine's score, margin, try and
+penalty distributions are the target, and NORMALIZATION, TRY_BASE and PENALTY_FACTOR are
+fitted so the instant engine reproduces them. Apply a saved file with
+match_engine.load_params.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from match_engine import PARAM_NAMES, get_params, save_params, simulate_matches_batch
+
+PAIRINGS = 200
+DYNAMIC_MATCHES_PER_PAIRING = 2
+# The instant engine is cheap: many more repetitions per pairing smooth the fit
+INSTANT_MATCHES_PER_PAIRING = 50
+TEAM_POOL_SIZE = 24
+SEED = 1234
+QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+# Search space; NORMALIZATION moves by factors, the others by steps
+PARAM_BOUNDS = {
+    "NORMALIZATION": (5.0, 1000.0),
+    "TRY_BASE": (-3.0, 6.0),
+    "PENALTY_FACTOR": (-0.5, 1.0),
+}
+INITIAL_STEPS = {"NORMALIZATION": 2.0, "TRY_BASE": 1.0, "PENALTY_FACTOR": 0.1}
+MIN_STEPS = {"NORMALIZATION": 1.01, "TRY_BASE": 0.01, "PENALTY_FACTOR": 0.002}
+
+# Per-match result columns from either engine
+RESULT_KEYS = (
+    "home_score",
+    "away_score",
+    "home_tries",
+    "away_tries",
+    "home_penalties",
+    "away_penalties",
+)
+
+
+# --- Playing the pairings ---
+def team_pool(pool_size=TEAM_POOL_SIZE, seed=SEED):
+    """The teams calibration matches are played between (the same in every worker)."""
+    from player import PlayerStore
+    from seeding import RandomContext
+    from team import create_initial_teams
+
+    return create_initial_teams(
+        pool_size, rng=RandomContext(seed).stream("teams"), store=PlayerStore()
+    )
+
+
+def make_pairings(num_pairings=PAIRINGS, pool_size=TEAM_POOL_SIZE, seed=SEED):
+    """(num_pairings, 2) array of distinct (home, away) indices into team_pool."""
+    rng = np.random.default_rng(np.random.SeedSequence([seed, 1]))
+    home = rng.integers(0, pool_size, num_pairings)
+    away = (home + rng.integers(1, pool_size, num_pairings)) % pool_size
+    return np.column_stack((home, away))
+
+
+def run_dynamic(
+    pairings,
+    matches_per_pairing=DYNAMIC_MATCHES_PER_PAIRING,
+    workers=1,
+    pool_size=TEAM_POOL_SIZE,
+    seed=SEED,
+):
+    """
+    Plays every pairing on the dynamic engine, split across a process pool.
+    Returns {RESULT_KEYS: array}.
+    """
+    matches = [
+        (int(home), int(away), seed * 1_000_003 + i * matches_per_pairing + repeat)
+        for i, (home, away) in enumerate(pairings)
+        for repeat in range(matches_per_pairing)
+    ]
+    workers = max(1, min(workers or 1, len(matches)))
+    jobs = [(pool_size, seed, matches[i::workers]) for i in range(workers)]
+    if len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+            partials = list(pool.map(_dynamic_chunk, jobs))
+    else:
+        partials = [_dynamic_chunk(job) for job in jobs]
+    # Undo the round-robin split so rows line up with `matches`
+    rows = np.zeros((len(matches), len(RESULT_KEYS)), dtype=np.int64)
+    for i, partial in enumerate(partials):
+        rows[i::workers] = partial
+    return dict(zip(RESULT_KEYS, rows.T))
+
+
+def _dynamic_chunk(job):
+    """Worker for run_dynamic: plays (home, away, seed) matches to RESULT_KEYS rows."""
+    from dynamic_engine import DynamicMatchEngine, EVENT_PENALTY_GOAL, EVENT_TRY
+
+    pool_size, seed, matches = job
+    teams = team_pool(pool_size, seed)
+    rows = np.zeros((len(matches), len(RESULT_KEYS)), dtype=np.int64)
+    for row, (home, away, match_seed) in zip(rows, matches):
+        counts = {
+            (EVENT_TRY, True): 0,
+            (EVENT_TRY, False): 0,
+            (EVENT_PENALTY_GOAL, True): 0,
+            (EVENT_PENALTY_GOAL, False): 0,
+        }
+
+        def count(event, home_team=teams[home], counts=counts):
+            key = (event.kind, event.team is home_team)
+            if key in counts:
+                counts[key] += 1
+
+        engine = DynamicMatchEngine(
+            teams[home],
+            teams[away],
+            event_callback=count,
+            rng=random.Random(match_seed),
+        )
+        row[:] = (
+            *engine.run(),
+            counts[EVENT_TRY, True],
+            counts[EVENT_TRY, False],
+            counts[EVENT_PENALTY_GOAL, True],
+            counts[EVENT_PENALTY_GOAL, False],
+        )
+    return rows
+
+
+def run_instant(
+    ratings,
+    pairings,
+    matches_per_pairing=INSTANT_MATCHES_PER_PAIRING,
+    params=None,
+    seed=SEED,
+):
+    """
+    Plays every pairing on the instant engine. The same seed gives the same random draws
+    for any params (common random numbers), so comparing parameter sets isn't drowned in
+    noise.
+    """
+    pairs = np.repeat(pairings, matches_per_pairing, axis=0)
+    rng = np.random.default_rng(np.random.SeedSequence([seed, 2]))
+    home_scores, away_scores, details = simulate_matches_batch(
+        ratings[pairs[:, 0]], ratings[pairs[:, 1]], rng=rng, params=params, details=True
+    )
+    return {"home_score": home_scores, "away_score": away_scores, **details}
+
+
+# --- Comparing distributions ---
+def summarize(results):
+    """Distribution statistics of a run (either engine), for the report."""
+    home, away = results["home_score"], results["away_score"]
+    margin = home - away
+    tries = np.concatenate((results["home_tries"], results["away_tries"]))
+    penalties = np.concatenate((results["home_penalties"], results["away_penalties"]))
+    summary = {
+        "matches": len(home),
+        "home score": home.mean(),
+        "away score": away.mean(),
+        "score std": np.concatenate((home, away)).std(),
+        "margin (home - away)": margin.mean(),
+        "|margin|": np.abs(margin).mean(),
+        "margin std": margin.std(),
+        "home win rate": (margin > 0).mean(),
+        "draw rate": (margin == 0).mean(),
+        "tries per team": tries.mean(),
+        "penalty goals per team": penalties.mean(),
+    }
+    for q, value in zip(
+        QUANTILES, np.quantile(np.concatenate((home, away)), QUANTILES)
+    ):
+        summary[f"score p{int(q * 100)}"] = value
+    for q, value in zip(QUANTILES, np.quantile(np.abs(margin), QUANTILES)):
+        summary[f"|margin| p{int(q * 100)}"] = value
+    return {key: float(value) for key, value in summary.items()}
+
+
+def _features(results):
+    """
+    (values, natural scales) the fit compares: score and margin quantiles, try and
+    penalty rates.
+    """
+    scores = np.concatenate((results["home_score"], results["away_score"]))
+    margins = results["home_score"] - results["away_score"]
+    tries = np.concatenate((results["home_tries"], results["away_tries"]))
+    penalties = np.concatenate((results["home_penalties"], results["away_penalties"]))
+    values = np.concatenate(
+        (
+            np.quantile(scores, QUANTILES),
+            np.quantile(np.abs(margins), QUANTILES),
+            [tries.mean(), penalties.mean()],
+        )
+    )
+    scales = np.concatenate(
+        (
+            np.full(len(QUANTILES), scores.std()),
+            np.full(len(QUANTILES), margins.std()),
+            [tries.std(), penalties.std()],
+        )
+    )
+    return values, np.maximum(scales, 1e-3)
+
+
+def distance(target, results):
+    """Distance of a run from the target run (0 = same features), in target spreads."""
+    target_values, scales = _features(target)
+    values, _ = _features(results)
+    return float((((values - target_values) / scales) ** 2).sum())
+
+
+# --- Fitting ---
+def fit(
+    target,
+    ratings,
+    pairings,
+    matches_per_pairing=INSTANT_MATCHES_PER_PAIRING,
+    start=None,
+    seed=SEED,
+):
+    """
+    Pattern search over PARAM_NAMES: try a step up and down on each parameter, keep
+    whatever gets closer to target, halve the steps when nothing does. Returns (params,
+    distance).
+    """
+    params = dict(get_params() if start is None else start)
+    steps = dict(INITIAL_STEPS)
+
+    def score(candidate):
+        return distance(
+            target, run_instant(ratings, pairings, matches_per_pairing, candidate, seed)
+        )
+
+    best = score(params)
+    while any(_moves(steps[name], name) for name in PARAM_NAMES):
+        improved = False
+        for name in PARAM_NAMES:
+            if not _moves(steps[name], name):
+                continue
+            for candidate_value in _neighbours(params[name], steps[name], name):
+                candidate = {**params, name: candidate_value}
+                candidate_score = score(candidate)
+                if candidate_score < best:
+                    params, best, improved = candidate, candidate_score, True
+                    break
+        if not improved:
+            steps = {
+                name: (step**0.5 if name == "NORMALIZATION" else step / 2)
+                for name, step in steps.items()
+            }
+    return params, best
+
+
+def _moves(step, name):
+    return step > MIN_STEPS[name]
+
+
+def _neighbours(value, step, name):
+    low, high = PARAM_BOUNDS[name]
+    if name == "NORMALIZATION":
+        candidates = (value * step, value / step)
+    else:
+        candidates = (value + step, value - step)
+    return [
+        min(high, max(low, candidate))
+        for candidate in candidates
+        if low <= candidate <= high
+    ]
+
+
+# --- Report ---
+def format_report(
+    target, before, after, params_before, params_after, distance_before, distance_after
+):
+    lines = [f"{'statistic':<24} {'dynamic':>10} {'instant':>10} {'fitted':>10}"]
+    for key in target:
+        lines.append(
+            f"{key:<24} {target[key]:>10.3f} {before[key]:>10.3f} {after[key]:>10.3f}"
+        )
+    lines.append("")
+    lines.append(f"{'parameter':<24} {'':>10} {'instant':>10} {'fitted':>10}")
+    for name in PARAM_NAMES:
+        before, after = params_before[name], params_after[name]
+        lines.append(f"{name:<24} {'':>10} {before:>10.4f} {after:>10.4f}")
+    lines.append(
+        f"{'distance':<24} {'':>10} {distance_before:>10.3f} {distance_after:>10.3f}"
+    )
+    lines.append("")
+    lines.append(
+        "The instant engine has no home advantage term: "
+        "home/away balance is reported, not fitted."
+    )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[1],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "-o", "--output", help="save the fitted parameters to this JSON file"
+    )
+    parser.add_argument(
+        "--pairings",
+        type=int,
+        default=PAIRINGS,
+        help="team pairings (default %(default)s)",
+    )
+    parser.add_argument(
+        "--matches",
+        type=int,
+        default=DYNAMIC_MATCHES_PER_PAIRING,
+        help="dynamic matches per pairing (default %(default)s)",
+    )
+    parser.add_argument(
+        "--instant-matches",
+        type=int,
+        default=INSTANT_MATCHES_PER_PAIRING,
+        help="instant matches per pairing (default %(default)s)",
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=TEAM_POOL_SIZE,
+        help="teams to draw pairings from (default %(default)s)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="processes for the dynamic engine (default %(default)s)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=SEED,
+        help="seed for teams, pairings and matches (default %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    ratings = np.array(
+        [team.get_rating_vector() for team in team_pool(args.pool_size, args.seed)]
+    )
+    pairings = make_pairings(args.pairings, args.pool_size, args.seed)
+
+    print(
+        f"Playing {len(pairings) * args.matches} dynamic matches "
+        f"on {args.workers} worker(s)..."
+    )
+    start = time.perf_counter()
+    target = run_dynamic(
+        pairings, args.matches, args.workers, args.pool_size, args.seed
+    )
+    print(
+        f"...done in {time.perf_counter() - start:.1f} s. Fitting the instant engine..."
+    )
+
+    params_before = get_params()
+    before = run_instant(
+        ratings, pairings, args.instant_matches, params_before, args.seed
+    )
+    params_after, distance_after = fit(
+        target, ratings, pairings, args.instant_matches, params_before, args.seed
+    )
+    after = run_instant(
+        ratings, pairings, args.instant_matches, params_after, args.seed
+    )
+    distance_before = distance(target, before)
+    print()
+    print(
+        format_report(
+            summarize(target),
+            summarize(before),
+            summarize(after),
+            params_before,
+            params_after,
+            distance_before,
+            distance_after,
+        )
+    )
+
+    if args.output:
+        save_params(
+            args.output,
+            params_after,
+            calibration={
+                "pairings": args.pairings,
+                "dynamic_matches_per_pairing": args.matches,
+                "instant_matches_per_pairing": args.instant_matches,
+                "pool_size": args.pool_size,
+                "seed": args.seed,
+                "distance_before": distance_before,
+                "distance_after": distance_after,
+                "dynamic": summarize(target),
+                "fitted": summarize(after),
+            },
+        )
+        print(
+            f"\nSaved fitted parameters to {args.output} "
+            "(apply with match_engine.load_params)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,779 @@
+# dynamic_engine.py
+import random
+import time
+import numpy as np
+from sim_constants import (
+    PITCH_LEFT,
+    PITCH_TOP,
+    PITCH_WIDTH,
+    PITCH_HEIGHT,
+    PITCH_RIGHT,
+    PITCH_BOTTOM,
+    PITCH_CENTERX,
+    PITCH_CENTERY,
+    GAME_DURATION_MINUTES,
+    MATCH_DURATION_STEPS,
+    BASE_PENALTY_CHANCE,
+    TRY_POINTS,
+    CONVERSION_POINTS,
+    PENALTY_POINTS,
+    PLAYER_DEFAULT_SPEED,
+    PLAYER_SPEED_VARIATION,
+    SUPPORT_DISTANCE,
+    TACKLE_RADIUS,
+    ATTACKING_SUPPORT_WIDTH,
+    DEFENSIVE_LINE_Y_OFFSET,
+    DEFENSIVE_LINE_SPACING,
+    SWEEPER_DEPTH_OFFSET,
+    PASS_PRESSURE_RADIUS,
+    PASS_MAX_DISTANCE,
+    PASS_Y_TOLERANCE,
+    PASS_INTERCEPTION_BASE_CHANCE,
+    PASS_INTERCEPTION_RADIUS,
+)
+from team import Team
+from player import Player
+from match_engine import calculate_team_ratings
+from proximity import ProximityIndex
+from probabilities import get_tables
+
+# --- Event kinds emitted by the engine ---
+EVENT_KICKOFF = "kickoff"
+EVENT_POSSESSION = "possession"
+EVENT_PASS = "pass"
+EVENT_INTERCEPTION = "interception"
+EVENT_DROPPED_PASS = "dropped_pass"
+EVENT_TACKLE = "tackle"
+EVENT_BROKEN_TACKLE = "broken_tackle"
+EVENT_PENALTY = "penalty"
+EVENT_PENALTY_GOAL = "penalty_goal"
+EVENT_PENALTY_MISS = "penalty_miss"
+EVENT_KICK_FOR_TOUCH = "kick_for_touch"
+EVENT_TRY = "try"
+EVENT_CONVERSION = "conversion"
+EVENT_CONVERSION_MISS = "conversion_miss"
+
+# --- Columns of DynamicMatchEngine.state (one row per player, home team first) ---
+COL_X = 0
+COL_Y = 1
+COL_TARGET_X = 2
+COL_TARGET_Y = 3
+COL_SPEED = 4
+NUM_STATE_COLUMNS = 5
+
+# Players may drift slightly outside the pitch before being clamped
+PITCH_MARGIN = 20
+_POSITION_MIN = np.array([PITCH_LEFT - PITCH_MARGIN, PITCH_TOP - PITCH_MARGIN])
+_POSITION_MAX = np.array([PITCH_RIGHT + PITCH_MARGIN, PITCH_BOTTOM + PITCH_MARGIN])
+
+# How many players form the immediate support line behind the carrier
+IMMEDIATE_SUPPORT_PLAYERS = 4
+# Horizontal offsets of the immediate support slots from the carrier, in widths:
+# +1, -1, +2, -2, ...
+_SUPPORT_SLOT_OFFSETS = (
+    np.array(
+        [
+            (i // 2 + 1) * (1 if i % 2 == 0 else -1)
+            for i in range(IMMEDIATE_SUPPORT_PLAYERS)
+        ]
+    )
+    * ATTACKING_SUPPORT_WIDTH
+)
+
+
+class PlayerState:
+    """
+    Row view of one player inside a DynamicMatchEngine.
+    Position, target and speed live in the engine's `state` array (one row per player),
+    so movement for the whole match is a single vectorized update.
+    """
+
+    __slots__ = ("engine", "index", "player", "team")
+
+    def __init__(self, engine, index: int, player_obj: Player, team_obj: Team):
+        self.engine = engine
+        self.index = index  # Row in engine.state
+        self.player = player_obj
+        self.team = team_obj
+
+    @property
+    def x(self):
+        return self.engine.state.item(self.index, COL_X)
+
+    @x.setter
+    def x(self, value):
+        self.engine.state[self.index, COL_X] = value
+        self.engine._proximity = None
+
+    @property
+    def y(self):
+        return self.engine.state.item(self.index, COL_Y)
+
+    @y.setter
+    def y(self, value):
+        self.engine.state[self.index, COL_Y] = value
+        self.engine._proximity = None
+
+    @property
+    def target_x(self):
+        return self.engine.state.item(self.index, COL_TARGET_X)
+
+    @target_x.setter
+    def target_x(self, value):
+        self.engine.state[self.index, COL_TARGET_X] = value
+
+    @property
+    def target_y(self):
+        return self.engine.state.item(self.index, COL_TARGET_Y)
+
+    @target_y.setter
+    def target_y(self, value):
+        self.engine.state[self.index, COL_TARGET_Y] = value
+
+    @property
+    def speed(self):
+        """Distance covered per step (precomputed from the player's speed attribute)."""
+        return self.engine.state.item(self.index, COL_SPEED)
+
+
+def player_step_speed(speed_attribute):
+    """Movement per step from a player's speed attribute (scalar or array)."""
+    variation = (
+        (np.asarray(speed_attribute, dtype=float) - 50) / 50.0
+    ) * PLAYER_SPEED_VARIATION
+    return np.maximum(0.5, PLAYER_DEFAULT_SPEED + variation)
+
+
+# Phases of a simulation step, in execution order (see StepStats)
+STEP_PHASES = (
+    "loose_ball",
+    "targets",
+    "movement",
+    "passing",
+    "tackles",
+    "penalty",
+    "scoring",
+)
+
+
+class StepStats:
+    """
+    Per-phase timing and early-exit counters for DynamicMatchEngine steps. Only
+    collected after engine.enable_stats(); otherwise steps report to NULL_STEP_STATS.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.steps = 0
+        self.phase_ns = dict.fromkeys(STEP_PHASES, 0)  # Total time spent in each phase
+        self.phase_calls = dict.fromkeys(STEP_PHASES, 0)  # How often each phase ran
+        self.early_exits = dict.fromkeys(
+            STEP_PHASES, 0
+        )  # Steps that ended in this phase
+
+    def begin(self):
+        """Counts a step. Returns now, the start of its first phase."""
+        self.steps += 1
+        return time.perf_counter_ns()
+
+    def lap(self, phase, start_ns):
+        """Charges the time since start_ns to phase. Returns now (the next start)."""
+        now = time.perf_counter_ns()
+        self.phase_ns[phase] += now - start_ns
+        self.phase_calls[phase] += 1
+        return now
+
+    def early_exit(self, phase):
+        self.early_exits[phase] += 1
+
+    def summary(self):
+        """[(phase, calls, mean us per call, share of step time, early exits), ...]"""
+        total_ns = sum(self.phase_ns.values()) or 1
+        return [
+            (
+                phase,
+                self.phase_calls[phase],
+                self.phase_ns[phase] / max(1, self.phase_calls[phase]) / 1000,
+                self.phase_ns[phase] / total_ns,
+                self.early_exits[phase],
+            )
+            for phase in STEP_PHASES
+        ]
+
+    def format_lines(self):
+        total_ms = sum(self.phase_ns.values()) / 1e6
+        lines = [
+            f"{self.steps} steps, {total_ms / max(1, self.steps) * 1000:.1f} us/step"
+        ]
+        for phase, calls, mean_us, share, exits in self.summary():
+            lines.append(f"{phase:<10} {mean_us:7.1f} us {share:4.0%}  exits {exits}")
+        return lines
+
+
+class _NullStepStats:
+    """Stands in for StepStats while stats are off, so steps needn't check for them."""
+
+    def begin(self):
+        return 0
+
+    def lap(self, phase, start_ns):
+        return 0
+
+    def early_exit(self, phase):
+        pass
+
+
+NULL_STEP_STATS = _NullStepStats()
+
+
+class MatchEvent:
+    """Something that happened during a dynamic match (pass, tackle, try, ...)."""
+
+    def __init__(self, step, kind, team, message):
+        self.step = step
+        self.kind = kind  # One of the EVENT_* constants above
+        self.team = team  # Team the event belongs to (may be None)
+        self.message = message  # Human readable text, used for the status line
+
+    def __repr__(self):
+        return (
+            f"MatchEvent(step={self.step}, kind={self.kind!r}, "
+            f"message={self.message!r})"
+        )
+
+
+class DynamicMatchEngine:
+    """
+    Headless dynamic match simulation (player movement, passing, tackles, set pieces).
+    Advances purely by step count, so a full match can run as fast as the CPU allows.
+    Renderers (see MatchView) read the public state and listen to events via
+    event_callback.
+    """
+
+    def __init__(self, home_team: Team, away_team: Team, event_callback=None, rng=None):
+        self.home_team = home_team
+        self.away_team = away_team
+        self.event_callback = (
+            event_callback  # Called with each MatchEvent as it happens
+        )
+        self.stats: StepStats | None = None  # Per-phase timings, see enable_stats()
+        # Every draw comes from rng (e.g. seeding.RandomContext.match_rng), so a seeded
+        # match replays bit-identically; the numpy stream is seeded from it too
+        self.rng = rng if rng is not None else random.Random()
+        self.np_rng = np.random.default_rng(
+            self.rng.getrandbits(64)
+        )  # For vectorized draws (formation jitter)
+        self.tables = get_tables()  # Precomputed tackle/pass/kick success chances
+
+        # Simulation State
+        self.home_score = 0
+        self.away_score = 0
+        self.current_step = 0
+        self.events: list[MatchEvent] = []
+
+        # Player positional data
+        self.home_players: list[PlayerState] = []
+        self.away_players: list[PlayerState] = []
+        self._initialize_player_states()
+
+        # Ball state
+        self.ball_x = PITCH_CENTERX
+        self.ball_y = PITCH_CENTERY
+        self.ball_carrier: PlayerState | None = None
+        self.possession_team: Team | None = None
+
+        # Pairwise distances for the current positions, rebuilt lazily after moves
+        self._proximity: ProximityIndex | None = None
+
+        # Ratings
+        self.home_ratings = calculate_team_ratings(self.home_team)
+        self.away_ratings = calculate_team_ratings(self.away_team)
+
+        # Initial kickoff
+        self._kickoff()
+
+    @property
+    def is_finished(self):
+        return self.current_step >= MATCH_DURATION_STEPS
+
+    @property
+    def minute(self):
+        """Game minute corresponding to the current step."""
+        return int((self.current_step / MATCH_DURATION_STEPS) * GAME_DURATION_MINUTES)
+
+    def step(self):
+        """Advances the match by one step. Returns False once the match is over."""
+        if self.is_finished:
+            return False
+        self._simulate_step()
+        self.current_step += 1
+        return True
+
+    def enable_stats(self, enabled=True) -> StepStats | None:
+        """Starts (or stops) collecting per-phase step timings. Returns StepStats."""
+        if not enabled:
+            self.stats = None
+        elif self.stats is None:
+            self.stats = StepStats()
+        return self.stats
+
+    def run(self, steps=None):
+        """Runs `steps` steps (or to full time). Returns (home_score, away_score)."""
+        remaining = MATCH_DURATION_STEPS if steps is None else steps
+        while remaining > 0 and self.step():
+            remaining -= 1
+        return self.home_score, self.away_score
+
+    @property
+    def proximity(self) -> ProximityIndex:
+        """Distance index for the current positions (built at most once per step)."""
+        if self._proximity is None:
+            self._proximity = ProximityIndex(self.state[:, COL_X], self.state[:, COL_Y])
+        return self._proximity
+
+    def _team_rows(self, team: Team):
+        return self._home_rows if team == self.home_team else self._away_rows
+
+    def _nearest_to_ball(self, rows=slice(None)) -> PlayerState | None:
+        index, _ = self.proximity.nearest_to_point(self.ball_x, self.ball_y, rows)
+        return None if index is None else self.players[index]
+
+    def _emit(self, kind, team, message):
+        event = MatchEvent(self.current_step, kind, team, message)
+        self.events.append(event)
+        if self.event_callback:
+            self.event_callback(event)
+
+    def _initialize_player_states(self):
+        """Set up initial player positions in a rough formation."""
+        home_def_y = PITCH_CENTERY - PITCH_HEIGHT * 0.15
+        home_att_y = PITCH_CENTERY - PITCH_HEIGHT * 0.35
+        away_def_y = PITCH_CENTERY + PITCH_HEIGHT * 0.15
+        away_att_y = PITCH_CENTERY + PITCH_HEIGHT * 0.35
+        fwd_x_spacing = PITCH_WIDTH / 9
+        fwd_xs = [PITCH_LEFT + fwd_x_spacing * (i + 1) for i in range(8)]
+        back_x_spacing = PITCH_WIDTH / 8
+        back_xs = [PITCH_LEFT + back_x_spacing * (i + 0.5) for i in range(7)]
+
+        num_home = len(self.home_team.players)
+        num_players = num_home + len(self.away_team.players)
+        self.state = np.zeros((num_players, NUM_STATE_COLUMNS))
+        self.num_home = num_home
+        self.players: list[PlayerState] = []
+
+        rows = [
+            (p, self.home_team, home_def_y, home_att_y) for p in self.home_team.players
+        ]
+        rows += [
+            (p, self.away_team, away_def_y, away_att_y) for p in self.away_team.players
+        ]
+        for index, (p, team, def_y, att_y) in enumerate(rows):
+            i = (
+                index if index < num_home else index - num_home
+            )  # Shirt slot within the team
+            if i < 8:
+                x, y = fwd_xs[i], def_y + self.rng.uniform(-15, 15)
+            else:
+                x, y = back_xs[i - 8], att_y + self.rng.uniform(-15, 15)
+            self.state[index, COL_X] = self.state[index, COL_TARGET_X] = x
+            self.state[index, COL_Y] = self.state[index, COL_TARGET_Y] = y
+            self.players.append(PlayerState(self, index, p, team))
+        self.state[:, COL_SPEED] = player_step_speed(
+            [p.player.speed for p in self.players]
+        )
+
+        self.home_players = self.players[:num_home]
+        self.away_players = self.players[num_home:]
+        self._home_rows = slice(0, num_home)
+        self._away_rows = slice(num_home, num_players)
+        # Formation noise for every step, drawn up front: support x/y, defensive line y
+        self._formation_jitter = self.np_rng.uniform(
+            -1.0,
+            1.0,
+            (MATCH_DURATION_STEPS, 2 * IMMEDIATE_SUPPORT_PLAYERS + num_players),
+        )
+
+    def _kickoff(self):
+        """Set initial possession and ball position for kickoff."""
+        self.ball_x, self.ball_y = PITCH_CENTERX, PITCH_CENTERY
+        self.possession_team = self.rng.choice([self.home_team, self.away_team])
+        receiver = self._nearest_to_ball(self._team_rows(self.possession_team))
+        if not receiver:
+            return
+        self.ball_carrier = receiver
+        self._emit(
+            EVENT_KICKOFF,
+            self.possession_team,
+            f"Kick off! {self.possession_team.name} possession.",
+        )
+
+    # --- SIMULATION LOGIC ---
+
+    def _simulate_step(self):
+        """Simulate one dynamic step, timing each phase into self.stats if enabled."""
+        stats = self.stats or NULL_STEP_STATS
+        start = stats.begin()
+        if (
+            not self.ball_carrier or not self.possession_team
+        ):  # Handle loose ball pickup
+            nearest_player = self._nearest_to_ball()
+            start = stats.lap("loose_ball", start)
+            if not nearest_player:
+                stats.early_exit("loose_ball")
+                return
+            self.ball_carrier = nearest_player
+            self.possession_team = nearest_player.team
+
+        self._update_player_targets()  # Determine where everyone wants to go
+        start = stats.lap("targets", start)
+        self._move_players()  # Move everyone
+        if self.ball_carrier:  # Update ball position
+            self.ball_x, self.ball_y = self.ball_carrier.x, self.ball_carrier.y
+        start = stats.lap("movement", start)
+
+        # Check events in order of precedence
+        passed = self._check_passing_attempt()
+        start = stats.lap("passing", start)
+        if passed:
+            stats.early_exit("passing")
+            return
+        tackled = self._check_tackles()
+        start = stats.lap("tackles", start)
+        if tackled:
+            stats.early_exit("tackles")
+            return
+        penalty = self.rng.random() < BASE_PENALTY_CHANCE
+        if penalty:
+            penalty_team = (
+                self.away_team
+                if self.possession_team == self.home_team
+                else self.home_team
+            )
+            self.handle_penalty(penalty_team, "General infringement")
+        start = stats.lap("penalty", start)
+        if penalty:
+            stats.early_exit("penalty")
+            return
+        self._check_scoring()
+        stats.lap("scoring", start)
+
+    def _move_players(self):
+        """Move every player a step towards their target, clamped to the pitch."""
+        position = self.state[:, COL_X : COL_Y + 1]
+        delta = self.state[:, COL_TARGET_X : COL_TARGET_Y + 1] - position
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+        speed = self.state[:, COL_SPEED]
+        # Full step of `speed` along the way, or snap onto the target if it's closer
+        position += delta * (speed / np.maximum(distance, speed))[:, None]
+        # Clamp position to pitch bounds (loosely, allow slightly outside)
+        np.maximum(position, _POSITION_MIN, out=position)
+        np.minimum(position, _POSITION_MAX, out=position)
+        self._proximity = None
+
+    def _update_player_targets(self):
+        """Set each player's target from the game state (attack/defense formations)."""
+        if not self.ball_carrier or not self.possession_team:
+            return
+
+        state = self.state
+        carrier = self.ball_carrier
+        carrier_x, carrier_y = carrier.x, carrier.y
+        is_home_attacking = self.possession_team == self.home_team
+        attacking_rows = self._home_rows if is_home_attacking else self._away_rows
+        defending_rows = self._away_rows if is_home_attacking else self._home_rows
+        target_y_direction = 1 if is_home_attacking else -1  # Home attacks down (+Y)
+        jitter = self._formation_jitter[self.current_step % MATCH_DURATION_STEPS]
+
+        # --- Attacking Team Targets ---
+        # Players away from the ball hold their width and drift back towards play
+        general_target_y = carrier_y - target_y_direction * (SUPPORT_DISTANCE + 30)
+        state[attacking_rows, COL_TARGET_X] = state[attacking_rows, COL_X]
+        state[attacking_rows, COL_TARGET_Y] = (
+            state[attacking_rows, COL_Y] * 0.8 + general_target_y * 0.2
+        )
+
+        # Carrier: Move towards opponent try line
+        state[carrier.index, COL_TARGET_X] = carrier_x + self.rng.uniform(
+            -PITCH_WIDTH * 0.05, PITCH_WIDTH * 0.05
+        )
+        state[carrier.index, COL_TARGET_Y] = (
+            carrier_y + target_y_direction * PITCH_HEIGHT
+        )
+
+        # Immediate support: the nearest teammates spread out behind the carrier,
+        # alternating left/right
+        immediate = self.proximity.k_nearest(
+            carrier.index,
+            IMMEDIATE_SUPPORT_PLAYERS,
+            attacking_rows,
+            exclude=carrier.index,
+        )
+        count = len(immediate)
+        jitter_x = jitter[:count]
+        jitter_y = jitter[IMMEDIATE_SUPPORT_PLAYERS : IMMEDIATE_SUPPORT_PLAYERS + count]
+        state[immediate, COL_TARGET_X] = (
+            carrier_x + _SUPPORT_SLOT_OFFSETS[:count] + jitter_x * 10
+        )
+        state[immediate, COL_TARGET_Y] = (
+            carrier_y - target_y_direction * SUPPORT_DISTANCE + jitter_y * 5
+        )
+
+        # --- Defending Team Targets ---
+        # Defensive line sits slightly ahead of the carrier, but not offside
+        defensive_line_y = carrier_y - target_y_direction * DEFENSIVE_LINE_Y_OFFSET
+
+        # Home (Red) defends TOP, Away (Blue) defends BOTTOM
+        if is_home_attacking:  # Away team (Blue) is defending
+            defensive_line_y = max(defensive_line_y, carrier_y + PASS_Y_TOLERANCE)
+            defensive_line_y = min(
+                defensive_line_y, PITCH_BOTTOM - 10
+            )  # Don't sit on own line
+        else:  # Home team (Red) is defending
+            defensive_line_y = min(defensive_line_y, carrier_y - PASS_Y_TOLERANCE)
+            defensive_line_y = max(
+                defensive_line_y, PITCH_TOP + 10
+            )  # Don't sit on own line
+
+        # Sort defenders by their current X position to assign line spots
+        defenders = (
+            state[defending_rows, COL_X].argsort(kind="stable") + defending_rows.start
+        )
+        num_defenders = len(defenders)
+        line_center_x = carrier_x  # Line shifts horizontally with the carrier
+
+        # Keep the last (widest) defender back as sweeper if enough players
+        has_sweeper = num_defenders > 5
+        num_in_line = num_defenders - 1 if has_sweeper else num_defenders
+        line = defenders[:num_in_line]
+        line_jitter = jitter[
+            2 * IMMEDIATE_SUPPORT_PLAYERS : 2 * IMMEDIATE_SUPPORT_PLAYERS + num_in_line
+        ]
+        state[line, COL_TARGET_X] = (
+            line_center_x
+            + (np.arange(num_in_line) - num_in_line // 2) * DEFENSIVE_LINE_SPACING
+        )
+        state[line, COL_TARGET_Y] = (
+            defensive_line_y + line_jitter * 3
+        )  # Slight Y variation
+
+        if has_sweeper:
+            sweeper = defenders[num_in_line]
+            state[sweeper, COL_TARGET_X] = line_center_x
+            state[sweeper, COL_TARGET_Y] = (
+                defensive_line_y + target_y_direction * SWEEPER_DEPTH_OFFSET
+            )
+
+    # --- Event Handling Logic (Pass, Tackle, Penalty, Scoring) ---
+
+    def _check_passing_attempt(self) -> bool:
+        if not self.ball_carrier:
+            return False
+        carrier = self.ball_carrier
+        is_home_attacking = self.possession_team == self.home_team
+        attacking_rows = self._home_rows if is_home_attacking else self._away_rows
+        defending_rows = self._away_rows if is_home_attacking else self._home_rows
+        under_pressure = (
+            len(
+                self.proximity.within(
+                    carrier.index, PASS_PRESSURE_RADIUS, defending_rows
+                )
+            )
+            > 0
+        )
+        if self.rng.random() < self.tables.pass_attempt[under_pressure]:
+            target = self._find_pass_target(carrier, attacking_rows)
+            if target:
+                return self._execute_pass(carrier, target, defending_rows)
+        return False
+
+    def _find_pass_target(
+        self, carrier: PlayerState, teammate_rows
+    ) -> PlayerState | None:
+        """Nearest onside teammate within passing range, if any."""
+        candidates = self.proximity.within(
+            carrier.index, PASS_MAX_DISTANCE, teammate_rows
+        )
+        candidate_ys = self.state[candidates, COL_Y]
+        if carrier.team == self.home_team:
+            onside = candidate_ys >= carrier.y - PASS_Y_TOLERANCE
+        else:
+            onside = candidate_ys <= carrier.y + PASS_Y_TOLERANCE
+        candidates = candidates[onside & (candidates != carrier.index)]
+        if not len(candidates):
+            return None
+        target, _ = self.proximity.nearest(carrier.index, candidates)
+        return self.players[target]
+
+    def _execute_pass(
+        self, carrier: PlayerState, target: PlayerState, defending_rows
+    ) -> bool:
+        distance = self.proximity.distance(carrier.index, target.index)
+        success_chance = self.tables.pass_completion(carrier.player.passing, distance)
+        if self.rng.random() < success_chance:  # Successful Pass
+            self.ball_carrier = target
+            self._emit(EVENT_PASS, carrier.team, f"Pass to {target.player.name}")
+            return True
+
+        # Check Interception by each defender near the receiver
+        for index in self.proximity.within(
+            target.index, PASS_INTERCEPTION_RADIUS, defending_rows
+        ):
+            if self.rng.random() < PASS_INTERCEPTION_BASE_CHANCE:
+                defender = self.players[index]
+                self.ball_carrier = defender
+                self.possession_team = defender.team
+                self._emit(
+                    EVENT_INTERCEPTION,
+                    defender.team,
+                    f"INTERCEPTED by {defender.player.name}!",
+                )
+                return True
+        # Dropped Pass
+        self.ball_carrier = None
+        self.ball_x = target.x + self.rng.uniform(-5, 5)
+        self.ball_y = target.y + self.rng.uniform(-5, 5)
+        self._emit(EVENT_DROPPED_PASS, carrier.team, "Dropped pass!")
+        return True
+
+    def _check_tackles(self) -> bool:
+        if not self.ball_carrier:
+            return False
+        carrier = self.ball_carrier
+        defending_rows = (
+            self._away_rows
+            if self.possession_team == self.home_team
+            else self._home_rows
+        )
+        nearest, distance = self.proximity.nearest(carrier.index, defending_rows)
+        if (
+            nearest is None or distance >= TACKLE_RADIUS
+        ):  # Nobody close enough to make the tackle
+            return False
+        defender = self.players[nearest]
+        success_chance = self.tables.tackle_success(carrier.player, defender.player)
+        if self.rng.random() < success_chance:  # Successful Tackle
+            self._emit(
+                EVENT_TACKLE,
+                defender.team,
+                f"Tackle! {defender.player.name} stops {carrier.player.name}!",
+            )
+            if self.rng.random() < self.tables.penalty_at_tackle:  # Check Penalty
+                self.handle_penalty(
+                    defender.team, f"Infringement by {carrier.team.name} at tackle"
+                )
+            else:  # Process Turnover
+                self.possession_team = defender.team
+                self.ball_carrier = None
+                self.ball_x, self.ball_y = carrier.x, carrier.y
+            return True
+
+        # Broken Tackle
+        self._emit(
+            EVENT_BROKEN_TACKLE,
+            carrier.team,
+            f"{carrier.player.name} breaks the tackle from {defender.player.name}!",
+        )
+        knockback_factor = 0.3
+        defender.x += (defender.x - carrier.x) * knockback_factor
+        defender.y += (defender.y - carrier.y) * knockback_factor
+        return False
+
+    def handle_penalty(self, winning_team: Team, reason: str):
+        self._emit(
+            EVENT_PENALTY, winning_team, f"Penalty! {winning_team.name}. ({reason})"
+        )
+        self.possession_team = winning_team
+        self.ball_carrier = None
+        is_home_kicking = winning_team == self.home_team
+        kicker_candidates = self.home_players if is_home_kicking else self.away_players
+        if not kicker_candidates:
+            return
+        kicker = max(kicker_candidates, key=lambda p: p.player.kicking)
+        self.ball_x, self.ball_y = kicker.x, kicker.y
+        target_try_line_y = PITCH_BOTTOM if is_home_kicking else PITCH_TOP
+        dist_to_posts = abs(self.ball_y - target_try_line_y)
+        kick_range = PITCH_HEIGHT * 0.45
+        if dist_to_posts < kick_range:  # Attempt goal
+            if self.rng.random() < self.tables.penalty_goal[kicker.player.kicking]:
+                if is_home_kicking:
+                    self.home_score += PENALTY_POINTS
+                else:
+                    self.away_score += PENALTY_POINTS
+                self._emit(EVENT_PENALTY_GOAL, winning_team, "Penalty goal successful!")
+                self._reset_to_midfield(
+                    self.away_team if is_home_kicking else self.home_team
+                )
+            else:
+                self._emit(EVENT_PENALTY_MISS, winning_team, "Penalty kick missed.")
+                defending_team = self.away_team if is_home_kicking else self.home_team
+                dropout_y = (
+                    PITCH_TOP + PITCH_HEIGHT * 0.25
+                    if defending_team == self.home_team
+                    else PITCH_BOTTOM - PITCH_HEIGHT * 0.25
+                )
+                self.ball_x, self.ball_y = PITCH_CENTERX, dropout_y
+                self._reset_player_possession(defending_team)
+        else:  # Kick for touch
+            self._emit(EVENT_KICK_FOR_TOUCH, winning_team, "Penalty kicked for touch.")
+            move_direction = 1 if is_home_kicking else -1
+            self.ball_y += move_direction * PITCH_HEIGHT * 0.3
+            self.ball_y = max(PITCH_TOP + 10, min(self.ball_y, PITCH_BOTTOM - 10))
+            self._reset_player_possession(winning_team)
+
+    def _check_scoring(self):
+        if not self.ball_carrier:
+            return
+        carrier = self.ball_carrier
+        scoring_team = None
+        if self.possession_team == self.home_team and carrier.y >= PITCH_BOTTOM - 5:
+            scoring_team = self.home_team
+            self.home_score += TRY_POINTS
+        elif self.possession_team == self.away_team and carrier.y <= PITCH_TOP + 5:
+            scoring_team = self.away_team
+            self.away_score += TRY_POINTS
+        if not scoring_team:
+            return
+
+        self._emit(EVENT_TRY, scoring_team, f"TRY! {scoring_team.name}!")
+        self.ball_carrier = None
+        self.ball_x, self.ball_y = None, None
+        kicker_candidates = (
+            self.home_players if scoring_team == self.home_team else self.away_players
+        )
+        if not kicker_candidates:
+            return
+        kicker = max(kicker_candidates, key=lambda p: p.player.kicking)
+        if self.rng.random() < self.tables.conversion[kicker.player.kicking]:
+            if scoring_team == self.home_team:
+                self.home_score += CONVERSION_POINTS
+            else:
+                self.away_score += CONVERSION_POINTS
+            self._emit(EVENT_CONVERSION, scoring_team, "Conversion successful!")
+        else:
+            self._emit(EVENT_CONVERSION_MISS, scoring_team, "Conversion missed.")
+        restart_team = (
+            self.away_team if scoring_team == self.home_team else self.home_team
+        )
+        self._reset_to_midfield(restart_team)
+
+    def _reset_to_midfield(self, possession_team: Team):
+        self.ball_x, self.ball_y = PITCH_CENTERX, PITCH_CENTERY
+        self._reset_player_possession(possession_team)
+
+    def _reset_player_possession(self, possession_team: Team):
+        self.possession_team = possession_team
+        self.ball_carrier = None
+        receiver = self._nearest_to_ball(self._team_rows(possession_team))
+        if not receiver:
+            return
+        self.ball_carrier = receiver
+        self._emit(
+            EVENT_POSSESSION, possession_team, f"{possession_team.name} possession."
+        )
+
+
+def simulate_dynamic_match(home_team, away_team, rng=None):
+    """Runs a full dynamic match headlessly, like match_engine.simulate_match."""
+    return DynamicMatchEngine(home_team, away_team, rng=rng).run()
@@ -1,28 +1,128 @@
 # game_state.py
+import queue
+import random
+import threading
 from team import create_initial_teams
-from league import League
+from sim_constants import LEAGUE_SIZE, DIVISION_SIZE
+from league import LeagueSystem
+from seeding import RandomContext
+from player import PlayerStore
+from replay import record_match
 
 # Keep simulate_match import if you want play_next_match for other purposes later
 from match_engine import simulate_match
 
 
+class MatchdaySimulation:
+    """
+    Simulates fixtures on a worker thread (e.g. the rest of a matchday while one match
+    is watched) and queues their results. Each fixture brings its own rng, so the
+    results don't depend on timing or order.
+    """
+
+    def __init__(self, fixtures, match_simulator=simulate_match):
+        # fixtures: [(fixture_index, home_team, away_team, rng)]
+        self.fixtures = list(fixtures)
+        self.results = (
+            queue.Queue()
+        )  # (fixture_index, home_score, away_score), as they finish
+        self._thread = threading.Thread(
+            target=self._run, args=(match_simulator,), daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, match_simulator):
+        for fixture_index, home_team, away_team, rng in self.fixtures:
+            home_score, away_score = match_simulator(home_team, away_team, rng=rng)
+            self.results.put((fixture_index, home_score, away_score))
+
+    def is_done(self):
+        return not self._thread.is_alive()
+
+    def collect(self):
+        """Waits for the worker to finish and returns every result."""
+        self._thread.join()
+        results = []
+        while not self.results.empty():
+            results.append(self.results.get())
+        return results
+
+
 class Game:
     """Holds the overall game state and logic."""
 
-    def __init__(self):
-        self.teams = create_initial_teams(num_teams=6)  # Create 6 teams
+    def __init__(self, seed=None, num_teams=LEAGUE_SIZE, division_size=DIVISION_SIZE):
+        # Every random draw in the season derives from this seed (see match_rng)
+        self.random = RandomContext(seed)
+        self.seed = self.random.seed
+        self.player_store = (
+            PlayerStore()
+        )  # Columnar storage for every player in the game
+        self.all_teams = create_initial_teams(
+            num_teams, rng=self.random.stream("teams"), store=self.player_store
+        )
         self.player_team = next(
-            (team for team in self.teams if team.player_controlled), None
+            (team for team in self.all_teams if team.player_controlled), None
         )  # Safer find
         if (
-            not self.player_team and self.teams
+            not self.player_team and self.all_teams
         ):  # Assign first team if player_controlled fails
-            self.player_team = self.teams[0]
+            self.player_team = self.all_teams[0]
             self.player_team.player_controlled = True
 
-        self.league = League(self.teams)
+        # Divisions of division_size teams (one by default); the player's is self.league
+        self.league_system = LeagueSystem(
+            self.all_teams, division_size, rng=self.random.stream("fixtures")
+        )
+        self.league = self._player_division()
         self.current_fixture_index = 0
         self.last_match_result = None
+        self.last_fixture_index = None  # Fixture last_match_result belongs to
+        self.background_matchday = (
+            None  # MatchdaySimulation of the fixtures not being watched
+        )
+        # {fixture_index: MatchReplay} for matches played with play_next_match_recorded
+        self.replays = {}
+
+    @classmethod
+    def from_parts(
+        cls,
+        random_context,
+        seed,
+        player_store,
+        all_teams,
+        player_team,
+        league_system,
+        current_fixture_index=0,
+        last_match_result=None,
+        last_fixture_index=None,
+    ):
+        """Reassembles a Game from its saved pieces (see snapshot.load_game)."""
+        game = cls.__new__(cls)
+        game.random = random_context
+        game.seed = seed
+        game.player_store = player_store
+        game.all_teams = all_teams
+        game.player_team = player_team
+        game.league_system = league_system
+        game.league = game._player_division()
+        game.current_fixture_index = current_fixture_index
+        game.last_match_result = last_match_result
+        game.last_fixture_index = last_fixture_index
+        game.background_matchday = None
+        game.replays = {}
+        return game
+
+    @property
+    def teams(self):
+        """Teams in the player's division."""
+        return self.league.teams
+
+    def _player_division(self):
+        """The player's team's division (the one shown and played in the UI)."""
+        return self.league_system.divisions[
+            self.league_system.division_of(self.player_team)
+        ]
 
     def get_next_fixture(self):
         """Returns the next fixture tuple (home_team, away_team) or None if finished."""
@@ -30,18 +130,116 @@ class Game:
             return self.league.fixtures[self.current_fixture_index]
         return None
 
+    def last_fixture(self):
+        """The fixture last_match_result belongs to, or None."""
+        if self.last_match_result is None:
+            return None
+        return self.league.fixtures[self.last_fixture_index]
+
+    def next_matchday(self):
+        """
+        (watched fixture index, other fixture indices) of the next matchday's unplayed
+        fixtures. The player's team's fixture is the one to watch (the first one if they
+        have a bye). Returns (None, []) at the end of the season.
+        """
+        if self.is_season_over():
+            return None, []
+        indices = [
+            index
+            for index in self.league.matchday_fixture_indices(
+                self.current_fixture_index
+            )
+            if index >= self.current_fixture_index
+            and not self.league.results_store.has_fixture(index)
+        ]
+        watched = next(
+            (
+                index
+                for index in indices
+                if self.player_team in self.league.fixtures[index]
+            ),
+            indices[0],
+        )
+        return watched, [index for index in indices if index != watched]
+
+    def start_background_matchday(
+        self, fixture_indices, match_simulator=simulate_match
+    ):
+        """Simulates fixture_indices on a worker thread (see finish_matchday)."""
+        self.background_matchday = MatchdaySimulation(
+            [
+                (index, *self.league.fixtures[index], self.match_rng(index))
+                for index in fixture_indices
+            ],
+            match_simulator,
+        )
+        return self.background_matchday
+
+    def finish_matchday(self, fixture_index, home_score, away_score):
+        """
+        Records the watched fixture's result, applies the background results (waiting
+        for any still running) and moves on to the next matchday.
+        """
+        results = [(fixture_index, home_score, away_score)]
+        if self.background_matchday is not None:
+            results += self.background_matchday.collect()
+            self.background_matchday = None
+        for index, result_home, result_away in sorted(results):
+            home_team, away_team = self.league.fixtures[index]
+            self.league.update_table(
+                home_team, away_team, result_home, result_away, fixture_index=index
+            )
+        self.last_match_result = (home_score, away_score)
+        self.last_fixture_index = fixture_index
+        matchday = self.league.matchday_fixture_indices(fixture_index)
+        self.current_fixture_index = max(self.current_fixture_index, matchday[-1] + 1)
+        return results
+
+    def match_rng(self, fixture_index=None):
+        """RNG for a fixture (default: the next), seeded by (season seed, fixture)."""
+        if fixture_index is None:
+            fixture_index = self.current_fixture_index
+        return self.random.match_rng(fixture_index)
+
+    def fixture_seed(self, division_index, fixture_index):
+        """
+        Seed of a fixture's rng in any division: match_rng's stream for the player's
+        division, a per-division stream for the others (as start_next_season plays
+        them).
+        """
+        if self.league_system.divisions[division_index] is self.league:
+            return self.random.derive_seed("match", fixture_index)
+        return self.random.derive_seed(
+            "division", division_index, "match", fixture_index
+        )
+
+    def fixture_rng(self, division_index, fixture_index):
+        return random.Random(self.fixture_seed(division_index, fixture_index))
+
     # This function is NO LONGER CALLED by the main "Next Match" button click
     # It instantly simulates a match without graphics. Keep for potential future use.
-    def play_next_match_instant(self):
-        """Simulates the next match instantly, updates table, and advances index."""
+    def play_next_match_instant(self, match_simulator=simulate_match):
+        """
+        Simulates the next match instantly, updates table, and advances index.
+        match_simulator can be swapped for dynamic_engine.simulate_dynamic_match. Both
+        take the fixture's rng, so replaying a season with the same seed gives the same
+        results.
+        """
         fixture = self.get_next_fixture()
         if fixture:
             home_team, away_team = fixture
-            home_score, away_score = simulate_match(
-                home_team, away_team
-            )  # Uses the original engine
-            self.league.update_table(home_team, away_team, home_score, away_score)
+            home_score, away_score = match_simulator(
+                home_team, away_team, rng=self.match_rng()
+            )
+            self.league.update_table(
+                home_team,
+                away_team,
+                home_score,
+                away_score,
+                fixture_index=self.current_fixture_index,
+            )
             self.last_match_result = (home_score, away_score)
+            self.last_fixture_index = self.current_fixture_index
             self.current_fixture_index += 1
             print(
                 f"Instant Sim: {home_team.name} {home_score} - {away_score} {away_team.name}"
@@ -52,6 +250,63 @@ class Game:
             self.last_match_result = None
             return False  # No more matches
 
+    def play_next_match_recorded(self):
+        """
+        Plays the next match headlessly on the dynamic engine and keeps its replay in
+        self.replays, so it can be watched later (MatchView(..., replay=...)) without
+        re-simulating.
+        """
+        return self.play_next_match_instant(self._record_next_match)
+
+    def _record_next_match(self, home_team, away_team, rng=None):
+        replay = record_match(home_team, away_team, rng=rng)
+        self.replays[self.current_fixture_index] = replay
+        return replay.home_score, replay.away_score
+
+    def project_season(self, n_runs=10000, workers=1, seed=None):
+        """
+        Monte Carlo projection of the remaining fixtures from the current table.
+        seed defaults to one derived from the season seed and the current fixture index.
+        """
+        if seed is None:
+            seed = self.random.derive_seed("projection", self.current_fixture_index)
+        return self.league.project_season(
+            n_runs, workers, start_fixture=self.current_fixture_index, seed=seed
+        )
+
+    def start_next_season(self, match_simulator=simulate_match):
+        """
+        Finishes the other divisions' fixtures headlessly, applies promotion and
+        relegation and starts a new season (with its own seed derived from this one).
+        Returns the moves made. The player's division must have played all its fixtures
+        (see is_season_over).
+        """
+        if not self.is_season_over():
+            left = len(self.league.fixtures) - self.current_fixture_index
+            raise ValueError(f"The season isn't over: {left} fixtures left to play")
+        for division_index, division in enumerate(self.league_system.divisions):
+            if division is self.league:
+                continue
+            for fixture_index, (home_team, away_team) in enumerate(division.fixtures):
+                if division.results_store.has_fixture(fixture_index):
+                    continue
+                rng = self.fixture_rng(division_index, fixture_index)
+                home_score, away_score = match_simulator(home_team, away_team, rng=rng)
+                division.update_table(
+                    home_team, away_team, home_score, away_score, fixture_index
+                )
+
+        self.random = RandomContext(self.random.derive_seed("next_season"))
+        moves = self.league_system.promote_and_relegate(
+            rng=self.random.stream("fixtures")
+        )
+        self.league = self._player_division()
+        self.current_fixture_index = 0
+        self.last_match_result = None
+        self.last_fixture_index = None
+        self.replays = {}
+        return moves
+
     def is_season_over(self):
         """Checks if all fixtures have been played."""
         return self.current_fixture_index >= len(self.league.fixtures)
@@ -1,18 +1,47 @@
+import bisect
 import itertools
 import random
-from constants import POINTS_FOR_WIN, POINTS_FOR_DRAW, POINTS_FOR_LOSS
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from sim_constants import (
+    POINTS_FOR_WIN,
+    POINTS_FOR_DRAW,
+    POINTS_FOR_LOSS,
+    PROMOTION_PLACES,
+)
+from match_engine import RATING_KEYS, get_params, simulate_matches_batch
+from results import ResultsStore
+
+# Number of season runs simulated together in one vectorized batch
+PROJECTION_BATCH_RUNS = 2000
+# Cap on runs x remaining fixtures per batch: bounds a batch's memory in big leagues
+PROJECTION_BATCH_MATCHES = 200_000
 
 
 class League:
     """Manages the league table and fixtures."""
 
-    def __init__(self, teams):
+    def __init__(self, teams, rng=random, fixtures=None):
         self.teams = teams
         self.fixtures = []  # List of tuples: (home_team, away_team)
-        self.results = {}  # Stores results: {(home, away): (home_score, away_score)}
+        self.team_ids = {
+            team.name: i for i, team in enumerate(teams)
+        }  # Ids used by results_store
+        self.results_store = (
+            ResultsStore()
+        )  # Every result, indexed per team and per pairing
         self.table = {}  # {team_name: {'P': 0, 'W': 0, 'D': 0, 'L': 0, 'PF': 0, 'PA': 0, 'PD': 0, 'Pts': 0}}
+        self.standings = []  # Team names in table order, kept sorted as results come in
+        self.table_version = (
+            0  # Bumped on every table change, so renderers can skip redraws
+        )
+        self._sorted_table = None  # (table_version, get_sorted_table() result)
         self._initialize_table()
-        self.generate_fixtures()
+        if fixtures is None:
+            self.generate_fixtures(rng)
+        else:  # Restoring a saved league: keep its fixture order
+            self.fixtures = list(fixtures)
+            self._index_fixtures()
 
     def _initialize_table(self):
         """Sets up the initial empty league table."""
@@ -27,16 +56,117 @@ class League:
                 "PD": 0,
                 "Pts": 0,
             }
+        self._rebuild_standings()
+
+    @property
+    def results(self):
+        """
+        Results as {(home, away): (home_score, away_score)}, built on demand from
+        results_store.
+        """
+        rows = self.results_store.rows.tolist()
+        return {
+            (self.teams[home], self.teams[away]): (home_score, away_score)
+            for _, home, away, home_score, away_score, _ in rows
+        }
+
+    @property
+    def matches_per_matchday(self):
+        return max(1, len(self.teams) // 2)
+
+    def matchday(self, fixture_index):
+        """Matchday (round) a fixture belongs to, counting from 1."""
+        return fixture_index // self.matches_per_matchday + 1
+
+    def fixture_index(self, home_team, away_team):
+        """Position of a fixture in self.fixtures (-1 if it isn't one)."""
+        return self._fixture_ids.get((home_team.name, away_team.name), -1)
+
+    def _index_fixtures(self):
+        self._fixture_ids = {
+            (home.name, away.name): i for i, (home, away) in enumerate(self.fixtures)
+        }
+
+    # --- Results queries (O(results of the teams involved)) ---
+    def form(self, team, last=5):
+        """The team's last results as "W"/"D"/"L", oldest first."""
+        return self.results_store.form(self.team_ids[team.name], last)
+
+    def head_to_head(self, team, opponent):
+        """Record of team against opponent this season (played, W, D, L, PF, PA)."""
+        return self.results_store.head_to_head(
+            self.team_ids[team.name], self.team_ids[opponent.name]
+        )
+
+    def points_history(self, team):
+        """(matchdays, cumulative points) after each of the team's results."""
+        return self.results_store.points_history(self.team_ids[team.name])
 
-    def generate_fixtures(self):
-        """Generates a simple round-robin fixture list (each team plays each other once)."""
-        self.fixtures = list(itertools.combinations(self.teams, 2))
-        random.shuffle(self.fixtures)  # Randomize match order
-        # Could expand this later for home/away
+    def _standing_key(self, team_name):
+        """Standings sort key: Points (desc), Point Difference (desc), table order."""
+        stats = self.table[team_name]
+        return (-stats["Pts"], -stats["PD"], self._table_order[team_name])
 
-    def update_table(self, home_team, away_team, home_score, away_score):
+    def _rebuild_standings(self):
+        """Re-sorts the standings from scratch (after the table is replaced)."""
+        self._table_order = {name: i for i, name in enumerate(self.table)}
+        self.standings = sorted(self.table, key=self._standing_key)
+        self.table_version += 1
+
+    def generate_fixtures(self, rng=random):
+        """
+        Generates a round-robin fixture list (each team plays each other once), grouped
+        into matchdays of matches_per_matchday fixtures in which no team plays twice
+        (circle method).
+        """
+        teams = list(self.teams)
+        rng.shuffle(teams)
+        if len(teams) % 2:
+            teams.append(
+                None
+            )  # Odd team count: whoever meets None has a bye that round
+        rounds = []
+        for round_number in range(len(teams) - 1):
+            pairs = [(teams[i], teams[-1 - i]) for i in range(len(teams) // 2)]
+            if round_number % 2:  # The fixed team alternates home and away
+                pairs[0] = pairs[0][::-1]
+            rounds.append([pair for pair in pairs if None not in pair])
+            teams.insert(1, teams.pop())  # Rotate everyone but the first team
+        rng.shuffle(rounds)  # Randomize matchday order
+        self.fixtures = []
+        for matches in rounds:
+            rng.shuffle(matches)
+            self.fixtures.extend(matches)
+        self._index_fixtures()
+
+    def matchday_fixture_indices(self, fixture_index):
+        """Indices of every fixture on the same matchday as fixture_index."""
+        start = fixture_index - fixture_index % self.matches_per_matchday
+        return list(
+            range(start, min(start + self.matches_per_matchday, len(self.fixtures)))
+        )
+
+    def update_table(
+        self, home_team, away_team, home_score, away_score, fixture_index=None
+    ):
         """Updates the league table based on a match result."""
-        self.results[(home_team, away_team)] = (home_score, away_score)
+        if fixture_index is None:
+            fixture_index = self.fixture_index(home_team, away_team)
+        self.results_store.append(
+            fixture_index,
+            self.team_ids[home_team.name],
+            self.team_ids[away_team.name],
+            home_score,
+            away_score,
+            self.matchday(fixture_index) if fixture_index >= 0 else 0,
+        )
+
+        # Take both teams out of the standings while their keys still match their spots
+        for team in (home_team, away_team):
+            index = bisect.bisect_left(
+                self.standings, self._standing_key(team.name), key=self._standing_key
+            )
+            del self.standings[index]
 
         # Update stats for both teams
         for team, score, opponent_score in [
@@ -60,10 +190,247 @@ class League:
                 stats["Pts"] += POINTS_FOR_DRAW
             # Add logic for bonus points here if needed later
 
+        # Re-insert them at their new positions
+        for team in (home_team, away_team):
+            bisect.insort(self.standings, team.name, key=self._standing_key)
+        self.table_version += 1
+
     def get_sorted_table(self):
-        """Returns the table sorted by Points (desc), then Point Difference (desc)."""
-        # Convert dict to list of tuples for sorting
-        table_list = [(team_name, stats) for team_name, stats in self.table.items()]
-        # Sort: Primary key = Points (desc), Secondary key = Point Difference (desc)
-        table_list.sort(key=lambda item: (item[1]["Pts"], item[1]["PD"]), reverse=True)
-        return table_list
+        """
+        Returns the table sorted by Points (desc), then Point Difference (desc). Teams
+        still level are separated by head-to-head points between them, then Points For.
+        """
+        if self._sorted_table is None or self._sorted_table[0] != self.table_version:
+            table_list = [
+                (team_name, self.table[team_name])
+                for team_name in self._break_ties(self.standings)
+            ]
+            self._sorted_table = (self.table_version, table_list)
+        return self._sorted_table[1]
+
+    def _break_ties(self, standings):
+        """Reorders runs of teams level on Points and Point Difference by results."""
+        ordered = []
+        for _, group in itertools.groupby(
+            standings,
+            key=lambda name: (self.table[name]["Pts"], self.table[name]["PD"]),
+        ):
+            group = list(group)
+            if len(group) > 1 and self.results_store.size:
+                mini_league = self.results_store.mini_league_points(
+                    [self.team_ids[name] for name in group]
+                )
+                group.sort(
+                    key=lambda name: (
+                        -mini_league[self.team_ids[name]],
+                        -self.table[name]["PF"],
+                        self._table_order[name],
+                    )
+                )
+            ordered.extend(group)
+        return ordered
+
+    def project_season(self, n_runs=10000, workers=1, start_fixture=None, seed=None):
+        """
+        Monte Carlo projection of the rest of the season with the instant engine.
+        Simulates the fixtures not yet in results_store (from start_fixture on, if
+        given) n_runs times, starting from the current table. Runs are split across a
+        process pool with independent RNG streams. Simulated tables are ranked by Pts
+        then PD only: teams still level keep their current table order instead of going
+        through get_sorted_table's head-to-head and points-for tie-breaks, which don't
+        vectorize across runs. Returns {team_name: {"positions": [p(1st), p(2nd), ...],
+        "expected_points": float}}.
+        """
+        team_names = list(self.table.keys())
+        team_index = {name: i for i, name in enumerate(team_names)}
+        points = np.array(
+            [self.table[name]["Pts"] for name in team_names], dtype=np.int64
+        )
+        point_diff = np.array(
+            [self.table[name]["PD"] for name in team_names], dtype=np.int64
+        )
+        ratings = np.zeros((len(team_names), len(RATING_KEYS)))
+        for team in self.teams:
+            ratings[team_index[team.name]] = team.get_rating_vector()
+        remaining = [
+            fixture
+            for fixture_index, fixture in enumerate(self.fixtures)
+            if fixture_index >= (start_fixture or 0)
+            and not self.results_store.has_fixture(fixture_index)
+        ]
+        home_idx = np.array(
+            [team_index[home.name] for home, _ in remaining], dtype=np.int64
+        )
+        away_idx = np.array(
+            [team_index[away.name] for _, away in remaining], dtype=np.int64
+        )
+
+        # Split runs into one chunk per worker, each with its own RNG stream
+        workers = max(1, workers or 1)
+        chunk_sizes = [
+            n_runs // workers + (1 if i < n_runs % workers else 0)
+            for i in range(workers)
+        ]
+        chunk_sizes = [size for size in chunk_sizes if size > 0]
+        streams = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+        params = (
+            get_params()
+        )  # Workers use this process's tuning (e.g. after match_engine.load_params)
+        jobs = [
+            (size, stream, points, point_diff, ratings, home_idx, away_idx, params)
+            for size, stream in zip(chunk_sizes, streams)
+        ]
+        if len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=len(jobs)) as pool:
+                partials = list(pool.map(_project_season_chunk, jobs))
+        else:
+            partials = [_project_season_chunk(job) for job in jobs]
+
+        # Merge worker results (zero runs leave both at zero)
+        num_teams = len(team_names)
+        position_counts = sum(
+            (counts for counts, _ in partials),
+            np.zeros((num_teams, num_teams), dtype=np.int64),
+        )
+        points_total = sum((total for _, total in partials), np.zeros(num_teams))
+        return {
+            name: {
+                "positions": (position_counts[i] / max(1, n_runs)).tolist(),
+                "expected_points": float(points_total[i] / max(1, n_runs)),
+            }
+            for i, name in enumerate(team_names)
+        }
+
+
+class LeagueSystem:
+    """
+    Teams split into divisions (one League each, best division first), with promotion
+    and relegation between neighbouring divisions at the end of every season.
+    """
+
+    def __init__(
+        self, teams, division_size=None, promotion_places=PROMOTION_PLACES, rng=random
+    ):
+        division_size = division_size or len(teams) or 1
+        self.promotion_places = promotion_places
+        self.season = 1
+        self.divisions = [
+            League(teams[start : start + division_size], rng)
+            for start in range(0, len(teams), division_size)
+        ]
+
+    @classmethod
+    def from_divisions(cls, divisions, promotion_places=PROMOTION_PLACES, season=1):
+        """Rebuilds a system from existing Leagues (e.g. when loading a snapshot)."""
+        system = cls([], promotion_places=promotion_places)
+        system.divisions = list(divisions)
+        system.season = season
+        return system
+
+    @property
+    def teams(self):
+        return [team for division in self.divisions for team in division.teams]
+
+    def division_of(self, team):
+        """Index of the division a team currently plays in (or None)."""
+        for index, division in enumerate(self.divisions):
+            if team in division.teams:
+                return index
+        return None
+
+    def promote_and_relegate(self, rng=random):
+        """
+        Ends the season: the bottom teams of each division swap with the top teams of
+        the one below, and every division starts afresh with new fixtures. Returns
+        [(upper division index, promoted team names, relegated team names), ...].
+        """
+        ranked = []
+        for division in self.divisions:
+            teams_by_name = {team.name: team for team in division.teams}
+            ranked.append(
+                [teams_by_name[name] for name, _ in division.get_sorted_table()]
+            )
+
+        moves = []
+        for upper in range(len(ranked) - 1):
+            lower = upper + 1
+            places = min(self.promotion_places, len(ranked[upper]), len(ranked[lower]))
+            if places <= 0:
+                continue
+            relegated = ranked[upper][-places:]
+            promoted = ranked[lower][:places]
+            ranked[upper] = ranked[upper][:-places] + promoted
+            ranked[lower] = relegated + ranked[lower][places:]
+            moves.append(
+                (upper, [t.name for t in promoted], [t.name for t in relegated])
+            )
+
+        self.divisions = [League(teams, rng) for teams in ranked]
+        self.season += 1
+        return moves
+
+
+def _project_season_chunk(job):
+    """
+    Worker for League.project_season: simulates `n_runs` seasons.
+    Returns (position counts, points sums).
+    """
+    n_runs, seed_seq, points, point_diff, ratings, home_idx, away_idx, params = job
+    rng = np.random.default_rng(seed_seq)
+    num_teams = len(points)
+    num_fixtures = len(home_idx)
+    position_counts = np.zeros((num_teams, num_teams), dtype=np.int64)
+    points_total = np.zeros(num_teams, dtype=np.float64)
+    team_order = np.arange(num_teams)
+
+    done = 0
+    while done < n_runs:
+        runs = min(
+            PROJECTION_BATCH_RUNS,
+            PROJECTION_BATCH_MATCHES // max(1, num_fixtures),
+            n_runs - done,
+        )
+        runs = max(1, runs)
+        done += runs
+        season_points = np.tile(points, (runs, 1))
+        season_diff = np.tile(point_diff, (runs, 1))
+        if num_fixtures:
+            # (runs, num_fixtures) scores; fixture ratings are broadcast, not copied
+            home_scores, away_scores = simulate_matches_batch(
+                ratings[home_idx],
+                ratings[away_idx],
+                n=(runs, num_fixtures),
+                rng=rng,
+                params=params,
+            )
+            home_points = np.where(
+                home_scores > away_scores,
+                POINTS_FOR_WIN,
+                np.where(home_scores < away_scores, POINTS_FOR_LOSS, POINTS_FOR_DRAW),
+            )
+            away_points = np.where(
+                away_scores > home_scores,
+                POINTS_FOR_WIN,
+                np.where(away_scores < home_scores, POINTS_FOR_LOSS, POINTS_FOR_DRAW),
+            )
+            # Accumulate per team (a team can appear in several fixtures per run)
+            every_run = slice(None)
+            np.add.at(season_points, (every_run, home_idx), home_points)
+            np.add.at(season_points, (every_run, away_idx), away_points)
+            margin = home_scores - away_scores
+            np.add.at(season_diff, (every_run, home_idx), margin)
+            np.add.at(season_diff, (every_run, away_idx), -margin)
+
+        # Rank by Pts, then PD (unlike get_sorted_table, ties keep table order)
+        order = np.lexsort(
+            (
+                np.broadcast_to(team_order, season_points.shape),
+                -season_diff,
+                -season_points,
+            ),
+            axis=1,
+        )
+        np.add.at(position_counts, (order.ravel(), np.tile(team_order, runs)), 1)
+        points_total += season_points.sum(axis=0)
+
+    return position_counts, points_total
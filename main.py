@@ -3,12 +3,35 @@ import pygame
 import sys
 from constants import *  # Import all constants
 from game_state import Game
-from ui import draw_text, draw_league_table, draw_button, draw_fixture, draw_player_list
+from ui import (
+    draw_text,
+    draw_league_table,
+    draw_button,
+    draw_fixture,
+    draw_player_list,
+    get_static_surface,
+)
 from match_view import MatchView  # Import the new dynamic match view class
 
 # Ensure simulate_match is imported if used by skip logic or other parts
 from match_engine import simulate_match
 
+# Window events after which the whole screen must be repainted (not just dirty rects)
+EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED)
+
+
+def paint_league_chrome(surface):
+    """Paints the static parts of the league screen (background and title)."""
+    surface.fill(WHITE)
+    draw_text(
+        surface,
+        "Rugby Manager - League",
+        (SCREEN_WIDTH // 2, 30),
+        FONT_DEFAULT,
+        BLACK,
+        center=True,
+    )
+
 
 def main():
     pygame.init()
@@ -21,6 +44,7 @@ def main():
     current_view = VIEW_LEAGUE  # Start with the league view
     viewed_team_index = 0  # Index of the team being viewed in player list
     active_match_view = None  # Variable to hold the current MatchView instance
+    watched_fixture_index = None  # Fixture shown in active_match_view
 
     # --- UI Element Rects ---
     # League View Buttons
@@ -63,26 +87,25 @@ def main():
         This function is called by MatchView when the simulation ends.
         It updates the game state (league table, fixture index) and switches back to League View.
         """
-        nonlocal current_view, active_match_view  # Allow modification of outer scope variables
+        # Allow modification of outer scope variables
+        nonlocal current_view, active_match_view, watched_fixture_index
         print("Match finished callback received.")
-        if game.current_fixture_index < len(game.league.fixtures):
-            # Get the fixture that just finished
-            home_team, away_team = game.league.fixtures[game.current_fixture_index]
-            # Update the league table with the result
-            game.league.update_table(home_team, away_team, home_score, away_score)
-            game.last_match_result = (
-                home_score,
-                away_score,
-            )  # Store result for display
-            game.current_fixture_index += 1  # Advance to the next fixture index
+        if watched_fixture_index is not None:
+            # Record the watched result plus the rest of the matchday, simulated in the
+            # background during the match (waits only if the worker is still going)
+            home_team, away_team = game.league.fixtures[watched_fixture_index]
+            results = game.finish_matchday(
+                watched_fixture_index, home_score, away_score
+            )
+            watched_fixture_index = None
             print(
-                f"Table updated for {home_team.name} vs {away_team.name}. Next fixture index: {game.current_fixture_index}"
+                f"Table updated for {home_team.name} vs {away_team.name} "
+                f"and {len(results) - 1} other fixture(s). "
+                f"Next fixture index: {game.current_fixture_index}"
             )
         else:
             # This case should ideally not happen if logic is correct
-            print(
-                "Error: Match finished but no more fixtures were expected based on current_fixture_index."
-            )
+            print("Error: Match finished but no fixture was being watched.")
 
         active_match_view = None  # Clear the finished match view instance
         current_view = VIEW_LEAGUE  # Return to league view
@@ -116,6 +139,11 @@ def main():
                     pygame.USEREVENT + 1, 0
                 )  # Important: Disable the timer after it fires once
 
+            # --- Uncovered/restored window: repaint the whole next match frame ---
+            view_is_match = current_view == VIEW_MATCH and active_match_view
+            if event.type in EXPOSE_EVENTS and view_is_match:
+                active_match_view.invalidate()
+
             # --- Pass input events to the active match view if it exists ---
             if current_view == VIEW_MATCH and active_match_view:
                 # MatchView might handle specific inputs like skipping
@@ -131,13 +159,23 @@ def main():
                     and not game.is_season_over()
                 ):
                     # --- Start the graphical match simulation ---
-                    next_fixture_teams = game.get_next_fixture()
-                    if next_fixture_teams:
-                        home_team, away_team = next_fixture_teams
+                    # The player's fixture is watched; the rest of the matchday runs
+                    # on a worker thread
+                    watched_fixture_index, other_fixtures = game.next_matchday()
+                    if watched_fixture_index is not None:
+                        home_team, away_team = game.league.fixtures[
+                            watched_fixture_index
+                        ]
+                        game.start_background_matchday(other_fixtures)
                         # Create a new MatchView instance for this fixture
                         # Pass the screen, teams, and the callback function
+                        # The fixture's own RNG stream keeps the season reproducible
                         active_match_view = MatchView(
-                            screen, home_team, away_team, handle_match_finished
+                            screen,
+                            home_team,
+                            away_team,
+                            handle_match_finished,
+                            rng=game.match_rng(watched_fixture_index),
                         )
                         current_view = (
                             VIEW_MATCH  # Switch the game state to the match view
@@ -189,36 +227,31 @@ def main():
             active_match_view.update()  # This runs the simulation step
 
         # --- Drawing ---
-        screen.fill(WHITE)  # Clear the screen at the start of each frame
-
+        dirty_rects = None  # None means the whole screen is flipped
         # --- Draw based on the Current View ---
         if current_view == VIEW_LEAGUE:
-            # Draw Title
-            draw_text(
-                screen,
-                "Rugby Manager - League",
-                (SCREEN_WIDTH // 2, 30),
-                FONT_DEFAULT,
-                BLACK,
-                center=True,
+            # Background and title never change: blit them from a cached surface
+            screen.blit(
+                get_static_surface(
+                    "league_chrome", screen.get_size(), paint_league_chrome, screen
+                ),
+                (0, 0),
             )
             # Draw League Table
             draw_league_table(screen, game.league, (50, 80))  # Position table
             # Draw Next Fixture / Last Result section
             fixture_y_pos = SCREEN_HEIGHT - 100  # Position above buttons
-            next_fixture = game.get_next_fixture()
+            next_watched_index, _ = game.next_matchday()
             current_result = None
             fixture_to_display = None
             # Display result of the last completed match
             if game.last_match_result and game.current_fixture_index > 0:
                 # Get the fixture corresponding to the last result
-                fixture_to_display = game.league.fixtures[
-                    game.current_fixture_index - 1
-                ]
+                fixture_to_display = game.last_fixture()
                 current_result = game.last_match_result
             # Or display the upcoming fixture if no result to show / before first match
-            elif next_fixture:
-                fixture_to_display = next_fixture
+            elif next_watched_index is not None:
+                fixture_to_display = game.league.fixtures[next_watched_index]
             # Draw the fixture/result text if available
             if fixture_to_display:
                 draw_fixture(
@@ -240,6 +273,7 @@ def main():
             draw_button(screen, view_squad_button_rect, "View Squad")
 
         elif current_view == VIEW_PLAYERS:
+            screen.fill(WHITE)  # Clear the screen
             # Draw Player List View
             team_to_display = None
             if 0 <= viewed_team_index < len(game.teams):
@@ -254,10 +288,14 @@ def main():
 
         elif current_view == VIEW_MATCH and active_match_view:
             # --- Draw the active match simulation ---
-            active_match_view.draw()
+            # Returns only the regions that changed, or None after a full repaint
+            dirty_rects = active_match_view.draw()
 
         # --- Update Display ---
-        pygame.display.flip()  # Show the drawn frame on the screen
+        if dirty_rects is not None:
+            pygame.display.update(dirty_rects)  # Push only the changed regions
+        else:
+            pygame.display.flip()  # Show the drawn frame on the screen
 
         # --- Frame Rate ---
         clock.tick(60)  # Limit the game loop to 60 frames per second
@@ -1,10 +1,82 @@
+import json
 import random
-from constants import TRY_POINTS, CONVERSION_POINTS
+import numpy as np
+from sim_constants import TRY_POINTS, CONVERSION_POINTS, PENALTY_POINTS
+from player import ATTRIBUTE_COLUMNS
 
+# --- Instant engine tuning ---
+# Normalization factor for attack vs defense: Lower value = higher scores generally
+NORMALIZATION = 75
+# Base number of tries per team before potential and randomness
+TRY_BASE = 1.5
+# Base chance of a successful kick per penalty opportunity
+PENALTY_FACTOR = 0.1
+# The tunable parameters above, as saved in parameter files (see load_params and
+# calibration.py)
+PARAM_NAMES = ("NORMALIZATION", "TRY_BASE", "PENALTY_FACTOR")
 
-def calculate_team_ratings(team):
+# Column order used for rating vectors in the batch engine
+RATING_KEYS = ("attack", "defense", "kicking")
+
+# The weights of compute_ratings as a matrix: ATTRIBUTE_COLUMNS rows, RATING_KEYS
+# columns. Ratings are linear in the attributes, so a squad's ratings = its mean
+# attributes @ RATING_WEIGHTS.
+_ATTRIBUTE_WEIGHTS = {
+    "attack": {
+        "passing": 0.3,
+        "speed": 0.3,
+        "strength": 0.2,
+        "kicking": 0.1,
+        "skill": 0.1,
+    },
+    "defense": {"tackling": 0.5, "strength": 0.3, "speed": 0.1, "skill": 0.1},
+    "kicking": {"kicking": 1.0},
+}
+RATING_WEIGHTS = np.array(
+    [
+        [_ATTRIBUTE_WEIGHTS[key].get(name, 0.0) for key in RATING_KEYS]
+        for name in ATTRIBUTE_COLUMNS
+    ]
+)
+
+
+def get_params():
+    """The instant engine's current tuning as {name: value}."""
+    return {name: globals()[name] for name in PARAM_NAMES}
+
+
+def set_params(params):
+    """Retunes the instant engine (simulate_match[es_batch]) for this process."""
+    unknown = set(params) - set(PARAM_NAMES)
+    if unknown:
+        raise ValueError(f"Unknown instant engine parameters: {sorted(unknown)}")
+    globals().update({name: float(value) for name, value in params.items()})
+
+
+def save_params(path, params=None, **extra):
+    """
+    Writes a parameter file (params default to the current ones); extra keys are
+    kept as metadata.
+    """
+    with open(path, "w") as f:
+        json.dump(
+            {"params": get_params() if params is None else dict(params), **extra},
+            f,
+            indent=2,
+        )
+
+
+def load_params(path):
+    """Loads and applies a save_params file (e.g. written by calibration.py)."""
+    with open(path) as f:
+        params = json.load(f)["params"]
+    set_params(params)
+    return params
+
+
+def compute_ratings(players):
     """Calculates aggregated attack and defense ratings based on player attributes."""
-    if not team.players:
+    if not players:
         return {"attack": 0, "defense": 0, "kicking": 0}
 
     # --- Define how attributes contribute to attack and defense ---
@@ -15,18 +87,18 @@ def calculate_team_ratings(team):
         + p.strength * 0.2
         + p.kicking * 0.1
         + p.skill * 0.1
-        for p in team.players
+        for p in players
     )
     defense_rating = sum(
         p.tackling * 0.5
         + p.strength * 0.3
         + p.speed * 0.1
         + p.skill * 0.1  # Speed helps cover ground
-        for p in team.players
+        for p in players
     )
-    kicking_rating = sum(p.kicking for p in team.players)
+    kicking_rating = sum(p.kicking for p in players)
 
-    num_players = len(team.players)
+    num_players = len(players)
     return {
         "attack": attack_rating / num_players,
         "defense": defense_rating / num_players,
@@ -35,10 +107,28 @@ def calculate_team_ratings(team):
     }
 
 
-def simulate_match(home_team, away_team):
+def compute_store_ratings(store, indices):
+    """compute_ratings for PlayerStore players: one column reduction over their rows."""
+    if len(indices) == 0:
+        return {"attack": 0, "defense": 0, "kicking": 0}
+    return dict(
+        zip(RATING_KEYS, (store.mean_attributes(indices) @ RATING_WEIGHTS).tolist())
+    )
+
+
+def calculate_team_ratings(team):
+    """Team ratings, served from the team's cache when the roster hasn't changed."""
+    get_ratings = getattr(team, "get_ratings", None)
+    if get_ratings:
+        return get_ratings()
+    return compute_ratings(team.players)
+
+
+def simulate_match(home_team, away_team, rng=random):
     """
-    Simulates a match result based on aggregated player attributes + randomness.
-    More detailed simulation determining tries and penalties.
+    Simulates a match result based on aggregated player attributes + randomness. More
+    detailed simulation determining tries and penalties. rng is the random module or a
+    seeded random.Random (see seeding.RandomContext.match_rng).
     """
     home_ratings = calculate_team_ratings(home_team)
     away_ratings = calculate_team_ratings(away_team)
@@ -46,9 +136,6 @@ def simulate_match(home_team, away_team):
     # --- Simulate Tries ---
     # Compare attack of one team vs defense of the other
     # The difference influences the *chance* and *number* of tries
-    # Normalization factor (tune this): Lower value = higher scores generally
-    NORMALIZATION = 75
-
     home_try_potential = (
         home_ratings["attack"] - away_ratings["defense"]
     ) / NORMALIZATION
@@ -57,9 +144,13 @@ def simulate_match(home_team, away_team):
     ) / NORMALIZATION
 
     # Base number of tries + potential + randomness
-    # Adjust base (e.g., 1.5) and random range for desired scoring levels
-    num_tries_home = max(0, round(1.5 + home_try_potential + random.uniform(-1.0, 1.5)))
-    num_tries_away = max(0, round(1.5 + away_try_potential + random.uniform(-1.0, 1.5)))
+    # Adjust TRY_BASE and random range for desired scoring levels
+    num_tries_home = max(
+        0, round(TRY_BASE + home_try_potential + rng.uniform(-1.0, 1.5))
+    )
+    num_tries_away = max(
+        0, round(TRY_BASE + away_try_potential + rng.uniform(-1.0, 1.5))
+    )
 
     home_score = 0
     for _ in range(num_tries_home):
@@ -68,42 +159,130 @@ def simulate_match(home_team, away_team):
         conversion_chance = (
             0.65 + (home_ratings["kicking"] - 50) / 200
         )  # Small influence
-        if random.random() < max(0.1, min(0.95, conversion_chance)):
+        if rng.random() < max(0.1, min(0.95, conversion_chance)):
             home_score += CONVERSION_POINTS
 
     away_score = 0
     for _ in range(num_tries_away):
         away_score += TRY_POINTS
         conversion_chance = 0.65 + (away_ratings["kicking"] - 50) / 200
-        if random.random() < max(0.1, min(0.95, conversion_chance)):
+        if rng.random() < max(0.1, min(0.95, conversion_chance)):
             away_score += CONVERSION_POINTS
 
     # --- Simulate Penalties / Drop Goals ---
     # Give a base chance for penalties, influenced slightly by attack/defense difference and kicking skill
-    penalty_factor = 0.1  # Base chance factor
-
     home_penalty_chance = (
-        penalty_factor
+        PENALTY_FACTOR
         + (home_try_potential / 10)
         + (home_ratings["kicking"] - 50) / 500
     )
     away_penalty_chance = (
-        penalty_factor
+        PENALTY_FACTOR
         + (away_try_potential / 10)
         + (away_ratings["kicking"] - 50) / 500
     )
 
     # Simulate a few penalty opportunities
     for _ in range(
-        random.randint(3, 7)
+        rng.randint(3, 7)
     ):  # More opportunities than actual successful kicks
-        if random.random() < home_penalty_chance:
-            home_score += 3
-        if random.random() < away_penalty_chance:
-            away_score += 3
+        if rng.random() < home_penalty_chance:
+            home_score += PENALTY_POINTS
+        if rng.random() < away_penalty_chance:
+            away_score += PENALTY_POINTS
 
     # --- Final adjustments (optional) ---
     # Add slight home advantage?
     # if random.random() < 0.1: home_score += random.choice([0, 3])
 
     return home_score, away_score
+
+
+def ratings_to_array(ratings):
+    """Converts a ratings dict (or a list of them) to a float array of RATING_KEYS."""
+    if isinstance(ratings, dict):
+        return np.array([ratings[key] for key in RATING_KEYS], dtype=float)
+    if len(ratings) and isinstance(ratings[0], dict):
+        return np.array([[r[key] for key in RATING_KEYS] for r in ratings], dtype=float)
+    return np.asarray(ratings, dtype=float)
+
+
+def simulate_matches_batch(
+    home_ratings, away_ratings, n=None, rng=None, params=None, details=False
+):
+    """
+    Vectorized version of simulate_match for many fixtures/repetitions at once.
+
+    home_ratings / away_ratings are either a single ratings dict (as returned by
+    calculate_team_ratings, repeated n times) or one row per match: a list of dicts or
+    an (m, 3) array with RATING_KEYS columns. n may also be a shape, e.g. (runs, m) to
+    play the m fixtures `runs` times without copying the ratings; the results then have
+    that shape. Draws follow exactly the same distribution as simulate_match. Returns
+    (home_scores, away_scores) int arrays. params overrides some of the tuning
+    (PARAM_NAMES) for this call only. With details=True a third value {"home_tries":
+    ..., "away_penalties": ...} gives the scoring events per match.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    params = get_params() if params is None else {**get_params(), **params}
+    normalization, try_base, penalty_factor = (params[name] for name in PARAM_NAMES)
+    home = ratings_to_array(home_ratings)
+    away = ratings_to_array(away_ratings)
+    if n is None:
+        n = max(len(home) if home.ndim == 2 else 1, len(away) if away.ndim == 2 else 1)
+    shape = (n,) if np.isscalar(n) else tuple(n)
+    home = np.broadcast_to(home, (*shape, len(RATING_KEYS)))
+    away = np.broadcast_to(away, (*shape, len(RATING_KEYS)))
+    home_attack, home_defense, home_kicking = np.moveaxis(home, -1, 0)
+    away_attack, away_defense, away_kicking = np.moveaxis(away, -1, 0)
+
+    # --- Tries (np.rint rounds half to even, same as round()) ---
+    home_try_potential = (home_attack - away_defense) / normalization
+    away_try_potential = (away_attack - home_defense) / normalization
+    tries_home = np.maximum(
+        0, np.rint(try_base + home_try_potential + rng.uniform(-1.0, 1.5, shape))
+    )
+    tries_away = np.maximum(
+        0, np.rint(try_base + away_try_potential + rng.uniform(-1.0, 1.5, shape))
+    )
+    tries_home = tries_home.astype(np.int64)
+    tries_away = tries_away.astype(np.int64)
+
+    # --- Conversions: each try is an independent kick ---
+    home_conversion = np.clip(0.65 + (home_kicking - 50) / 200, 0.1, 0.95)
+    away_conversion = np.clip(0.65 + (away_kicking - 50) / 200, 0.1, 0.95)
+    conversions_home = rng.binomial(tries_home, home_conversion)
+    conversions_away = rng.binomial(tries_away, away_conversion)
+
+    # --- Penalties: both teams share the same number of opportunities ---
+    home_penalty_chance = (
+        penalty_factor + home_try_potential / 10 + (home_kicking - 50) / 500
+    )
+    away_penalty_chance = (
+        penalty_factor + away_try_potential / 10 + (away_kicking - 50) / 500
+    )
+    opportunities = rng.integers(3, 8, shape)
+    penalties_home = rng.binomial(opportunities, np.clip(home_penalty_chance, 0.0, 1.0))
+    penalties_away = rng.binomial(opportunities, np.clip(away_penalty_chance, 0.0, 1.0))
+
+    home_scores = (
+        tries_home * TRY_POINTS
+        + conversions_home * CONVERSION_POINTS
+        + penalties_home * PENALTY_POINTS
+    )
+    away_scores = (
+        tries_away * TRY_POINTS
+        + conversions_away * CONVERSION_POINTS
+        + penalties_away * PENALTY_POINTS
+    )
+    if details:
+        return (
+            home_scores,
+            away_scores,
+            {
+                "home_tries": tries_home,
+                "away_tries": tries_away,
+                "home_penalties": penalties_home,
+                "away_penalties": penalties_away,
+            },
+        )
+    return home_scores, away_scores
@@ -1,58 +1,90 @@
 # match_view.py
 import pygame
-import random
 import time
-import math
+from collections import deque
 from constants import *
 from team import Team
-from player import Player
-from match_engine import calculate_team_ratings, simulate_match
-from ui import draw_text, draw_button
-
-class PlayerState:
-    """Holds positional and state data for a player within the match view."""
-    def __init__(self, player_obj: Player, team_obj: Team, x: float, y: float):
-        self.player = player_obj
-        self.team = team_obj
-        self.x = x
-        self.y = y
-        self.target_x = x
-        self.target_y = y
-
-    def get_speed(self):
-        """Calculate player's speed for this step."""
-        base = PLAYER_DEFAULT_SPEED
-        variation = ((self.player.speed - 50) / 50.0) * PLAYER_SPEED_VARIATION
-        return max(0.5, base + variation)
-
-    def move_towards_target(self):
-        """Move the player a step towards their target coordinates."""
-        speed = self.get_speed()
-        dx = self.target_x - self.x
-        dy = self.target_y - self.y
-        distance = math.hypot(dx, dy)
-
-        if distance < speed:
-            self.x = self.target_x
-            self.y = self.target_y
-        elif distance > 0:
-            # Apply a small inertia/smoothing factor? (Optional)
-            # factor = 0.8
-            # self.x = self.x * (1-factor) + (self.x + (dx / distance) * speed) * factor
-            # self.y = self.y * (1-factor) + (self.y + (dy / distance) * speed) * factor
-            self.x += (dx / distance) * speed
-            self.y += (dy / distance) * speed
-
-
-        # Clamp position to pitch bounds (loosely, allow slightly outside)
-        self.x = max(PITCH_RECT.left - 20, min(self.x, PITCH_RECT.right + 20))
-        self.y = max(PITCH_RECT.top - 20, min(self.y, PITCH_RECT.bottom + 20))
+from dynamic_engine import (
+    DynamicMatchEngine,
+    MatchEvent,
+    EVENT_KICKOFF,
+    EVENT_POSSESSION,
+    EVENT_PENALTY,
+    EVENT_PENALTY_GOAL,
+    EVENT_PENALTY_MISS,
+    EVENT_KICK_FOR_TOUCH,
+    EVENT_TRY,
+    EVENT_CONVERSION,
+    EVENT_CONVERSION_MISS,
+)
+from replay import MatchReplay, ReplayPlayback
+from ui import draw_text, draw_button, get_static_surface
+
+# How long (ms) each kind of engine event stays on the status line. Default is 1500.
+EVENT_STATUS_DURATIONS_MS = {
+    EVENT_KICKOFF: 2000,
+    EVENT_PENALTY: 2000,
+    EVENT_PENALTY_GOAL: 2000,
+    EVENT_PENALTY_MISS: 2000,
+    EVENT_KICK_FOR_TOUCH: 2000,
+    EVENT_TRY: 2000,
+    EVENT_CONVERSION: 2000,
+    EVENT_CONVERSION_MISS: 2000,
+}
+
+# Dramatic pauses (seconds) after set-piece events when watching a match (see EventTimeline)
+EVENT_PAUSES_S = {
+    EVENT_PENALTY: 0.5,
+    EVENT_PENALTY_GOAL: 0.5,
+    EVENT_PENALTY_MISS: 0.5,
+    EVENT_KICK_FOR_TOUCH: 0.5,
+    EVENT_TRY: 1.0,
+    EVENT_CONVERSION: 1.0,
+    EVENT_CONVERSION_MISS: 1.0,
+}
+
+
+class EventTimeline:
+    """
+    Set-piece sequences (try, conversion, penalty, kick for touch...) as timed beats. Each beat
+    shows its event, then holds the match for its pause while frames keep being drawn and input
+    handled; the engine only moves on once every beat has played. Nothing ever sleeps.
+    """
+
+    def __init__(self):
+        self.beats = deque()  # (event, pause_ms) still to show, in order
+        self.hold_until_ms = 0  # The current beat's pause ends here
+
+    def push(self, event, pause_ms):
+        self.beats.append((event, pause_ms))
+
+    def is_busy(self, now_ms):
+        return bool(self.beats) or now_ms < self.hold_until_ms
+
+    def due(self, now_ms):
+        """Events whose turn has come (at most one per pause), in order."""
+        events = []
+        while self.beats and now_ms >= self.hold_until_ms:
+            event, pause_ms = self.beats.popleft()
+            events.append(event)
+            self.hold_until_ms = now_ms + pause_ms
+        return events
+
+    def flush(self):
+        """Returns every pending event at once and drops the hold (speed-up, skip, scrub)."""
+        events = [event for event, _ in self.beats]
+        self.beats.clear(); self.hold_until_ms = 0
+        return events
 
 
 class MatchView:
-    """Manages and displays the graphical match simulation with player movement."""
+    """
+    Drives a DynamicMatchEngine in real time and renders it with player movement.
+    Given a MatchReplay instead, plays the recording back (no simulation) and allows
+    scrubbing between keyframes with the left/right arrow keys.
+    """
 
-    def __init__(self, screen, home_team: Team, away_team: Team, finish_callback):
+    def __init__(self, screen, home_team: Team, away_team: Team, finish_callback, dirty_rects=DIRTY_RECT_RENDERING, rng=None, replay: MatchReplay | None = None):
         self.screen = screen
         self.home_team = home_team
         self.away_team = away_team
@@ -61,73 +93,90 @@ class MatchView:
         self.font = FONT_DEFAULT
         self.font_small = FONT_SMALL
 
-        # Simulation State
-        self.home_score = 0
-        self.away_score = 0
-        self.current_step = 0
+        # View State
         self.displayed_minute = 0
-        self.last_step_time = 0
+        self.last_update_time = pygame.time.get_ticks()
+        self.step_accumulator_ms = 0  # Simulated time owed to the engine (fixed timestep)
+        self.speed_index = 0  # Index into MATCH_SPEED_MULTIPLIERS
         self.is_finished = False
         self.paused = False
         self.status_message = ""
         self.message_timer = 0
-
-        # Player positional data
-        self.home_players: list[PlayerState] = []
-        self.away_players: list[PlayerState] = []
-        self._initialize_player_states()
-
-        # Ball state
-        self.ball_x = PITCH_RECT.centerx
-        self.ball_y = PITCH_RECT.centery
-        self.ball_carrier: PlayerState | None = None
-        self.possession_team: Team | None = None
-
-        # Ratings
-        self.home_ratings = calculate_team_ratings(self.home_team)
-        self.away_ratings = calculate_team_ratings(self.away_team)
-
-        # Initial kickoff
-        self._kickoff()
+        self.timeline = EventTimeline()  # Set-piece pauses, spread over frames
+        self.skipping = False  # Fast-forwarding the rest of the match (see _skip_to_end)
+
+        # Dirty-rect rendering: what each moving element covered last frame (None = repaint all)
+        self.dirty_rects = dirty_rects
+        self._drawn_rects = None
+
+        # Debug overlay with per-phase step timings (toggled with DEBUG_OVERLAY_KEY)
+        self.show_debug_overlay = False
+        self._overlay_lines = []
+        self._overlay_refreshed_at = None
+
+        # The simulation itself (kicks off immediately, reporting events back to us),
+        # or a playback of a recorded match that looks the same to the rest of the view
+        self.replay = replay
+        if replay is not None:
+            self.engine = ReplayPlayback(replay, home_team, away_team, event_callback=self._on_match_event)
+        else:
+            self.engine = DynamicMatchEngine(home_team, away_team, event_callback=self._on_match_event, rng=rng)
 
         # UI
         self.skip_button_rect = pygame.Rect(SCREEN_WIDTH - BUTTON_WIDTH - 20, 10, BUTTON_WIDTH, BUTTON_HEIGHT)
+        self.speed_button_rect = pygame.Rect(20, 10, BUTTON_WIDTH // 2, BUTTON_HEIGHT)
 
         print(f"Starting Dynamic Match: {self.home_team.name} vs {self.away_team.name}")
         print(f"Simulation Steps: {MATCH_DURATION_STEPS}, Game Minutes: {GAME_DURATION_MINUTES}")
 
-    def _initialize_player_states(self):
-        """Set up initial player positions in a rough formation."""
-        self.home_players = []
-        self.away_players = []
-        home_def_y = PITCH_RECT.centery - PITCH_RECT.height * 0.15
-        home_att_y = PITCH_RECT.centery - PITCH_RECT.height * 0.35
-        away_def_y = PITCH_RECT.centery + PITCH_RECT.height * 0.15
-        away_att_y = PITCH_RECT.centery + PITCH_RECT.height * 0.35
-        fwd_x_spacing = PITCH_RECT.width / 9
-        fwd_xs = [PITCH_RECT.left + fwd_x_spacing * (i + 1) for i in range(8)]
-        back_x_spacing = PITCH_RECT.width / 8
-        back_xs = [PITCH_RECT.left + back_x_spacing * (i + 0.5) for i in range(7)]
-
-        for i, p in enumerate(self.home_team.players):
-            if i < 8: x, y = fwd_xs[i], home_def_y + random.uniform(-15, 15)
-            else: x, y = back_xs[i - 8], home_att_y + random.uniform(-15, 15)
-            self.home_players.append(PlayerState(p, self.home_team, x, y))
-
-        for i, p in enumerate(self.away_team.players):
-            if i < 8: x, y = fwd_xs[i], away_def_y + random.uniform(-15, 15)
-            else: x, y = back_xs[i - 8], away_att_y + random.uniform(-15, 15)
-            self.away_players.append(PlayerState(p, self.away_team, x, y))
-
-    def _kickoff(self):
-        """Set initial possession and ball position for kickoff."""
-        self.ball_x = PITCH_RECT.centerx; self.ball_y = PITCH_RECT.centery
-        self.possession_team = random.choice([self.home_team, self.away_team])
-        receiving_team_players = self.home_players if self.possession_team == self.home_team else self.away_players
-        if not receiving_team_players: return
-        receiver = min(receiving_team_players, key=lambda p: math.hypot(p.x - self.ball_x, p.y - self.ball_y))
-        self.ball_carrier = receiver
-        self.set_status(f"Kick off! {self.possession_team.name} possession.", 2000)
+    @property
+    def home_score(self):
+        return self.engine.home_score
+
+    @property
+    def away_score(self):
+        return self.engine.away_score
+
+    @property
+    def speed_multiplier(self):
+        """Current watch speed (steps per SIMULATION_SPEED_MS), or None for max speed."""
+        return MATCH_SPEED_MULTIPLIERS[self.speed_index]
+
+    @property
+    def speed_label(self):
+        multiplier = self.speed_multiplier
+        return "Max" if multiplier is None else f"{multiplier}x"
+
+    def set_speed(self, index):
+        self.speed_index = index % len(MATCH_SPEED_MULTIPLIERS)
+        self.step_accumulator_ms = 0
+        if self.speed_multiplier != 1:  # Pauses are only for normal speed: show what's queued now
+            for event in self.timeline.flush(): self._show_event(event)
+
+    def _on_match_event(self, event: MatchEvent):
+        """Queues set-piece events on the timeline when watching at normal speed, shows the rest now."""
+        if self.skipping: return  # Fast-forwarding: only the progress bar is shown
+        pause = EVENT_PAUSES_S.get(event.kind)
+        if pause and self.speed_multiplier == 1:
+            self.timeline.push(event, int(pause * 1000))
+        elif self.timeline.beats:
+            self.timeline.push(event, 0)  # Keep the order: show it after the queued set piece
+        else:
+            self._show_event(event)
+
+    def _show_event(self, event: MatchEvent):
+        """Turns an engine event into a status message."""
+        if event.kind == EVENT_POSSESSION:
+            # Possession changes only show up if nothing more interesting is on screen
+            if self.message_timer == 0 or pygame.time.get_ticks() > self.message_timer:
+                self.set_status(event.message)
+        else:
+            self.set_status(event.message, EVENT_STATUS_DURATIONS_MS.get(event.kind, 1500))
+
+    def _play_timeline(self, now_ms):
+        """Shows the set-piece beats that are due. Returns True while the match is held."""
+        for event in self.timeline.due(now_ms): self._show_event(event)
+        return self.timeline.is_busy(now_ms)
 
     def set_status(self, message, duration_ms=1500):
         self.status_message = message
@@ -138,25 +187,106 @@ class MatchView:
             if self.skip_button_rect.collidepoint(event.pos):
                 print("Skipping match...")
                 self._skip_to_end()
+            elif self.speed_button_rect.collidepoint(event.pos):
+                self.set_speed(self.speed_index + 1)
+        elif event.type == pygame.KEYDOWN and pygame.K_1 <= event.key < pygame.K_1 + len(MATCH_SPEED_MULTIPLIERS):
+            self.set_speed(event.key - pygame.K_1)  # Number keys pick a speed directly
+        elif event.type == pygame.KEYDOWN and event.key == DEBUG_OVERLAY_KEY:
+            self.toggle_debug_overlay()
+        elif event.type == pygame.KEYDOWN and self.replay is not None and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+            self.scrub(-1 if event.key == pygame.K_LEFT else 1)
+
+    def toggle_debug_overlay(self):
+        """Shows/hides the step timing overlay; timings are only collected while it is shown."""
+        self.show_debug_overlay = not self.show_debug_overlay
+        enable_stats = getattr(self.engine, "enable_stats", None)  # Replays have nothing to time
+        if enable_stats:
+            enable_stats(self.show_debug_overlay)
+        self._overlay_lines = []; self._overlay_refreshed_at = None
+
+    def _draw_debug_overlay(self, drawn):
+        now = pygame.time.get_ticks()
+        stats = getattr(self.engine, "stats", None)
+        if self._overlay_refreshed_at is None or now - self._overlay_refreshed_at >= DEBUG_OVERLAY_REFRESH_MS:
+            self._overlay_lines = stats.format_lines() if stats else ["No step timings (replay)"]
+            self._overlay_refreshed_at = now
+        y = PITCH_RECT.top + 5
+        for i, line in enumerate(self._overlay_lines):
+            drawn["overlay", i] = draw_text(self.screen, line, (PITCH_RECT.left + 5, y), FONT_TINY, BLACK)
+            y += FONT_TINY_SIZE
+
+    def scrub(self, direction):
+        """Replay only: jumps to the previous (direction < 0) or next keyframe."""
+        if self.replay is None or self.is_finished: return
+        step = self.engine.current_step
+        target = self.replay.previous_keyframe(step) if direction < 0 else self.replay.next_keyframe(step)
+        self.engine.seek(target)
+        self.displayed_minute = self.engine.minute; self.step_accumulator_ms = 0
+        self.status_message = ""; self.message_timer = 0; self.timeline.flush()
 
     def update(self):
-        if self.is_finished or self.paused: return
+        """
+        Fixed-timestep loop: real time (times the speed multiplier) accumulates, and one engine
+        step runs per SIMULATION_SPEED_MS owed, within MATCH_STEP_BUDGET_MS of work per frame.
+        While a set piece plays out on the timeline the engine waits (and owes nothing).
+        """
         current_time_ms = pygame.time.get_ticks()
+        elapsed_ms = min(current_time_ms - self.last_update_time, MATCH_MAX_FRAME_DELTA_MS)
+        self.last_update_time = current_time_ms
+        if self.is_finished or self.paused: return
         if self.message_timer != 0 and current_time_ms > self.message_timer:
              self.status_message = ""; self.message_timer = 0
 
-        if current_time_ms - self.last_step_time >= SIMULATION_SPEED_MS:
-            self.last_step_time = current_time_ms
-            if self.current_step < MATCH_DURATION_STEPS:
-                self.displayed_minute = int((self.current_step / MATCH_DURATION_STEPS) * GAME_DURATION_MINUTES)
-                self._simulate_step()
-                self.current_step += 1
-            else:
-                if not self.is_finished:
-                    self.is_finished = True; self.displayed_minute = GAME_DURATION_MINUTES
-                    final_msg = f"Full Time! {self.home_team.name} {self.home_score} - {self.away_score} {self.away_team.name}"
-                    print(final_msg); self.set_status(final_msg, 5000)
-                    pygame.time.set_timer(pygame.USEREVENT + 1, 3000, loops=1)
+        if self.skipping:
+            self._fast_forward(); return
+        if self._play_timeline(current_time_ms):
+            self.step_accumulator_ms = 0; return
+
+        multiplier = self.speed_multiplier
+        if multiplier is not None:
+            self.step_accumulator_ms += elapsed_ms * multiplier
+        deadline = time.perf_counter() + MATCH_STEP_BUDGET_MS / 1000
+        while not self.engine.is_finished and (multiplier is None or self.step_accumulator_ms >= SIMULATION_SPEED_MS):
+            self.displayed_minute = self.engine.minute
+            self.engine.step()
+            if multiplier is not None:
+                self.step_accumulator_ms -= SIMULATION_SPEED_MS
+            if self.timeline.beats:
+                # A set piece started: play it out over the next frames before stepping on
+                self._play_timeline(current_time_ms); self.step_accumulator_ms = 0
+                return
+            if time.perf_counter() >= deadline:
+                # Out of budget: drop the backlog rather than spiral behind real time
+                self.step_accumulator_ms = min(self.step_accumulator_ms, SIMULATION_SPEED_MS)
+                break
+
+        if self.engine.is_finished:
+            self.is_finished = True; self.displayed_minute = GAME_DURATION_MINUTES
+            final_msg = f"Full Time! {self.home_team.name} {self.home_score} - {self.away_score} {self.away_team.name}"
+            print(final_msg); self.set_status(final_msg, 5000)
+            pygame.time.set_timer(pygame.USEREVENT + 1, 3000, loops=1)
+
+    def _fast_forward(self):
+        """Skip: runs the real engine on as fast as MATCH_STEP_BUDGET_MS per frame allows."""
+        deadline = time.perf_counter() + MATCH_STEP_BUDGET_MS / 1000
+        while self.engine.step() and time.perf_counter() < deadline:
+            pass
+        self.displayed_minute = self.engine.minute
+        if self.engine.is_finished:
+            self._finish_skip()
+
+    @property
+    def skip_progress(self):
+        """Fraction of the match simulated (for the skip progress bar)."""
+        return min(1.0, self.engine.current_step / MATCH_DURATION_STEPS)
+
+    def _draw_skip_progress(self, drawn):
+        bar = pygame.Rect(0, 0, PITCH_RECT.width // 2, 16)
+        bar.center = (PITCH_RECT.centerx, PITCH_RECT.centery + 40)
+        pygame.draw.rect(self.screen, WHITE, bar)
+        pygame.draw.rect(self.screen, DARK_GREEN, (bar.left, bar.top, int(bar.width * self.skip_progress), bar.height))
+        pygame.draw.rect(self.screen, BLACK, bar, 1)
+        drawn["skip_progress"] = bar
 
     def handle_end_match_event(self):
          if not self.is_finished: return
@@ -164,308 +294,116 @@ class MatchView:
          self._callback_called = True
          self.finish_callback(self.home_score, self.away_score)
 
-    def draw(self):
-        # (Draw function remains unchanged - only difference was time display which was already fixed)
-        self.screen.fill(WHITE)
-        pygame.draw.rect(self.screen, GREEN, PITCH_RECT)
-        pygame.draw.rect(self.screen, DARK_GREEN, PITCH_RECT, 3)
+    @staticmethod
+    def _paint_pitch(surface):
+        """Paints the static pitch background (cached by get_static_surface, drawn once)."""
+        surface.fill(WHITE)
+        pygame.draw.rect(surface, GREEN, PITCH_RECT)
+        pygame.draw.rect(surface, DARK_GREEN, PITCH_RECT, 3)
         home_try_line_y = PITCH_RECT.top + 20
         away_try_line_y = PITCH_RECT.bottom - 20
         halfway_line_y = PITCH_RECT.centery
-        pygame.draw.line(self.screen, WHITE, (PITCH_RECT.left, home_try_line_y), (PITCH_RECT.right, home_try_line_y), 2)
-        pygame.draw.line(self.screen, WHITE, (PITCH_RECT.left, away_try_line_y), (PITCH_RECT.right, away_try_line_y), 2)
-        pygame.draw.line(self.screen, WHITE, (PITCH_RECT.left, halfway_line_y), (PITCH_RECT.right, halfway_line_y), 2)
+        pygame.draw.line(surface, WHITE, (PITCH_RECT.left, home_try_line_y), (PITCH_RECT.right, home_try_line_y), 2)
+        pygame.draw.line(surface, WHITE, (PITCH_RECT.left, away_try_line_y), (PITCH_RECT.right, away_try_line_y), 2)
+        pygame.draw.line(surface, WHITE, (PITCH_RECT.left, halfway_line_y), (PITCH_RECT.right, halfway_line_y), 2)
         twenty_two_top_y = PITCH_RECT.top + PITCH_RECT.height * 0.25
         twenty_two_bottom_y = PITCH_RECT.bottom - PITCH_RECT.height * 0.25
-        pygame.draw.line(self.screen, WHITE, (PITCH_RECT.left, twenty_two_top_y), (PITCH_RECT.right, twenty_two_top_y), 1, )
-        pygame.draw.line(self.screen, WHITE, (PITCH_RECT.left, twenty_two_bottom_y), (PITCH_RECT.right, twenty_two_bottom_y), 1, )
+        pygame.draw.line(surface, WHITE, (PITCH_RECT.left, twenty_two_top_y), (PITCH_RECT.right, twenty_two_top_y), 1, )
+        pygame.draw.line(surface, WHITE, (PITCH_RECT.left, twenty_two_bottom_y), (PITCH_RECT.right, twenty_two_bottom_y), 1, )
+
+    def draw(self):
+        """
+        Draws the match. Returns the screen rects that changed this frame (for
+        pygame.display.update), or None when the whole screen was repainted and should be flipped.
+        """
+        engine = self.engine
+        background = get_static_surface("match_pitch", self.screen.get_size(), self._paint_pitch, self.screen)
+        full_redraw = not self.dirty_rects or self._drawn_rects is None
+        if full_redraw:
+            self.screen.blit(background, (0, 0))
+        else:
+            # Erase last frame's moving parts by restoring the pitch underneath them
+            for rect in self._drawn_rects.values():
+                self.screen.blit(background, rect, rect)
+        drawn = {}
 
         home_color, away_color = RED, BLUE
-        for p_state in self.home_players:
-            outline = BLACK if p_state == self.ball_carrier else None
-            pygame.draw.circle(self.screen, home_color, (int(p_state.x), int(p_state.y)), PLAYER_RADIUS)
+        for i, p_state in enumerate(engine.home_players):
+            outline = BLACK if p_state == engine.ball_carrier else None
+            drawn["home", i] = pygame.draw.circle(self.screen, home_color, (int(p_state.x), int(p_state.y)), PLAYER_RADIUS)
             if outline: pygame.draw.circle(self.screen, outline, (int(p_state.x), int(p_state.y)), PLAYER_RADIUS, 2)
-        for p_state in self.away_players:
-            outline = BLACK if p_state == self.ball_carrier else None
-            pygame.draw.circle(self.screen, away_color, (int(p_state.x), int(p_state.y)), PLAYER_RADIUS)
+        for i, p_state in enumerate(engine.away_players):
+            outline = BLACK if p_state == engine.ball_carrier else None
+            drawn["away", i] = pygame.draw.circle(self.screen, away_color, (int(p_state.x), int(p_state.y)), PLAYER_RADIUS)
             if outline: pygame.draw.circle(self.screen, outline, (int(p_state.x), int(p_state.y)), PLAYER_RADIUS, 2)
 
-        if self.ball_carrier:
-             self.ball_x, self.ball_y = self.ball_carrier.x + PLAYER_RADIUS * 0.5, self.ball_carrier.y + PLAYER_RADIUS * 0.5
-        if self.ball_x is not None and self.ball_y is not None:
-            pygame.draw.circle(self.screen, YELLOW, (int(self.ball_x), int(self.ball_y)), BALL_RADIUS)
-            pygame.draw.circle(self.screen, BLACK, (int(self.ball_x), int(self.ball_y)), BALL_RADIUS, 1)
+        # Ball is drawn slightly offset when carried (display only, engine state is untouched)
+        ball_x, ball_y = engine.ball_x, engine.ball_y
+        if engine.ball_carrier:
+             ball_x, ball_y = engine.ball_carrier.x + PLAYER_RADIUS * 0.5, engine.ball_carrier.y + PLAYER_RADIUS * 0.5
+        if ball_x is not None and ball_y is not None:
+            drawn["ball"] = pygame.draw.circle(self.screen, YELLOW, (int(ball_x), int(ball_y)), BALL_RADIUS)
+            pygame.draw.circle(self.screen, BLACK, (int(ball_x), int(ball_y)), BALL_RADIUS, 1)
 
         score_text = f"{self.home_team.name} {self.home_score} - {self.away_score} {self.away_team.name}"
         time_text = f"Minute: {self.displayed_minute}'" # Uses displayed_minute
-        possession_name = self.possession_team.name if self.possession_team else "None"
+        possession_name = engine.possession_team.name if engine.possession_team else "None"
         poss_color = BLACK
-        if self.possession_team == self.home_team: poss_color = RED
-        elif self.possession_team == self.away_team: poss_color = BLUE
+        if engine.possession_team == self.home_team: poss_color = RED
+        elif engine.possession_team == self.away_team: poss_color = BLUE
         possession_text = f"Possession: {possession_name}"
-        draw_text(self.screen, score_text, (SCREEN_WIDTH // 2, 30), self.font, BLACK, center=True)
-        draw_text(self.screen, time_text, (PITCH_RECT.left, PITCH_RECT.top - 30), self.font_small, BLACK)
-        draw_text(self.screen, possession_text, (PITCH_RECT.left, PITCH_RECT.bottom + 10), self.font_small, poss_color)
+        drawn["score"] = draw_text(self.screen, score_text, (SCREEN_WIDTH // 2, 30), self.font, BLACK, center=True)
+        drawn["time"] = draw_text(self.screen, time_text, (PITCH_RECT.left, PITCH_RECT.top - 30), self.font_small, BLACK)
+        drawn["possession"] = draw_text(self.screen, possession_text, (PITCH_RECT.left, PITCH_RECT.bottom + 10), self.font_small, poss_color)
+        if self.skipping:
+            self._draw_skip_progress(drawn)
         if self.status_message:
-            draw_text(self.screen, self.status_message, (SCREEN_WIDTH // 2, PITCH_RECT.centery), self.font, BLACK, center=True)
+            drawn["status"] = draw_text(self.screen, self.status_message, (SCREEN_WIDTH // 2, PITCH_RECT.centery), self.font, BLACK, center=True)
+        if self.show_debug_overlay:
+            self._draw_debug_overlay(drawn)
+        # The buttons are static; they are repainted every frame in case something was erased over them
         draw_button(self.screen, self.skip_button_rect, "Skip Match", GRAY, BLACK, self.font_small)
-
-    # --- SIMULATION LOGIC ---
-
-    def _simulate_step(self):
-        """Simulate one dynamic step of the match."""
-        if not self.ball_carrier or not self.possession_team: # Handle loose ball pickup
-            all_players = self.home_players + self.away_players
-            if not all_players: return
-            nearest_player = min(all_players, key=lambda p: math.hypot(p.x - self.ball_x, p.y - self.ball_y))
-            if nearest_player:
-                self.ball_carrier = nearest_player; self.possession_team = nearest_player.team
-            else: return
-
-        self._update_player_targets() # Determine where everyone wants to go
-        for p_state in self.home_players + self.away_players: # Move everyone
-            p_state.move_towards_target()
-        if self.ball_carrier: # Update ball position
-            self.ball_x, self.ball_y = self.ball_carrier.x, self.ball_carrier.y
-
-        # Check events in order of precedence
-        pass_event_occurred = self._check_passing_attempt()
-        if pass_event_occurred: return
-        tackle_resolved = self._check_tackles()
-        if tackle_resolved: return
-        if random.random() < BASE_PENALTY_CHANCE:
-             penalty_team = self.away_team if self.possession_team == self.home_team else self.home_team
-             self.handle_penalty(penalty_team, "General infringement"); return
-        self._check_scoring()
-
-
-    # --- UPDATED TARGETING LOGIC ---
-    def _update_player_targets(self):
-        """Set the target coordinates for each player based on game state (attack/defense formations)."""
-        if not self.ball_carrier or not self.possession_team: return
-
-        carrier = self.ball_carrier
-        attacking_players = self.home_players if self.possession_team == self.home_team else self.away_players
-        defending_players = self.away_players if self.possession_team == self.home_team else self.home_players
-        is_home_attacking = self.possession_team == self.home_team
-        target_y_direction = 1 if is_home_attacking else -1 # Home attacks down (+Y)
-
-        # --- Attacking Team Targets ---
-        # Carrier: Move towards opponent try line
-        carrier_target_y = carrier.y + target_y_direction * PITCH_RECT.height
-        carrier_target_x = carrier.x + random.uniform(-PITCH_RECT.width * 0.05, PITCH_RECT.width * 0.05) # Less horizontal drift?
-        carrier.target_x, carrier.target_y = carrier_target_x, carrier_target_y
-
-        # Support Players: Form up behind carrier
-        support_candidates = sorted([p for p in attacking_players if p != carrier],
-                                    key=lambda p: math.hypot(p.x - carrier.x, p.y - carrier.y))
-        num_immediate_support = 4 # How many players form the immediate support line
-
-        for i, p_state in enumerate(support_candidates):
-            # Target Y: Behind the carrier
-            target_y = carrier.y - target_y_direction * SUPPORT_DISTANCE + random.uniform(-5, 5)
-
-            # Target X: Spread out horizontally
-            # Assign slots left/right of carrier based on index
-            slot_index = i // 2 + 1 # 1, 1, 2, 2, 3, 3...
-            side_mult = 1 if i % 2 == 0 else -1 # Alternate sides: +1, -1, +1, -1...
-            target_x = carrier.x + side_mult * slot_index * ATTACKING_SUPPORT_WIDTH + random.uniform(-10, 10)
-
-            # Immediate support players get higher priority to reach these spots
-            if i < num_immediate_support:
-                p_state.target_x, p_state.target_y = target_x, target_y
-            else:
-                # Players further away move generally towards play but maybe slower or hold width
-                # Simple approach: Target the same support line but move slower?
-                # Or just move towards carrier's Y level but stay wide?
-                general_target_x = p_state.x # Hold width initially
-                general_target_y = carrier.y - target_y_direction * (SUPPORT_DISTANCE + 30) # Further back
-                # Blend target with current position for slower reaction
-                p_state.target_x = p_state.x * 0.8 + general_target_x * 0.2
-                p_state.target_y = p_state.y * 0.8 + general_target_y * 0.2
-
-
-        # --- Defending Team Targets ---
-        # Determine the desired Y-position of the defensive line
-        # Slightly ahead of the carrier, but not grossly offside (behind carrier towards defender's goal)
-        defensive_line_y = carrier.y - target_y_direction * DEFENSIVE_LINE_Y_OFFSET
-
-        # Offside check: Ensure line_y is not ahead of carrier relative to *defender's* try line
-        # Home (Red) defends TOP, Away (Blue) defends BOTTOM
-        home_try_line_y = PITCH_RECT.top
-        away_try_line_y = PITCH_RECT.bottom
-        if is_home_attacking: # Away team (Blue) is defending
-            defensive_line_y = max(defensive_line_y, carrier.y + PASS_Y_TOLERANCE) # Must be >= carrier.y (approx)
-            defensive_line_y = min(defensive_line_y, away_try_line_y - 10) # Don't sit on own line
-        else: # Home team (Red) is defending
-            defensive_line_y = min(defensive_line_y, carrier.y - PASS_Y_TOLERANCE) # Must be <= carrier.y (approx)
-            defensive_line_y = max(defensive_line_y, home_try_line_y + 10) # Don't sit on own line
-
-        # Sort defenders by their current X position to assign line spots
-        defenders_sorted_x = sorted(defending_players, key=lambda p: p.x)
-        num_defenders = len(defenders_sorted_x)
-        line_center_x = carrier.x # Line shifts horizontally with the carrier
-
-        # Assign targets for the main defensive line (exclude sweeper for now)
-        num_in_line = num_defenders - 1 if num_defenders > 5 else num_defenders # Keep one back as sweeper if enough players
-        sweeper = None
-
-        for i, p_state in enumerate(defenders_sorted_x):
-            if i == num_in_line and num_defenders > 5 : # Designate last player (often widest?) as sweeper
-                sweeper = p_state
-                continue
-
-            # Calculate target X based on position in the sorted list
-            # Centered around the carrier's X, with spacing
-            target_x = line_center_x + (i - num_in_line // 2) * DEFENSIVE_LINE_SPACING
-            p_state.target_x = target_x
-            p_state.target_y = defensive_line_y + random.uniform(-3, 3) # Slight Y variation
-
-        # Position the sweeper (if designated)
-        if sweeper:
-            sweeper_y = defensive_line_y + target_y_direction * SWEEPER_DEPTH_OFFSET # Behind the line
-            # Sweeper covers centrally or shifts slightly with ball? Central for now.
-            sweeper_target_x = line_center_x # PITCH_RECT.centerx
-            sweeper.target_x = sweeper_target_x
-            sweeper.target_y = sweeper_y
-
-    # --- Event Handling Logic (Pass, Tackle, Penalty, Scoring) ---
-    # (These functions remain unchanged from the previous version with passing)
-
-    def _check_passing_attempt(self) -> bool:
-        if not self.ball_carrier: return False
-        carrier = self.ball_carrier
-        defending_players = self.away_players if self.possession_team == self.home_team else self.home_players
-        attacking_players = self.home_players if self.possession_team == self.home_team else self.away_players
-        under_pressure = any(math.hypot(d.x - carrier.x, d.y - carrier.y) < PASS_PRESSURE_RADIUS for d in defending_players)
-        pass_chance = BASE_PASS_CHANCE + (PASS_PRESSURE_BONUS if under_pressure else 0)
-        if random.random() < pass_chance:
-            target = self._find_pass_target(carrier, attacking_players)
-            if target: return self._execute_pass(carrier, target, defending_players)
-        return False
-
-    def _find_pass_target(self, carrier: PlayerState, teammates: list[PlayerState]) -> PlayerState | None:
-        valid_targets = []
-        is_home_team = carrier.team == self.home_team
-        required_y_comparison = (lambda r_y, c_y: r_y >= c_y - PASS_Y_TOLERANCE) if is_home_team else \
-                                (lambda r_y, c_y: r_y <= c_y + PASS_Y_TOLERANCE)
-        for p_state in teammates:
-            if p_state == carrier: continue
-            distance = math.hypot(p_state.x - carrier.x, p_state.y - carrier.y)
-            if required_y_comparison(p_state.y, carrier.y) and distance < PASS_MAX_DISTANCE:
-                valid_targets.append((p_state, distance))
-        if not valid_targets: return None
-        valid_targets.sort(key=lambda item: item[1])
-        return valid_targets[0][0]
-
-    def _execute_pass(self, carrier: PlayerState, target: PlayerState, defenders: list[PlayerState]) -> bool:
-        distance = math.hypot(target.x - carrier.x, target.y - carrier.y)
-        success_chance = PASS_SUCCESS_BASE + (carrier.player.passing - 60) * PASS_ACCURACY_INFLUENCE - distance * PASS_DISTANCE_PENALTY
-        success_chance = max(0.1, min(0.98, success_chance))
-        if random.random() < success_chance: # Successful Pass
-            self.ball_carrier = target; self.set_status(f"Pass to {target.player.name}")
-            return True
-        else: # Failed Pass
-            for defender in defenders: # Check Interception
-                if math.hypot(defender.x - target.x, defender.y - target.y) < PASS_INTERCEPTION_RADIUS:
-                    intercept_chance = PASS_INTERCEPTION_BASE_CHANCE
-                    if random.random() < intercept_chance:
-                        self.ball_carrier = defender; self.possession_team = defender.team
-                        self.set_status(f"INTERCEPTED by {defender.player.name}!"); return True
-            # Dropped Pass
-            self.ball_carrier = None; self.ball_x, self.ball_y = target.x + random.uniform(-5, 5), target.y + random.uniform(-5, 5)
-            self.set_status("Dropped pass!"); return True
-
-    def _check_tackles(self) -> bool:
-        if not self.ball_carrier: return False
-        carrier = self.ball_carrier
-        defending_players = self.away_players if self.possession_team == self.home_team else self.home_players
-        tackle_resolved = False
-        potential_tacklers = [d for d in defending_players if math.hypot(d.x - carrier.x, d.y - carrier.y) < TACKLE_RADIUS]
-        if not potential_tacklers: return False
-        defender = min(potential_tacklers, key=lambda d: math.hypot(d.x - carrier.x, d.y - carrier.y))
-        str_diff = carrier.player.strength - defender.player.strength; tck_diff = defender.player.tackling - 50; spd_diff = defender.player.speed - carrier.player.speed
-        success_chance = TACKLE_SUCCESS_BASE - str_diff * TACKLE_STRENGTH_INFLUENCE + tck_diff * TACKLE_STRENGTH_INFLUENCE + spd_diff * TACKLE_SPEED_INFLUENCE
-        success_chance = max(0.05, min(0.95, success_chance))
-        if random.random() < success_chance: # Successful Tackle
-            self.set_status(f"Tackle! {defender.player.name} stops {carrier.player.name}!")
-            penalty_chance_on_tackle = BASE_PENALTY_CHANCE * 2.5
-            if random.random() < penalty_chance_on_tackle: # Check Penalty
-                penalty_offender = carrier.team; penalty_winner = defender.team
-                self.handle_penalty(penalty_winner, f"Infringement by {penalty_offender.name} at tackle"); tackle_resolved = True
-            else: # Process Turnover
-                self.possession_team = defender.team; self.ball_carrier = None; self.ball_x, self.ball_y = carrier.x, carrier.y; tackle_resolved = True
-        else: # Broken Tackle
-            self.set_status(f"{carrier.player.name} breaks the tackle from {defender.player.name}!")
-            knockback_factor = 0.3; defender.x += (defender.x - carrier.x) * knockback_factor; defender.y += (defender.y - carrier.y) * knockback_factor
-        return tackle_resolved
-
-    def handle_penalty(self, winning_team: Team, reason: str):
-        self.set_status(f"Penalty! {winning_team.name}. ({reason})", 2000); self.possession_team = winning_team; self.ball_carrier = None
-        kicker_candidates = self.home_players if winning_team == self.home_team else self.away_players
-        if not kicker_candidates: return
-        kicker = max(kicker_candidates, key=lambda p: p.player.kicking); self.ball_x, self.ball_y = kicker.x, kicker.y
-        is_home_kicking = winning_team == self.home_team; target_try_line_y = PITCH_RECT.bottom if is_home_kicking else PITCH_RECT.top
-        dist_to_posts = abs(self.ball_y - target_try_line_y); kick_range = PITCH_RECT.height * 0.45; time.sleep(0.5)
-        if dist_to_posts < kick_range: # Attempt goal
-            kick_success_chance = PENALTY_SUCCESS_RATE + (kicker.player.kicking - 60) / 150
-            if random.random() < kick_success_chance:
-                self.set_status("Penalty goal successful!", 2000)
-                if is_home_kicking: self.home_score += PENALTY_POINTS
-                else: self.away_score += PENALTY_POINTS
-                time.sleep(0.5); self._reset_to_midfield(self.away_team if is_home_kicking else self.home_team)
+        draw_button(self.screen, self.speed_button_rect, self.speed_label, GRAY, BLACK, self.font_small)
+
+        previous, self._drawn_rects = self._drawn_rects, drawn
+        if full_redraw:
+            return None
+        # Each element dirties where it was and where it is now (one rect if they overlap)
+        dirty = []
+        for key in previous.keys() | drawn.keys():
+            old, new = previous.get(key), drawn.get(key)
+            if old and new and old.colliderect(new):
+                dirty.append(old.union(new))
             else:
-                self.set_status("Penalty kick missed.", 2000); time.sleep(0.5)
-                defending_team = self.away_team if is_home_kicking else self.home_team
-                dropout_y = PITCH_RECT.top + PITCH_RECT.height * 0.25 if defending_team == self.home_team else PITCH_RECT.bottom - PITCH_RECT.height * 0.25
-                self.ball_y, self.ball_x = dropout_y, PITCH_RECT.centerx; self._reset_player_possession(defending_team)
-        else: # Kick for touch
-            self.set_status("Penalty kicked for touch.", 2000); time.sleep(0.5)
-            move_direction = 1 if is_home_kicking else -1; self.ball_y += move_direction * PITCH_RECT.height * 0.3
-            self.ball_y = max(PITCH_RECT.top + 10, min(self.ball_y, PITCH_RECT.bottom - 10)); self._reset_player_possession(winning_team)
-
-    def _check_scoring(self):
-        if not self.ball_carrier: return
-        carrier = self.ball_carrier; home_target_try_line_y = PITCH_RECT.bottom - 5; away_target_try_line_y = PITCH_RECT.top + 5
-        scored, scoring_team = False, None
-        if self.possession_team == self.home_team and carrier.y >= home_target_try_line_y:
-            self.set_status(f"TRY! {self.home_team.name}!", 2000); scored, scoring_team = True, self.home_team; self.home_score += TRY_POINTS
-        elif self.possession_team == self.away_team and carrier.y <= away_target_try_line_y:
-            self.set_status(f"TRY! {self.away_team.name}!", 2000); scored, scoring_team = True, self.away_team; self.away_score += TRY_POINTS
-        if scored and scoring_team:
-            self.ball_carrier = None; self.ball_x, self.ball_y = None, None
-            kicker_candidates = self.home_players if scoring_team == self.home_team else self.away_players
-            if not kicker_candidates: return
-            kicker = max(kicker_candidates, key=lambda p: p.player.kicking)
-            conversion_chance = CONVERSION_SUCCESS_RATE + (kicker.player.kicking - 60) / 150; time.sleep(1.0)
-            if random.random() < conversion_chance:
-                self.set_status("Conversion successful!", 2000)
-                if scoring_team == self.home_team: self.home_score += CONVERSION_POINTS
-                else: self.away_score += CONVERSION_POINTS
-            else: self.set_status("Conversion missed.", 2000)
-            time.sleep(1.0)
-            restart_team = self.away_team if scoring_team == self.home_team else self.home_team
-            self._reset_to_midfield(restart_team)
-
-    def _reset_to_midfield(self, possession_team: Team):
-         print(f"Resetting to midfield, possession: {possession_team.name}"); self.ball_x, self.ball_y = PITCH_RECT.centerx, PITCH_RECT.centery
-         self._reset_player_possession(possession_team)
-
-    def _reset_player_possession(self, possession_team: Team):
-        self.possession_team = possession_team; self.ball_carrier = None
-        receiving_team_players = self.home_players if possession_team == self.home_team else self.away_players
-        if not receiving_team_players: return
-        receiver = min(receiving_team_players, key=lambda p: math.hypot(p.x - self.ball_x, p.y - self.ball_y))
-        self.ball_carrier = receiver
-        if self.message_timer == 0 or pygame.time.get_ticks() > self.message_timer : self.set_status(f"{possession_team.name} possession.")
+                dirty.extend(rect for rect in (old, new) if rect)
+        # The speed button's label can change, so it is always pushed
+        dirty.append(self.speed_button_rect)
+        if any(self.skip_button_rect.colliderect(rect) for rect in dirty):
+            dirty.append(self.skip_button_rect)
+        return dirty
+
+    def invalidate(self):
+        """Forces the next draw() to repaint (and flip) the whole screen."""
+        self._drawn_rects = None
 
     def _skip_to_end(self):
-         if self.is_finished: return
-         if hasattr(self, '_skip_processing') and self._skip_processing: return
-         self._skip_processing = True; print("Calculating skip result using instant engine...")
-         temp_home_score, temp_away_score = simulate_match(self.home_team, self.away_team)
-         self.home_score, self.away_score = temp_home_score, temp_away_score
-         self.current_step = MATCH_DURATION_STEPS; self.displayed_minute = GAME_DURATION_MINUTES; self.is_finished = True
+         """
+         Fast-forwards the match: the engine keeps simulating from where it is (no pauses, no
+         watching speed), a chunk per frame, so the final score is the real continuation.
+         """
+         if self.is_finished or self.skipping: return
+         if self.replay is not None:
+             # A replay already knows the result: just jump to the final frame
+             self.engine.seek(self.replay.num_frames - 1)
+             self._finish_skip(); return
+         self.skipping = True
+         for event in self.timeline.flush(): self._show_event(event)
+         self.set_status("Skipping to full time...", 5000)
+
+    def _finish_skip(self):
+         self.timeline.flush()  # Whatever was still queued is superseded by the final score
+         self.skipping = False
+         self.displayed_minute = GAME_DURATION_MINUTES; self.is_finished = True
          final_msg = f"(Skipped) Final Score: {self.home_team.name} {self.home_score} - {self.away_score} {self.away_team.name}"
          print(final_msg); self.set_status(final_msg, 5000)
-         pygame.time.set_timer(pygame.USEREVENT + 1, 100, loops=1) # Callback almost immediately
\ No newline at end of file
+         pygame.time.set_timer(pygame.USEREVENT + 1, 100, loops=1) # Callback almost immediately
@@ -1,26 +1,196 @@
 import random
+import numpy as np
 
+# Attributes that feed into team ratings (see match_engine.compute_ratings)
+RATED_ATTRIBUTES = ("tackling", "passing", "kicking", "speed", "strength", "skill")
+# Column order of PlayerStore.attributes
+ATTRIBUTE_COLUMNS = RATED_ATTRIBUTES
+_COLUMN_INDEX = {name: i for i, name in enumerate(ATTRIBUTE_COLUMNS)}
 
-class Player:
-    """Represents a single player with more detailed attributes."""
+# Known positions, stored as a small code per player (a store appends unknown ones)
+POSITIONS = (
+    "Prop",
+    "Hooker",
+    "Lock",
+    "Flanker",
+    "Number 8",
+    "Scrum-half",
+    "Fly-half",
+    "Centre",
+    "Wing",
+    "Fullback",
+)
+
+
+class PlayerStore:
+    """
+    Columnar storage for many players: one int16 row of ATTRIBUTE_COLUMNS per player,
+    a uint8 position code and a name. Player objects are lightweight views onto a row,
+    and team-level aggregates are reductions over the rows a team references.
+    """
 
-    def __init__(self, name, position, tackling, passing, kicking, speed, strength):
-        self.name = name
-        self.position = position  # e.g., "Prop", "Fly-half", "Fullback"
+    def __init__(self, capacity=1024):
+        self.size = 0
+        self.attributes = np.zeros((capacity, len(ATTRIBUTE_COLUMNS)), dtype=np.int16)
+        self.position_codes = np.zeros(capacity, dtype=np.uint8)
+        self.names = []
+        self.positions = list(POSITIONS)
+        self._position_codes = {
+            position: code for code, position in enumerate(self.positions)
+        }
 
-        # Attributes (scale 1-100, simplified)
-        self.tackling = max(1, min(100, tackling))
-        self.passing = max(1, min(100, passing))
-        self.kicking = max(1, min(100, kicking))  # General kicking (goal, tactical)
-        self.speed = max(1, min(100, speed))
-        self.strength = max(1, min(100, strength))
+    def __len__(self):
+        return self.size
 
+    def _reserve(self, count):
+        """Makes room for `count` more rows (capacity doubles: O(1) amortized)."""
+        needed = self.size + count
+        capacity = len(self.attributes)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        attributes = np.zeros((capacity, len(ATTRIBUTE_COLUMNS)), dtype=np.int16)
+        attributes[: self.size] = self.attributes[: self.size]
+        position_codes = np.zeros(capacity, dtype=np.uint8)
+        position_codes[: self.size] = self.position_codes[: self.size]
+        self.attributes, self.position_codes = attributes, position_codes
+
+    def position_code(self, position):
+        code = self._position_codes.get(position)
+        if code is None:
+            code = self._position_codes[position] = len(self.positions)
+            self.positions.append(position)
+        return code
+
+    def add(self, name, position, tackling, passing, kicking, speed, strength):
+        """Stores one player (attributes clamped to 1-100). Returns its row index."""
+        self._reserve(1)
+        index = self.size
+        values = [
+            max(1, min(100, value))
+            for value in (tackling, passing, kicking, speed, strength)
+        ]
         # Overall skill derived or separate? Let's keep it separate for now as a general indicator
-        self.skill = int(
-            (self.tackling + self.passing + self.kicking + self.speed + self.strength)
-            / 5
+        self.attributes[index] = values + [int(sum(values) / 5)]
+        self.position_codes[index] = self.position_code(position)
+        self.names.append(name)
+        self.size += 1
+        return index
+
+    def add_many(self, names, positions, tackling, passing, kicking, speed, strength):
+        """Stores many players from equal-length sequences. Returns their rows."""
+        count = len(names)
+        self._reserve(count)
+        start = self.size
+        rows = self.attributes[start : start + count]
+        for column, values in enumerate((tackling, passing, kicking, speed, strength)):
+            rows[:, column] = np.clip(values, 1, 100)
+        rows[:, _COLUMN_INDEX["skill"]] = rows[:, :5].sum(axis=1, dtype=np.int32) // 5
+        self.position_codes[start : start + count] = [
+            self.position_code(p) for p in positions
+        ]
+        self.names.extend(names)
+        self.size += count
+        return range(start, start + count)
+
+    def column(self, name, indices=slice(None)):
+        """One attribute for the given rows (all stored players by default)."""
+        return self.attributes[: self.size, _COLUMN_INDEX[name]][indices]
+
+    def mean_attributes(self, indices):
+        """Mean of every ATTRIBUTE_COLUMNS column over rows, as a float array."""
+        return self.attributes[indices].mean(axis=0)
+
+    def player(self, index):
+        """Player view of a stored row."""
+        return Player.view(self, index)
+
+    def players(self, indices):
+        return [Player.view(self, index) for index in indices]
+
+
+# Shared store for players created without an explicit one
+PLAYER_STORE = PlayerStore()
+
+
+def _attribute_property(name):
+    column = _COLUMN_INDEX[name]
+
+    def getter(self):
+        return self.store.attributes.item(self.index, column)
+
+    def setter(self, value):
+        self.store.attributes[self.index, column] = max(
+            1, min(100, value)
+        )  # Same bounds as PlayerStore.add
+        # Let cached team ratings know they need recomputing
+        Player.attribute_epoch += 1
+
+    return property(getter, setter)
+
+
+class Player:
+    """
+    Represents a single player with more detailed attributes.
+    The data lives in a PlayerStore row; a Player is only a (store, index) view of it.
+    """
+
+    __slots__ = ("index", "store")
+
+    # Bumped whenever a player's rated attributes change, so team ratings recompute
+    attribute_epoch = 0
+
+    def __init__(
+        self, name, position, tackling, passing, kicking, speed, strength, store=None
+    ):
+        self.store = PLAYER_STORE if store is None else store
+        self.index = self.store.add(
+            name, position, tackling, passing, kicking, speed, strength
         )
 
+    @classmethod
+    def view(cls, store, index):
+        """A Player for an existing store row (no new row is added)."""
+        player = cls.__new__(cls)
+        player.store = store
+        player.index = index
+        return player
+
+    tackling = _attribute_property("tackling")
+    passing = _attribute_property("passing")
+    kicking = _attribute_property("kicking")  # General kicking (goal, tactical)
+    speed = _attribute_property("speed")
+    strength = _attribute_property("strength")
+    skill = _attribute_property("skill")
+
+    @property
+    def name(self):
+        return self.store.names[self.index]
+
+    @name.setter
+    def name(self, value):
+        self.store.names[self.index] = value
+
+    @property
+    def position(self):
+        """e.g., "Prop", "Fly-half", "Fullback" """
+        return self.store.positions[self.store.position_codes[self.index]]
+
+    @position.setter
+    def position(self, value):
+        self.store.position_codes[self.index] = self.store.position_code(value)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, Player)
+            and self.store is other.store
+            and self.index == other.index
+        )
+
+    def __hash__(self):
+        return hash((id(self.store), self.index))
+
     def __str__(self):
         # Provide a more detailed string representation if needed, e.g., for debugging
         # return f"{self.name} ({self.position}) - T:{self.tackling} P:{self.passing} K:{self.kicking} Sp:{self.speed} St:{self.strength} (Sk:{self.skill})"
@@ -29,64 +199,114 @@ class Player:
         )
 
 
-# --- Helper function to create placeholder players ---
-def generate_player(position):
-    """Generates a random player for a given position with detailed attributes."""
-    first_names = [
-        "Jonny",
-        "Richie",
-        "Dan",
-        "Brian",
-        "Serge",
-        "Martin",
-        "David",
-        "Siya",
-        "Faf",
-        "Cheslin",
+# Name pools for generated players
+FIRST_NAMES = [
+    "Jonny",
+    "Richie",
+    "Dan",
+    "Brian",
+    "Serge",
+    "Martin",
+    "David",
+    "Siya",
+    "Faf",
+    "Cheslin",
+]
+LAST_NAMES = [
+    "Wilkinson",
+    "McCaw",
+    "Carter",
+    "O'Driscoll",
+    "Blanco",
+    "Johnson",
+    "Campese",
+    "Kolisi",
+    "De Klerk",
+    "Kolbe",
+]
+
+
+# Attribute ranges (inclusive) for generated players, in GENERATED_ATTRIBUTES order
+GENERATED_ATTRIBUTES = ("tackling", "passing", "kicking", "speed", "strength")
+DEFAULT_ATTRIBUTE_RANGES = {
+    "tackling": (40, 85),
+    "passing": (30, 90),
+    "kicking": (20, 85),
+    "speed": (40, 90),
+    "strength": (40, 90),
+}
+# Basic positional adjustments (Example - make props stronger/slower, backs
+# faster/better passers)
+_FORWARD_RANGES = {"strength": (65, 95), "speed": (30, 65), "passing": (20, 50)}
+_HALF_BACK_RANGES = {"passing": (65, 95), "kicking": (60, 95), "speed": (60, 85)}
+_BACK_THREE_RANGES = {"speed": (70, 95), "kicking": (50, 90)}
+POSITION_ATTRIBUTE_RANGES = {
+    "Prop": _FORWARD_RANGES,
+    "Hooker": _FORWARD_RANGES,
+    "Lock": _FORWARD_RANGES,
+    "Scrum-half": _HALF_BACK_RANGES,
+    "Fly-half": _HALF_BACK_RANGES,
+    "Wing": _BACK_THREE_RANGES,
+    "Fullback": _BACK_THREE_RANGES,
+    "Centre": {"speed": (60, 85), "strength": (55, 85), "passing": (50, 80)},
+}
+
+
+def attribute_ranges(position):
+    """[(low, high), ...] in GENERATED_ATTRIBUTES order for a position (or defaults)."""
+    overrides = POSITION_ATTRIBUTE_RANGES.get(position, {})
+    return [
+        overrides.get(name, DEFAULT_ATTRIBUTE_RANGES[name])
+        for name in GENERATED_ATTRIBUTES
     ]
-    last_names = [
-        "Wilkinson",
-        "McCaw",
-        "Carter",
-        "O'Driscoll",
-        "Blanco",
-        "Johnson",
-        "Campese",
-        "Kolisi",
-        "De Klerk",
-        "Kolbe",
+
+
+# Range table for bulk generation: row per POSITIONS entry, plus a last row of defaults
+_RANGE_TABLE = np.array(
+    [attribute_ranges(position) for position in POSITIONS + (None,)]
+)
+_RANGE_ROW = {position: row for row, position in enumerate(POSITIONS)}
+_FULL_NAMES = [f"{first} {last}" for first in FIRST_NAMES for last in LAST_NAMES]
+
+
+# --- Helper functions to create placeholder players ---
+def generate_player(position, rng=random, store=None):
+    """
+    Generates a random player for a given position with detailed attributes.
+    rng is anything with the random module's interface (e.g. a seeded random.Random).
+    For more than a handful of players use generate_players.
+    """
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    values = [rng.randint(low, high) for low, high in attribute_ranges(position)]
+    return Player(name, position, *values, store=store)
+
+
+def generate_player_rows(positions, rng=random, store=None):
+    """
+    Generates one player per entry in positions straight into store (default
+    PLAYER_STORE), drawing every attribute of every player in one vectorized call.
+    Returns the new row range. rng is a numpy Generator, or a random
+    module/random.Random (a Generator is seeded from it).
+    """
+    store = PLAYER_STORE if store is None else store
+    if not isinstance(rng, np.random.Generator):
+        rng = np.random.default_rng(rng.getrandbits(64))
+    positions = list(positions)
+    rows = np.fromiter(
+        (_RANGE_ROW.get(position, len(POSITIONS)) for position in positions),
+        dtype=np.intp,
+        count=len(positions),
+    )
+    ranges = _RANGE_TABLE[rows]  # (players, attributes, low/high)
+    values = rng.integers(ranges[..., 0], ranges[..., 1], endpoint=True)
+    names = [
+        _FULL_NAMES[i]
+        for i in rng.integers(0, len(_FULL_NAMES), len(positions)).tolist()
     ]
-    name = f"{random.choice(first_names)} {random.choice(last_names)}"
-
-    # Generate random attributes (adjust ranges based on position later if desired)
-    tackling = random.randint(40, 85)
-    passing = random.randint(30, 90)
-    kicking = random.randint(20, 85)
-    speed = random.randint(40, 90)
-    strength = random.randint(40, 90)
-
-    # Basic positional adjustments (Example - make props stronger/slower, backs faster/better passers)
-    if position in ["Prop", "Hooker", "Lock"]:
-        strength = random.randint(65, 95)
-        speed = random.randint(30, 65)
-        passing = random.randint(20, 50)
-    elif position in ["Scrum-half", "Fly-half"]:
-        passing = random.randint(65, 95)
-        kicking = random.randint(60, 95)
-        speed = random.randint(60, 85)
-    elif position in ["Wing", "Fullback"]:
-        speed = random.randint(70, 95)
-        kicking = random.randint(50, 90)
-    elif position in ["Centre"]:
-        speed = random.randint(60, 85)
-        strength = random.randint(55, 85)
-        passing = random.randint(50, 80)
-
-    # Ensure values stay within bounds after adjustments
-    tackling = max(1, min(100, tackling))
-    passing = max(1, min(100, passing))
-    kicking = max(1, min(100, kicking))
-    speed = max(1, min(100, speed))
-    strength = max(1, min(100, strength))
-
-    return Player(name, position, tackling, passing, kicking, speed, strength)
+    return store.add_many(names, positions, *values.T)
+
+
+def generate_players(positions, rng=random, store=None):
+    """Generates one player per entry in positions (a squad, or many squads at once)."""
+    store = PLAYER_STORE if store is None else store
+    return store.players(generate_player_rows(positions, rng, store))
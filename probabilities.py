@@ -0,0 +1,105 @@
+# probabilities.py
+"""
+Precomputed success probabilities for the dynamic engine's event resolution.
+
+Tackles, passes and kicks depend only on bounded integer attributes (PlayerStore keeps
+them in 1-ATTRIBUTE_MAX) and, for passes, the pass distance. So each clamped formula is
+evaluated once over its whole domain, and resolving an event is a table lookup plus one
+uniform draw. Tables are built from the values in sim_constants and rebuilt when those
+change (see get_tables).
+"""
+
+import numpy as np
+import sim_constants
+
+ATTRIBUTE_MAX = 100
+# Pass distances are rounded to the nearest multiple of this before the lookup
+PASS_DISTANCE_BUCKET = 1.0
+
+# The constants the tables are built from
+TABLE_CONSTANTS = (
+    "TACKLE_SUCCESS_BASE",
+    "TACKLE_STRENGTH_INFLUENCE",
+    "TACKLE_SPEED_INFLUENCE",
+    "BASE_PENALTY_CHANCE",
+    "BASE_PASS_CHANCE",
+    "PASS_PRESSURE_BONUS",
+    "PASS_MAX_DISTANCE",
+    "PASS_SUCCESS_BASE",
+    "PASS_ACCURACY_INFLUENCE",
+    "PASS_DISTANCE_PENALTY",
+    "PENALTY_SUCCESS_RATE",
+    "CONVERSION_SUCCESS_RATE",
+)
+
+
+class ProbabilityTables:
+    """
+    Success probabilities as nested lists (faster than NumPy for one value at a time):
+      tackle[defender strength + defender tackling - carrier strength + ATTRIBUTE_MAX]
+            [defender speed - carrier speed + ATTRIBUTE_MAX]
+      pass_success[passer's passing][distance bucket]
+      penalty_goal[kicking], conversion[kicking]
+    plus the flat chances pass_attempt (not pressured, pressured) and penalty_at_tackle.
+    """
+
+    def __init__(self, values):
+        self.values = values  # Constant values the tables were built from
+        c = dict(zip(TABLE_CONSTANTS, values))
+        attributes = np.arange(ATTRIBUTE_MAX + 1)
+
+        # Tackle: base - (carrier str - def str) * S + (def tck - 50) * S + speed * P
+        # i.e. base + (def str + def tck - carrier str - 50) * S + speed * P
+        strength_edge = np.arange(-ATTRIBUTE_MAX, 2 * ATTRIBUTE_MAX + 1)
+        speed_diff = np.arange(-ATTRIBUTE_MAX, ATTRIBUTE_MAX + 1)
+        tackle = (
+            c["TACKLE_SUCCESS_BASE"]
+            + (strength_edge[:, None] - 50) * c["TACKLE_STRENGTH_INFLUENCE"]
+            + speed_diff[None, :] * c["TACKLE_SPEED_INFLUENCE"]
+        )
+        self.tackle = np.clip(tackle, 0.05, 0.95).tolist()
+        self.penalty_at_tackle = c["BASE_PENALTY_CHANCE"] * 2.5
+
+        self.pass_attempt = (
+            c["BASE_PASS_CHANCE"],
+            c["BASE_PASS_CHANCE"] + c["PASS_PRESSURE_BONUS"],
+        )
+        distances = (
+            np.arange(int(np.ceil(c["PASS_MAX_DISTANCE"] / PASS_DISTANCE_BUCKET)) + 1)
+            * PASS_DISTANCE_BUCKET
+        )
+        pass_success = (
+            c["PASS_SUCCESS_BASE"]
+            + (attributes[:, None] - 60) * c["PASS_ACCURACY_INFLUENCE"]
+            - distances[None, :] * c["PASS_DISTANCE_PENALTY"]
+        )
+        self.pass_success = np.clip(pass_success, 0.1, 0.98).tolist()
+
+        # Kicks are unclamped in the formula; clipping to [0, 1] changes no outcome
+        self.penalty_goal = np.clip(
+            c["PENALTY_SUCCESS_RATE"] + (attributes - 60) / 150, 0.0, 1.0
+        ).tolist()
+        self.conversion = np.clip(
+            c["CONVERSION_SUCCESS_RATE"] + (attributes - 60) / 150, 0.0, 1.0
+        ).tolist()
+
+    def tackle_success(self, carrier, defender):
+        """Chance defender (a Player) tackles carrier (a Player)."""
+        return self.tackle[
+            defender.strength + defender.tackling - carrier.strength + ATTRIBUTE_MAX
+        ][defender.speed - carrier.speed + ATTRIBUTE_MAX]
+
+    def pass_completion(self, passing, distance):
+        return self.pass_success[passing][int(distance / PASS_DISTANCE_BUCKET + 0.5)]
+
+
+_tables = None
+
+
+def get_tables():
+    """The current tables, rebuilt if any of TABLE_CONSTANTS has changed since."""
+    global _tables
+    values = tuple(getattr(sim_constants, name) for name in TABLE_CONSTANTS)
+    if _tables is None or _tables.values != values:
+        _tables = ProbabilityTables(values)
+    return _tables
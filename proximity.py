@@ -0,0 +1,77 @@
+# proximity.py
+import numpy as np
+
+
+class ProximityIndex:
+    """
+    Pairwise distance matrix for every player on the pitch, built once per simulation
+    step. Answers the radius / nearest / k-nearest questions the match engine asks each
+    step without recomputing distances at every call site.
+
+    `rows` arguments are slices (or index arrays) of player rows, e.g. one team.
+    Returned player indices are absolute rows, in the same numbering as the positions.
+    """
+
+    def __init__(self, xs, ys):
+        # Positions as complex numbers: |a - b| is the euclidean distance, in one pass
+        self.points = np.asarray(xs, dtype=float) + 1j * np.asarray(ys, dtype=float)
+        self.matrix = np.abs(np.subtract.outer(self.points, self.points))
+
+    def distance(self, i, j):
+        """Distance between players i and j."""
+        return self.matrix.item(i, j)
+
+    def distances(self, i, rows):
+        """Distances from player i to each player in rows."""
+        return self.matrix[i, rows]
+
+    def within(self, i, radius, rows):
+        """Players in rows strictly closer than radius to player i, in row order."""
+        return self._absolute(rows, np.flatnonzero(self.matrix[i, rows] < radius))
+
+    def nearest(self, i, rows, exclude=None):
+        """(player, distance) of the player in rows nearest to i, or (None, inf)."""
+        distances = self.matrix[i, rows].copy()
+        return self._nearest_of(rows, distances, exclude)
+
+    def k_nearest(self, i, k, rows, exclude=None):
+        """Up to k players in rows by distance to player i (ties keep row order)."""
+        distances = self.matrix[i, rows].copy()
+        if self._exclude(rows, distances, exclude):
+            k = min(k, len(distances) - 1)
+        order = distances.argsort(kind="stable")[:k]
+        return self._absolute(rows, order)
+
+    def nearest_to_point(self, x, y, rows=slice(None)):
+        """(player, distance) of the player in rows nearest to a point (the ball)."""
+        distances = np.abs(self.points[rows] - complex(x, y))
+        return self._nearest_of(rows, distances)
+
+    def _nearest_of(self, rows, distances, exclude=None):
+        self._exclude(rows, distances, exclude)
+        if len(distances) == 0:
+            return None, float("inf")
+        nearest = int(distances.argmin())
+        if distances[nearest] == np.inf:
+            return None, float("inf")
+        return int(self._absolute(rows, nearest)), distances.item(nearest)
+
+    def _absolute(self, rows, relative):
+        if isinstance(rows, slice):
+            return relative + (rows.start or 0)
+        return np.asarray(rows)[relative]
+
+    def _exclude(self, rows, distances, exclude):
+        """Pushes `exclude` (if in rows) out of a distance row. True if it was."""
+        if exclude is None:
+            return False
+        if isinstance(rows, slice):
+            matches = [exclude - (rows.start or 0)]
+            if not 0 <= matches[0] < len(distances):
+                return False
+        else:
+            matches = np.flatnonzero(np.asarray(rows) == exclude)
+            if not len(matches):
+                return False
+        distances[matches[0]] = np.inf
+        return True
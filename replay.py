@@ -0,0 +1,408 @@
+# replay.py
+import bisect
+import struct
+import numpy as np
+from sim_constants import GAME_DURATION_MINUTES, MATCH_DURATION_STEPS
+from dynamic_engine import (
+    DynamicMatchEngine,
+    MatchEvent,
+    EVENT_KICKOFF,
+    EVENT_POSSESSION,
+    EVENT_PASS,
+    EVENT_INTERCEPTION,
+    EVENT_DROPPED_PASS,
+    EVENT_TACKLE,
+    EVENT_BROKEN_TACKLE,
+    EVENT_PENALTY,
+    EVENT_PENALTY_GOAL,
+    EVENT_PENALTY_MISS,
+    EVENT_KICK_FOR_TOUCH,
+    EVENT_TRY,
+    EVENT_CONVERSION,
+    EVENT_CONVERSION_MISS,
+)
+
+# Event kinds in their on-disk order (the index is what gets stored)
+EVENT_KINDS = (
+    EVENT_KICKOFF,
+    EVENT_POSSESSION,
+    EVENT_PASS,
+    EVENT_INTERCEPTION,
+    EVENT_DROPPED_PASS,
+    EVENT_TACKLE,
+    EVENT_BROKEN_TACKLE,
+    EVENT_PENALTY,
+    EVENT_PENALTY_GOAL,
+    EVENT_PENALTY_MISS,
+    EVENT_KICK_FOR_TOUCH,
+    EVENT_TRY,
+    EVENT_CONVERSION,
+    EVENT_CONVERSION_MISS,
+)
+_EVENT_KIND_CODES = {kind: code for code, kind in enumerate(EVENT_KINDS)}
+
+# Events that make a frame a keyframe (scrubbing jumps between these)
+KEYFRAME_EVENTS = (
+    EVENT_KICKOFF,
+    EVENT_PENALTY,
+    EVENT_PENALTY_GOAL,
+    EVENT_PENALTY_MISS,
+    EVENT_KICK_FOR_TOUCH,
+    EVENT_TRY,
+    EVENT_CONVERSION,
+    EVENT_CONVERSION_MISS,
+)
+# ...plus a regular keyframe every this many frames (5 game minutes)
+KEYFRAME_INTERVAL = MATCH_DURATION_STEPS // 16
+
+# Frame layout (int16): x, y per player (home rows first), then these trailing columns
+FRAME_BALL_X = -6
+FRAME_BALL_Y = -5
+FRAME_CARRIER = -4  # Row of the ball carrier, or -1
+FRAME_POSSESSION = -3  # SIDE_HOME / SIDE_AWAY / SIDE_NONE
+FRAME_HOME_SCORE = -2
+FRAME_AWAY_SCORE = -1
+NUM_TRAILING_COLUMNS = 6
+NO_POSITION = -32768  # Stands in for a ball position of None
+
+SIDE_NONE = -1
+SIDE_HOME = 0
+SIDE_AWAY = 1
+
+_MAGIC = b"RGRP"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct(
+    "<4sHHHHI"
+)  # magic, version, frames, columns, home players, events
+
+
+class MatchReplay:
+    """
+    A recorded dynamic match: one int16 frame per step (player and ball positions,
+    carrier, possession and score) plus the event stream, in a compact binary form.
+    Frame 0 is the kickoff; frame k is the state after k engine steps.
+    """
+
+    def __init__(
+        self,
+        home_name,
+        away_name,
+        num_home,
+        frames,
+        event_frames,
+        event_kinds,
+        event_sides,
+        messages,
+    ):
+        self.home_name = home_name
+        self.away_name = away_name
+        self.num_home = num_home
+        self.frames = (
+            frames  # (num_frames, 2 * num_players + NUM_TRAILING_COLUMNS) int16
+        )
+        self.event_frames = (
+            event_frames  # int16, first frame the event is visible in (ascending)
+        )
+        self.event_kinds = event_kinds  # uint8 index into EVENT_KINDS
+        self.event_sides = event_sides  # int8 SIDE_*
+        self.messages = messages  # list of str
+        self.keyframes = self._build_keyframes()
+
+    @property
+    def num_frames(self):
+        return len(self.frames)
+
+    @property
+    def num_players(self):
+        return (self.frames.shape[1] - NUM_TRAILING_COLUMNS) // 2
+
+    @property
+    def home_score(self):
+        return int(self.frames[-1, FRAME_HOME_SCORE])
+
+    @property
+    def away_score(self):
+        return int(self.frames[-1, FRAME_AWAY_SCORE])
+
+    def events_between(self, start_frame, end_frame):
+        """Indices of the events first visible in frames start_frame..end_frame-1."""
+        start, end = np.searchsorted(self.event_frames, (start_frame, end_frame))
+        return range(int(start), int(end))
+
+    def previous_keyframe(self, frame):
+        """Last keyframe strictly before frame (or 0)."""
+        index = bisect.bisect_left(self.keyframes, frame)
+        return self.keyframes[index - 1] if index > 0 else 0
+
+    def next_keyframe(self, frame):
+        """First keyframe strictly after frame (or the last frame)."""
+        index = bisect.bisect_right(self.keyframes, frame)
+        return (
+            self.keyframes[index]
+            if index < len(self.keyframes)
+            else self.num_frames - 1
+        )
+
+    def _build_keyframes(self):
+        marked = {
+            code for code, kind in enumerate(EVENT_KINDS) if kind in KEYFRAME_EVENTS
+        }
+        keyframes = set(range(0, self.num_frames, KEYFRAME_INTERVAL))
+        keyframes.update(
+            int(f) for f, k in zip(self.event_frames, self.event_kinds) if k in marked
+        )
+        keyframes.add(self.num_frames - 1)
+        return sorted(keyframes)
+
+    # --- Serialization ---
+    def to_bytes(self):
+        names = [name.encode() for name in (self.home_name, self.away_name)]
+        text = "\n".join(self.messages).encode()
+        parts = [
+            _HEADER.pack(
+                _MAGIC,
+                _FORMAT_VERSION,
+                self.frames.shape[0],
+                self.frames.shape[1],
+                self.num_home,
+                len(self.messages),
+            ),
+            struct.pack("<HHI", len(names[0]), len(names[1]), len(text)),
+            *names,
+            self.frames.astype("<i2").tobytes(),
+            self.event_frames.astype("<i2").tobytes(),
+            self.event_kinds.astype("u1").tobytes(),
+            self.event_sides.astype("i1").tobytes(),
+            text,
+        ]
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, num_frames, num_columns, num_home, num_events = (
+            _HEADER.unpack_from(data)
+        )
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError(f"Not a version {_FORMAT_VERSION} match replay")
+        offset = _HEADER.size
+        home_len, away_len, text_len = struct.unpack_from("<HHI", data, offset)
+        offset += 8
+        home_name = data[offset : offset + home_len].decode()
+        offset += home_len
+        away_name = data[offset : offset + away_len].decode()
+        offset += away_len
+
+        def take(dtype, count):
+            nonlocal offset
+            array = np.frombuffer(data, dtype, count, offset)
+            offset += array.nbytes
+            return array.astype(array.dtype.newbyteorder("="))
+
+        frames = take("<i2", num_frames * num_columns).reshape(num_frames, num_columns)
+        event_frames = take("<i2", num_events)
+        event_kinds = take("u1", num_events)
+        event_sides = take("i1", num_events)
+        text = data[offset : offset + text_len].decode()
+        messages = text.split("\n") if num_events else []
+        return cls(
+            home_name,
+            away_name,
+            num_home,
+            frames,
+            event_frames,
+            event_kinds,
+            event_sides,
+            messages,
+        )
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """Captures a frame from a DynamicMatchEngine after kickoff and after every step."""
+
+    def __init__(self, engine: DynamicMatchEngine):
+        self.engine = engine
+        num_columns = 2 * len(engine.players) + NUM_TRAILING_COLUMNS
+        self.frames = np.empty((MATCH_DURATION_STEPS + 1, num_columns), dtype=np.int16)
+        self.num_frames = 0
+        self.event_frames = []
+        self._events_seen = 0
+        self.capture()
+
+    def capture(self):
+        """Stores the engine's current state as the next frame."""
+        engine = self.engine
+        frame = self.frames[self.num_frames]
+        positions = frame[:-NUM_TRAILING_COLUMNS].reshape(-1, 2)
+        np.rint(engine.state[:, :2], out=positions, casting="unsafe")
+        if engine.ball_x is None or engine.ball_y is None:
+            frame[FRAME_BALL_X] = frame[FRAME_BALL_Y] = NO_POSITION
+        else:
+            frame[FRAME_BALL_X] = round(engine.ball_x)
+            frame[FRAME_BALL_Y] = round(engine.ball_y)
+        frame[FRAME_CARRIER] = engine.ball_carrier.index if engine.ball_carrier else -1
+        frame[FRAME_POSSESSION] = _side(engine, engine.possession_team)
+        frame[FRAME_HOME_SCORE] = engine.home_score
+        frame[FRAME_AWAY_SCORE] = engine.away_score
+        # Events raised since the last capture first show up in this frame
+        self.event_frames.extend(
+            [self.num_frames] * (len(engine.events) - self._events_seen)
+        )
+        self._events_seen = len(engine.events)
+        self.num_frames += 1
+
+    def finish(self) -> MatchReplay:
+        engine = self.engine
+        events = engine.events[: self._events_seen]
+        return MatchReplay(
+            engine.home_team.name,
+            engine.away_team.name,
+            engine.num_home,
+            self.frames[: self.num_frames].copy(),
+            np.array(self.event_frames, dtype=np.int16),
+            np.array(
+                [_EVENT_KIND_CODES[event.kind] for event in events], dtype=np.uint8
+            ),
+            np.array([_side(engine, event.team) for event in events], dtype=np.int8),
+            [event.message for event in events],
+        )
+
+
+def _side(engine, team):
+    if team is None:
+        return SIDE_NONE
+    return SIDE_HOME if team == engine.home_team else SIDE_AWAY
+
+
+def record_match(home_team, away_team, rng=None) -> MatchReplay:
+    """Runs a full dynamic match headlessly. Returns its replay (scores included)."""
+    engine = DynamicMatchEngine(home_team, away_team, rng=rng)
+    recorder = ReplayRecorder(engine)
+    while engine.step():
+        recorder.capture()
+    return recorder.finish()
+
+
+class ReplayPlayerState:
+    """Read-only player view of the current replay frame (x/y like PlayerState)."""
+
+    __slots__ = ("index", "playback", "team")
+
+    def __init__(self, playback, index, team):
+        self.playback = playback
+        self.index = index
+        self.team = team
+
+    @property
+    def x(self):
+        return self.playback.frame.item(2 * self.index)
+
+    @property
+    def y(self):
+        return self.playback.frame.item(2 * self.index + 1)
+
+
+class ReplayPlayback:
+    """
+    Plays a MatchReplay through the same interface MatchView uses on a
+    DynamicMatchEngine (step(), is_finished, minute, scores, ball and player positions,
+    event_callback), without re-running the simulation. seek() jumps to any frame for
+    scrubbing.
+    """
+
+    def __init__(self, replay: MatchReplay, home_team, away_team, event_callback=None):
+        self.replay = replay
+        self.home_team = home_team
+        self.away_team = away_team
+        self.event_callback = event_callback
+        self.players = [
+            ReplayPlayerState(self, i, home_team if i < replay.num_home else away_team)
+            for i in range(replay.num_players)
+        ]
+        self.home_players = self.players[: replay.num_home]
+        self.away_players = self.players[replay.num_home :]
+        self.events: list[MatchEvent] = []
+        self.current_step = 0
+        self.frame = replay.frames[0]
+        self._emit_events(0, 1)  # Kickoff
+
+    @property
+    def is_finished(self):
+        return self.current_step >= self.replay.num_frames - 1
+
+    @property
+    def minute(self):
+        return int((self.current_step / MATCH_DURATION_STEPS) * GAME_DURATION_MINUTES)
+
+    @property
+    def home_score(self):
+        return self.frame.item(FRAME_HOME_SCORE)
+
+    @property
+    def away_score(self):
+        return self.frame.item(FRAME_AWAY_SCORE)
+
+    @property
+    def ball_x(self):
+        value = self.frame.item(FRAME_BALL_X)
+        return None if value == NO_POSITION else value
+
+    @property
+    def ball_y(self):
+        value = self.frame.item(FRAME_BALL_Y)
+        return None if value == NO_POSITION else value
+
+    @property
+    def ball_carrier(self):
+        row = self.frame.item(FRAME_CARRIER)
+        return None if row < 0 else self.players[row]
+
+    @property
+    def possession_team(self):
+        side = self.frame.item(FRAME_POSSESSION)
+        return (
+            None
+            if side == SIDE_NONE
+            else (self.home_team if side == SIDE_HOME else self.away_team)
+        )
+
+    def step(self):
+        """Advances one frame, replaying its events. Returns False at the end."""
+        if self.is_finished:
+            return False
+        self.current_step += 1
+        self.frame = self.replay.frames[self.current_step]
+        self._emit_events(self.current_step, self.current_step + 1)
+        return True
+
+    def seek(self, frame):
+        """Jumps to a frame without replaying the events in between."""
+        self.current_step = max(0, min(frame, self.replay.num_frames - 1))
+        self.frame = self.replay.frames[self.current_step]
+
+    def _emit_events(self, start_frame, end_frame):
+        replay = self.replay
+        for i in replay.events_between(start_frame, end_frame):
+            side = replay.event_sides[i]
+            team = (
+                None
+                if side == SIDE_NONE
+                else (self.home_team if side == SIDE_HOME else self.away_team)
+            )
+            event = MatchEvent(
+                self.current_step,
+                EVENT_KINDS[replay.event_kinds[i]],
+                team,
+                replay.messages[i],
+            )
+            self.events.append(event)
+            if self.event_callback:
+                self.event_callback(event)
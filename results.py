@@ -0,0 +1,155 @@
+# results.py
+from collections import defaultdict
+import numpy as np
+from sim_constants import POINTS_FOR_WIN, POINTS_FOR_DRAW, POINTS_FOR_LOSS
+
+# Columns of ResultsStore.data (one row per result, int32)
+RESULT_COLUMNS = ("fixture", "home", "away", "home_score", "away_score", "matchday")
+COL_FIXTURE, COL_HOME, COL_AWAY, COL_HOME_SCORE, COL_AWAY_SCORE, COL_MATCHDAY = range(
+    len(RESULT_COLUMNS)
+)
+
+
+class ResultsStore:
+    """
+    Append-only match results in columnar int32 arrays, indexed per team and per pair of
+    teams. Teams are small integer ids (League uses their position in league.teams), so
+    a query about one team or one pairing only touches that team's or that pairing's
+    rows.
+    """
+
+    def __init__(self, capacity=256):
+        self.size = 0
+        self.data = np.zeros((capacity, len(RESULT_COLUMNS)), dtype=np.int32)
+        self.by_team = defaultdict(list)  # {team id: [rows, oldest first]}
+        self.by_pair = defaultdict(list)  # {(lower id, higher id): [rows]}
+        self.by_fixture = {}  # {fixture id: row}
+
+    def __len__(self):
+        return self.size
+
+    def append(self, fixture, home, away, home_score, away_score, matchday=0):
+        """Records one result. Returns its row."""
+        if self.size == len(self.data):
+            grown = np.zeros((2 * len(self.data), len(RESULT_COLUMNS)), dtype=np.int32)
+            grown[: self.size] = self.data[: self.size]
+            self.data = grown
+        row = self.size
+        self.data[row] = (fixture, home, away, home_score, away_score, matchday)
+        self.size += 1
+        self._index(row, fixture, home, away)
+        return row
+
+    def extend(self, rows):
+        """Records many results from an (n, len(RESULT_COLUMNS)) array (a snapshot)."""
+        for row in np.asarray(rows, dtype=np.int32).tolist():
+            self.append(*row)
+
+    def _index(self, row, fixture, home, away):
+        self.by_team[home].append(row)
+        self.by_team[away].append(row)
+        self.by_pair[(min(home, away), max(home, away))].append(row)
+        if fixture >= 0:
+            self.by_fixture[fixture] = row
+
+    @property
+    def rows(self):
+        """Every stored result as an (n, len(RESULT_COLUMNS)) view."""
+        return self.data[: self.size]
+
+    def column(self, name):
+        return self.rows[:, RESULT_COLUMNS.index(name)]
+
+    def has_fixture(self, fixture):
+        return fixture in self.by_fixture
+
+    # --- Per-team queries ---
+    def team_rows(self, team, last=None):
+        """Rows involving team, oldest first (only the last `last` if given)."""
+        rows = self.by_team.get(team, [])
+        return rows[-last:] if last else list(rows)
+
+    def _team_view(self, team, rows):
+        """(points for, points against, league points) of team per row, as arrays."""
+        results = self.data[rows]
+        is_home = results[:, COL_HOME] == team
+        scored = np.where(
+            is_home, results[:, COL_HOME_SCORE], results[:, COL_AWAY_SCORE]
+        )
+        conceded = np.where(
+            is_home, results[:, COL_AWAY_SCORE], results[:, COL_HOME_SCORE]
+        )
+        points = np.select(
+            [scored > conceded, scored == conceded],
+            [POINTS_FOR_WIN, POINTS_FOR_DRAW],
+            POINTS_FOR_LOSS,
+        )
+        return scored, conceded, points
+
+    def form(self, team, last=5):
+        """The team's last `last` outcomes, oldest first, e.g. ["W", "L", "D"]."""
+        rows = self.team_rows(team, last)
+        if not rows:
+            return []
+        scored, conceded, _ = self._team_view(team, rows)
+        return [
+            "W" if s > c else "L" if s < c else "D"
+            for s, c in zip(scored.tolist(), conceded.tolist())
+        ]
+
+    def points_history(self, team):
+        """(matchdays, cumulative league points) after each team result, as arrays."""
+        rows = self.team_rows(team)
+        if not rows:
+            return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int64)
+        _, _, points = self._team_view(team, rows)
+        return self.data[rows, COL_MATCHDAY], np.cumsum(points)
+
+    # --- Pairwise queries ---
+    def head_to_head(self, team, opponent):
+        """Team's record against opponent: played, W/D/L, points for/against."""
+        rows = self.by_pair.get((min(team, opponent), max(team, opponent)), [])
+        record = {"played": len(rows), "W": 0, "D": 0, "L": 0, "PF": 0, "PA": 0}
+        if rows:
+            scored, conceded, _ = self._team_view(team, rows)
+            record.update(
+                W=int((scored > conceded).sum()),
+                D=int((scored == conceded).sum()),
+                L=int((scored < conceded).sum()),
+                PF=int(scored.sum()),
+                PA=int(conceded.sum()),
+            )
+        return record
+
+    def mini_league_points(self, teams):
+        """
+        {team: league points} counting only the results between the given teams. Walks
+        each member's own rows, so the cost is the group's results, not every pair of
+        members.
+        """
+        members = set(teams)
+        points = dict.fromkeys(teams, 0)
+        data = self.data
+        for team in members:
+            for row in self.by_team.get(team, ()):
+                # Each result is counted once, from its home team's side
+                if (
+                    data.item(row, COL_HOME) != team
+                    or data.item(row, COL_AWAY) not in members
+                ):
+                    continue
+                away = data.item(row, COL_AWAY)
+                home_score, away_score = (
+                    data.item(row, COL_HOME_SCORE),
+                    data.item(row, COL_AWAY_SCORE),
+                )
+                if home_score > away_score:
+                    points[team] += POINTS_FOR_WIN
+                    points[away] += POINTS_FOR_LOSS
+                elif home_score < away_score:
+                    points[team] += POINTS_FOR_LOSS
+                    points[away] += POINTS_FOR_WIN
+                else:
+                    points[team] += POINTS_FOR_DRAW
+                    points[away] += POINTS_FOR_DRAW
+        return points
@@ -0,0 +1,276 @@
+# season_runner.py
+"""
+Plays whole seasons headlessly and streams every result and the final tables.
+
+    python season_runner.py  # one season, JSON Lines to stdout
+    python season_runner.py --seasons 5 --teams 24 --division-size 12 -o seasons.jsonl
+    python season_runner.py --engine dynamic --workers 4 --format csv -o season.csv
+
+Nothing here imports pygame, so it runs on servers without a display. With the same
+seed, results match the game's: each fixture draws from the same rng stream.
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from sim_constants import LEAGUE_SIZE
+from game_state import Game
+from snapshot import TABLE_COLUMNS
+from match_engine import load_params, simulate_match
+from dynamic_engine import simulate_dynamic_match
+
+ENGINES = {"instant": simulate_match, "dynamic": simulate_dynamic_match}
+FORMATS = ("jsonl", "csv")
+# Columns of the CSV output; each record fills the ones that apply to it
+CSV_FIELDS = (
+    "record",
+    "season",
+    "division",
+    "matchday",
+    "fixture",
+    "home",
+    "away",
+    "home_score",
+    "away_score",
+    "position",
+    "team",
+    *TABLE_COLUMNS,
+    "promoted",
+    "relegated",
+)
+
+
+class RecordWriter:
+    """Writes result/table records as JSON Lines or CSV, flushed as they come."""
+
+    def __init__(self, stream, output_format="jsonl"):
+        self.stream = stream
+        self.output_format = output_format
+        if output_format == "csv":
+            self._csv = csv.DictWriter(
+                stream, CSV_FIELDS, extrasaction="ignore", lineterminator="\n"
+            )
+            self._csv.writeheader()
+
+    def write(self, record):
+        if self.output_format == "csv":
+            self._csv.writerow(
+                {
+                    key: " ".join(value) if isinstance(value, list) else value
+                    for key, value in record.items()
+                }
+            )
+        else:
+            self.stream.write(json.dumps(record) + "\n")
+
+    def flush(self):
+        self.stream.flush()
+
+
+def season_jobs(game):
+    """
+    Every fixture of the current season as (division, fixture index, home id, away id,
+    rng seed), grouped by matchday (all divisions' matchday 1 first). Ids index
+    game.all_teams.
+    """
+    team_ids = {id(team): i for i, team in enumerate(game.all_teams)}
+    divisions = game.league_system.divisions
+    matchdays = []
+    for division_index, division in enumerate(divisions):
+        for fixture_index, (home, away) in enumerate(division.fixtures):
+            matchday = division.matchday(fixture_index) - 1
+            while len(matchdays) <= matchday:
+                matchdays.append([])
+            matchdays[matchday].append(
+                (
+                    division_index,
+                    fixture_index,
+                    team_ids[id(home)],
+                    team_ids[id(away)],
+                    game.fixture_seed(division_index, fixture_index),
+                )
+            )
+    return matchdays
+
+
+# Worker state, set once per process by _init_worker so teams aren't sent with each job
+_worker_teams = None
+_worker_engine = None
+
+
+def _init_worker(teams, engine, params_path):
+    global _worker_teams, _worker_engine
+    _worker_teams, _worker_engine = teams, ENGINES[engine]
+    if params_path:
+        load_params(params_path)
+
+
+def _play_matchday(jobs):
+    """
+    Plays one matchday's jobs.
+    Returns [(division, fixture index, home score, away score)].
+    """
+    return [
+        (
+            division,
+            fixture,
+            *_worker_engine(
+                _worker_teams[home], _worker_teams[away], rng=random.Random(seed)
+            ),
+        )
+        for division, fixture, home, away, seed in jobs
+    ]
+
+
+def play_season(game, writer, season, engine="instant", workers=1, params_path=None):
+    """Plays every division's fixtures, streaming results then final tables."""
+    matchdays = season_jobs(game)
+    divisions = game.league_system.divisions
+    if workers > 1:
+        pool = ProcessPoolExecutor(
+            workers,
+            initializer=_init_worker,
+            initargs=(game.all_teams, engine, params_path),
+        )
+        played = pool.map(_play_matchday, matchdays)
+    else:
+        _init_worker(
+            game.all_teams, engine, None
+        )  # Parameters were already loaded in this process
+        pool, played = None, map(_play_matchday, matchdays)
+    try:
+        for matchday, results in enumerate(played, start=1):
+            for division_index, fixture_index, home_score, away_score in results:
+                division = divisions[division_index]
+                home, away = division.fixtures[fixture_index]
+                division.update_table(home, away, home_score, away_score, fixture_index)
+                writer.write(
+                    {
+                        "record": "result",
+                        "season": season,
+                        "division": division_index,
+                        "matchday": matchday,
+                        "fixture": fixture_index,
+                        "home": home.name,
+                        "away": away.name,
+                        "home_score": home_score,
+                        "away_score": away_score,
+                    }
+                )
+            writer.flush()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    game.current_fixture_index = len(game.league.fixtures)
+
+    for division_index, division in enumerate(divisions):
+        for position, (name, stats) in enumerate(division.get_sorted_table(), start=1):
+            writer.write(
+                {
+                    "record": "table",
+                    "season": season,
+                    "division": division_index,
+                    "position": position,
+                    "team": name,
+                    **{column: stats[column] for column in TABLE_COLUMNS},
+                }
+            )
+    writer.flush()
+    return game
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__.split("\n\n")[1],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--seasons", type=int, default=1, help="seasons to play (default %(default)s)"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="instant",
+        help="match engine (default %(default)s)",
+    )
+    parser.add_argument(
+        "--teams",
+        type=int,
+        default=LEAGUE_SIZE,
+        help="number of teams (default %(default)s)",
+    )
+    parser.add_argument(
+        "--division-size", type=int, help="teams per division (default: one division)"
+    )
+    parser.add_argument(
+        "--seed", type=int, help="season seed (default: random, reported on stderr)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="processes to play matches on (default %(default)s)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="jsonl",
+        help="output format (default %(default)s)",
+    )
+    parser.add_argument("-o", "--output", help="write to this file instead of stdout")
+    parser.add_argument(
+        "--params", help="instant engine parameter file (see calibration.py)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.params:
+        load_params(args.params)
+    try:
+        with contextlib.ExitStack() as stack:
+            stream = (
+                stack.enter_context(open(args.output, "w", newline=""))
+                if args.output
+                else sys.stdout
+            )
+            # The game reports progress with print(); keep stdout for the records
+            stack.enter_context(contextlib.redirect_stdout(sys.stderr))
+            writer = RecordWriter(stream, args.format)
+            game = Game(
+                seed=args.seed, num_teams=args.teams, division_size=args.division_size
+            )
+            print(
+                f"Seed {game.seed}: {args.seasons} season(s) of {args.teams} teams "
+                f"on the {args.engine} engine"
+            )
+            for season in range(1, args.seasons + 1):
+                play_season(
+                    game, writer, season, args.engine, args.workers, args.params
+                )
+                if season < args.seasons:
+                    for upper, promoted, relegated in game.start_next_season(
+                        ENGINES[args.engine]
+                    ):
+                        writer.write(
+                            {
+                                "record": "moves",
+                                "season": season,
+                                "division": upper,
+                                "promoted": promoted,
+                                "relegated": relegated,
+                            }
+                        )
+                    writer.flush()
+    except BrokenPipeError:  # The reader went away (e.g. piped into head): stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+# seeding.py
+import random
+import zlib
+import numpy as np
+
+
+class RandomContext:
+    """
+    Deterministic random streams for one season, all derived from a single season seed.
+    Each stream is keyed (e.g. "teams", or ("match", fixture_index)), so the same key
+    always gives the same numbers no matter which process asks for it or in what order.
+    """
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(
+                63
+            )  # Fresh season, but still reproducible from .seed
+        self.seed = int(seed)
+
+    def seed_sequence(self, *key):
+        """numpy SeedSequence for a key. Strings are hashed, ints are used as-is."""
+        words = [
+            zlib.crc32(part.encode()) if isinstance(part, str) else int(part)
+            for part in key
+        ]
+        return np.random.SeedSequence([self.seed, *words])
+
+    def derive_seed(self, *key):
+        """A 64-bit integer seed for a key (for APIs that take a plain seed)."""
+        return int(self.seed_sequence(*key).generate_state(1, np.uint64)[0])
+
+    def stream(self, *key):
+        """A random.Random for a key (same interface as the random module)."""
+        return random.Random(self.derive_seed(*key))
+
+    def np_stream(self, *key):
+        """A numpy Generator for a key (for vectorized draws)."""
+        return np.random.default_rng(self.seed_sequence(*key))
+
+    def match_rng(self, fixture_index):
+        """The stream a match draws from: only (season seed, fixture index) matter."""
+        return self.stream("match", fixture_index)
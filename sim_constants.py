@@ -0,0 +1,71 @@
+# sim_constants.py
+"""
+Game and match simulation settings: points, league shape, pitch geometry, match length,
+movement and event probabilities. No pygame here, so the engines and headless tools can
+import it; constants.py re-exports everything for the UI.
+"""
+
+# --- Game Settings ---
+POINTS_FOR_WIN = 4
+POINTS_FOR_DRAW = 2
+POINTS_FOR_LOSS = 0
+LEAGUE_SIZE = 6  # Teams in a new game (spread over divisions of DIVISION_SIZE if set)
+DIVISION_SIZE = None  # None = one division with every team
+PROMOTION_PLACES = 2  # Teams swapped between neighbouring divisions each season
+TRY_POINTS = 5
+CONVERSION_POINTS = 2
+PENALTY_POINTS = 3
+
+# --- Match Simulation Settings ---
+# Pitch geometry as plain numbers so the headless match engine never needs pygame.Rect
+PITCH_LEFT = 100
+PITCH_TOP = 80
+PITCH_WIDTH = 600
+PITCH_HEIGHT = 440  # Leaves 80px above and below on the 600px-high screen
+PITCH_RIGHT = PITCH_LEFT + PITCH_WIDTH
+PITCH_BOTTOM = PITCH_TOP + PITCH_HEIGHT
+PITCH_CENTERX = PITCH_LEFT + PITCH_WIDTH // 2
+PITCH_CENTERY = PITCH_TOP + PITCH_HEIGHT // 2
+BALL_RADIUS = 5
+PLAYER_RADIUS = 8
+
+# Time/Step Settings
+GAME_DURATION_MINUTES = 80
+MATCH_DURATION_STEPS = 80 * 4  # 320 steps
+
+# Event Probabilities (Adjusted for more steps)
+BASE_TURNOVER_CHANCE = 0.01
+BASE_PENALTY_CHANCE = 0.008
+CONVERSION_SUCCESS_RATE = 0.70
+PENALTY_SUCCESS_RATE = 0.75
+
+# Movement & Interaction
+PLAYER_DEFAULT_SPEED = 1.5
+PLAYER_SPEED_VARIATION = 0.8
+BALL_SPEED_FACTOR = 1.2
+SUPPORT_DISTANCE = 45  # How far behind/wide support aims for
+DEFENSE_AGGRESSION_RADIUS = 180  # Increased slightly?
+TACKLE_RADIUS = PLAYER_RADIUS * 2.5
+TACKLE_SUCCESS_BASE = 0.40
+TACKLE_STRENGTH_INFLUENCE = 0.01
+TACKLE_SPEED_INFLUENCE = 0.005
+
+# --- NEW/ADJUSTED Formation/Positioning Constants ---
+ATTACKING_SUPPORT_WIDTH = 35  # How wide support players try to spread
+DEFENSIVE_LINE_Y_OFFSET = (
+    20  # How far 'ahead' (towards attacker goal) def line tries to sit
+)
+DEFENSIVE_LINE_SPACING = 40  # Horizontal space between defenders in the line
+SWEEPER_DEPTH_OFFSET = 60  # How far behind the main line the sweeper sits
+
+# Passing Constants
+PASS_PRESSURE_RADIUS = TACKLE_RADIUS * 2.0
+BASE_PASS_CHANCE = 0.02
+PASS_PRESSURE_BONUS = 0.08
+PASS_MAX_DISTANCE = 100
+PASS_Y_TOLERANCE = 5
+PASS_SUCCESS_BASE = 0.85
+PASS_ACCURACY_INFLUENCE = 0.008
+PASS_DISTANCE_PENALTY = 0.003
+PASS_INTERCEPTION_BASE_CHANCE = 0.01
+PASS_INTERCEPTION_RADIUS = 35
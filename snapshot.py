@@ -0,0 +1,248 @@
+# snapshot.py
+"""
+Versioned binary snapshots of a whole Game.
+
+Layout: a fixed header (magic, format version, metadata length), a JSON metadata block
+(seeds, counters, team names, and where each array lives), then raw little-endian NumPy
+arrays, each aligned to ARRAY_ALIGNMENT bytes. Players are stored column-wise straight
+from the PlayerStore; teams, fixtures and results refer to each other by integer ids.
+With use_mmap=True the arrays are views onto a copy-on-write memory map of the file, so
+even very large worlds open without reading the player data up front.
+"""
+
+import json
+import mmap
+import os
+import struct
+import numpy as np
+from game_state import Game
+from league import League, LeagueSystem
+from player import ATTRIBUTE_COLUMNS, PlayerStore
+from results import RESULT_COLUMNS
+from seeding import RandomContext
+from team import Team
+
+SNAPSHOT_MAGIC = b"RGSN"
+SNAPSHOT_VERSION = 3  # 2: results store rows, 3: last_fixture_index
+ARRAY_ALIGNMENT = 64
+TABLE_COLUMNS = ("P", "W", "D", "L", "PF", "PA", "PD", "Pts")
+_HEADER = struct.Struct("<4sHHI")  # magic, version, reserved, metadata length
+_NAME_SEPARATOR = "\0"
+
+
+def save_game(game: Game, path):
+    """
+    Writes a snapshot of game to path, atomically: a half-written file never
+    replaces a good one.
+    """
+    store = game.player_store
+    team_ids = {id(team): i for i, team in enumerate(game.all_teams)}
+    divisions = game.league_system.divisions
+
+    rosters = [team.players for team in game.all_teams]
+    if any(player.store is not store for roster in rosters for player in roster):
+        raise ValueError("Every player must live in game.player_store to be saved")
+    fixtures = [
+        [(team_ids[id(home)], team_ids[id(away)]) for home, away in division.fixtures]
+        for division in divisions
+    ]
+    # Results are saved as each division's ResultsStore rows (division-local team ids)
+    results = [division.results_store.rows for division in divisions]
+    division_teams = [
+        [team_ids[id(team)] for team in division.teams] for division in divisions
+    ]
+
+    arrays = {
+        "player_attributes": store.attributes[: store.size],
+        "player_positions": store.position_codes[: store.size],
+        "player_names": np.frombuffer(
+            _NAME_SEPARATOR.join(store.names).encode(), dtype=np.uint8
+        ),
+        "roster_offsets": _offsets(len(roster) for roster in rosters),
+        "roster_rows": np.fromiter(
+            (p.index for roster in rosters for p in roster), dtype=np.int32
+        ),
+        "division_offsets": _offsets(len(teams) for teams in division_teams),
+        "division_teams": np.array(
+            [i for teams in division_teams for i in teams], dtype=np.int32
+        ),
+        "tables": np.array(
+            [
+                [division.table[team.name][column] for column in TABLE_COLUMNS]
+                for division in divisions
+                for team in division.teams
+            ],
+            dtype=np.int32,
+        ).reshape(-1, len(TABLE_COLUMNS)),
+        "fixture_offsets": _offsets(len(f) for f in fixtures),
+        "fixtures": np.array(
+            [f for division in fixtures for f in division], dtype=np.int32
+        ).reshape(-1, 2),
+        "result_offsets": _offsets(len(r) for r in results),
+        "results": np.concatenate(results)
+        .astype(np.int32)
+        .reshape(-1, len(RESULT_COLUMNS)),
+    }
+    metadata = {
+        "seed": game.seed,
+        "season_seed": game.random.seed,
+        "season": game.league_system.season,
+        "promotion_places": game.league_system.promotion_places,
+        "current_fixture_index": game.current_fixture_index,
+        "last_match_result": game.last_match_result,
+        "last_fixture_index": game.last_fixture_index,
+        "player_team": team_ids.get(id(game.player_team)),
+        "team_names": [team.name for team in game.all_teams],
+        "player_controlled": [
+            i for i, team in enumerate(game.all_teams) if team.player_controlled
+        ],
+        "positions": store.positions,
+        "attribute_columns": list(ATTRIBUTE_COLUMNS),
+        "result_columns": list(RESULT_COLUMNS),
+        "arrays": {},
+    }
+
+    # Array offsets depend on the metadata length, which depends on the offsets: lay
+    # out the arrays relative to the data start, then fix it once the JSON is known
+    relative, position = {}, 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<"))
+        arrays[name] = array
+        relative[name] = position
+        position = _align(position + array.nbytes)
+    data_start = 0
+    while True:
+        metadata["arrays"] = {
+            name: [data_start + relative[name], array.dtype.str, list(array.shape)]
+            for name, array in arrays.items()
+        }
+        encoded = json.dumps(metadata).encode()
+        needed = _align(_HEADER.size + len(encoded))
+        if needed == data_start:
+            break
+        data_start = needed
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0, len(encoded)))
+        f.write(encoded)
+        for name, array in arrays.items():
+            f.write(b"\0" * (metadata["arrays"][name][0] - f.tell()))
+            f.write(array.tobytes())
+    os.replace(temp_path, path)
+
+
+def load_game(path, use_mmap=True) -> Game:
+    """Loads a save_game snapshot. Edits to the loaded game never touch the file."""
+    with open(path, "rb") as f:
+        if use_mmap:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        else:
+            buffer = bytearray(f.read())
+    magic, version, _, metadata_length = _HEADER.unpack_from(buffer)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError(f"{path} is not a game snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(
+            f"Unsupported snapshot version {version} (expected {SNAPSHOT_VERSION})"
+        )
+    metadata = json.loads(bytes(buffer[_HEADER.size : _HEADER.size + metadata_length]))
+    if tuple(metadata["attribute_columns"]) != ATTRIBUTE_COLUMNS:
+        raise ValueError(
+            "Snapshot player columns do not match this version of the game"
+        )
+    arrays = {
+        name: _array(buffer, offset, np.dtype(dtype), shape)
+        for name, (offset, dtype, shape) in metadata["arrays"].items()
+    }
+
+    # Players: the store's columns are the mapped arrays themselves
+    store = PlayerStore(capacity=1)
+    store.attributes = arrays["player_attributes"]
+    store.position_codes = arrays["player_positions"]
+    store.size = len(store.attributes)
+    store.names = (
+        arrays["player_names"].tobytes().decode().split(_NAME_SEPARATOR)
+        if store.size
+        else []
+    )
+    store.positions = list(metadata["positions"])
+    store._position_codes = {
+        position: code for code, position in enumerate(store.positions)
+    }
+
+    controlled = set(metadata["player_controlled"])
+    roster_offsets, roster_rows = (
+        arrays["roster_offsets"],
+        arrays["roster_rows"].tolist(),
+    )
+    teams = [
+        Team(
+            name,
+            player_controlled=i in controlled,
+            players=store.players(
+                roster_rows[roster_offsets[i] : roster_offsets[i + 1]]
+            ),
+        )
+        for i, name in enumerate(metadata["team_names"])
+    ]
+
+    divisions = []
+    division_offsets = arrays["division_offsets"]
+    division_teams = arrays["division_teams"].tolist()
+    tables = arrays["tables"].tolist()
+    for d in range(len(division_offsets) - 1):
+        start, end = division_offsets[d], division_offsets[d + 1]
+        members = [teams[i] for i in division_teams[start:end]]
+        fixtures = _slice(arrays["fixtures"], arrays["fixture_offsets"], d)
+        league = League(
+            members, fixtures=[(teams[home], teams[away]) for home, away in fixtures]
+        )
+        for team, row in zip(members, tables[start:end]):
+            league.table[team.name] = dict(zip(TABLE_COLUMNS, row))
+        league.results_store.extend(
+            _slice(arrays["results"], arrays["result_offsets"], d)
+        )
+        league._rebuild_standings()
+        divisions.append(league)
+
+    league_system = LeagueSystem.from_divisions(
+        divisions, metadata["promotion_places"], metadata["season"]
+    )
+    player_team = (
+        teams[metadata["player_team"]] if metadata["player_team"] is not None else None
+    )
+    last_result = metadata["last_match_result"]
+    return Game.from_parts(
+        RandomContext(metadata["season_seed"]),
+        metadata["seed"],
+        store,
+        teams,
+        player_team,
+        league_system,
+        metadata["current_fixture_index"],
+        tuple(last_result) if last_result is not None else None,
+        metadata["last_fixture_index"],
+    )
+
+
+def _array(buffer, offset, dtype, shape):
+    count = int(np.prod(shape))
+    if count == 0:  # Empty arrays may sit past the end of the file
+        return np.empty(shape, dtype=dtype)
+    return np.frombuffer(buffer, dtype, count, offset).reshape(shape)
+
+
+def _offsets(lengths):
+    """[0, l0, l0 + l1, ...] as int64, for slicing concatenated per-item arrays."""
+    return np.concatenate(([0], np.cumsum(list(lengths), dtype=np.int64))).astype(
+        np.int64
+    )
+
+
+def _slice(array, offsets, i):
+    return array[offsets[i] : offsets[i + 1]].tolist()
+
+
+def _align(position):
+    return -(-position // ARRAY_ALIGNMENT) * ARRAY_ALIGNMENT
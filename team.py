@@ -1,46 +1,258 @@
-from player import generate_player
+from player import ATTRIBUTE_COLUMNS, Player, generate_players
+from match_engine import compute_ratings, compute_store_ratings, ratings_to_array
+import numpy as np
 import random
 
 
+class Roster(list):
+    """A team's player list that counts its own modifications (for cached ratings)."""
+
+    # Class default also covers unpickling, which appends before restoring __dict__
+    version = 0
+
+
+def _counted(method_name):
+    method = getattr(list, method_name)
+
+    def mutator(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.version += 1
+        return result
+
+    mutator.__name__ = method_name
+    return mutator
+
+
+for _method_name in (
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+):
+    setattr(Roster, _method_name, _counted(_method_name))
+
+
+# Simplified positions for MVP: the 15 players of a starting squad
+SQUAD_POSITIONS = (
+    ["Prop"] * 2
+    + ["Hooker"]
+    + ["Lock"] * 2
+    + ["Flanker"] * 2
+    + ["Number 8"]
+    + ["Scrum-half"]
+    + ["Fly-half"]
+    + ["Centre"] * 2
+    + ["Wing"] * 2
+    + ["Fullback"]
+)
+
+# Real clubs used first when naming teams
+TEAM_NAMES = [
+    "Harlequins",
+    "Saracens",
+    "Leicester Tigers",
+    "Exeter Chiefs",
+    "Northampton Saints",
+    "Sale Sharks",
+    "Bath Rugby",
+    "Bristol Bears",
+]
+# Building blocks for generated team names in larger leagues
+PLACE_NAMES = [
+    "Ashford",
+    "Barnstaple",
+    "Bedford",
+    "Blackheath",
+    "Cambridge",
+    "Canterbury",
+    "Carlisle",
+    "Chester",
+    "Coventry",
+    "Darlington",
+    "Doncaster",
+    "Durham",
+    "Ealing",
+    "Esher",
+    "Fylde",
+    "Gloucester",
+    "Harrogate",
+    "Hartpury",
+    "Hull",
+    "Ipswich",
+    "Jersey",
+    "Kendal",
+    "Lancaster",
+    "Lichfield",
+    "Luton",
+    "Macclesfield",
+    "Newbury",
+    "Norwich",
+    "Nottingham",
+    "Otley",
+    "Oxford",
+    "Penzance",
+    "Plymouth",
+    "Reading",
+    "Richmond",
+    "Rosslyn",
+    "Sedgley",
+    "Taunton",
+    "Truro",
+    "Wakefield",
+    "Wasps",
+    "Worcester",
+    "York",
+]
+NICKNAMES = [
+    "Albions",
+    "Badgers",
+    "Bees",
+    "Blues",
+    "Bulls",
+    "Chargers",
+    "Comets",
+    "Corinthians",
+    "Crusaders",
+    "Eagles",
+    "Falcons",
+    "Foxes",
+    "Griffins",
+    "Hawks",
+    "Hornets",
+    "Knights",
+    "Lions",
+    "Otters",
+    "Panthers",
+    "Pirates",
+    "Rams",
+    "Ravens",
+    "Rovers",
+    "Stags",
+    "Titans",
+    "Vikings",
+    "Warriors",
+    "Wolves",
+]
+
+
 class Team:
     """Represents a rugby team."""
 
-    def __init__(self, name, player_controlled=False):
+    def __init__(
+        self, name, player_controlled=False, rng=random, players=None, store=None
+    ):
         self.name = name
         self.players = []
         self.player_controlled = player_controlled
-        self._generate_initial_squad()  # Populate with players
-
-    def _generate_initial_squad(self):
-        """Generates a basic squad of 15 players for MVP."""
-        # Simplified positions for MVP
-        positions = (
-            ["Prop"] * 2
-            + ["Hooker"]
-            + ["Lock"] * 2
-            + ["Flanker"] * 2
-            + ["Number 8"]
-            + ["Scrum-half"]
-            + ["Fly-half"]
-            + ["Centre"] * 2
-            + ["Wing"] * 2
-            + ["Fullback"]
+        # (roster, roster version, Player.attribute_epoch) of the cached ratings
+        self._ratings_key = None
+        self._ratings = None
+        self._rating_vector = None
+        self._rows_key = (
+            None  # (roster, roster version) the cached store rows were taken from
+        )
+        self._store = None
+        self._player_indices = None
+        if players is None:
+            self._generate_initial_squad(rng, store)  # Populate with players
+        else:
+            self.players = players
+
+    @property
+    def players(self):
+        return self._players
+
+    @players.setter
+    def players(self, players):
+        self._players = Roster(players)
+
+    @property
+    def player_store(self):
+        """The PlayerStore holding the whole roster (None if it spans several)."""
+        self._refresh_rows()
+        return self._store
+
+    @property
+    def player_indices(self):
+        """The roster's rows in player_store (None without a common store)."""
+        self._refresh_rows()
+        return self._player_indices
+
+    def _refresh_rows(self):
+        roster = self._players
+        if (
+            self._rows_key is not None
+            and self._rows_key[0] is roster
+            and self._rows_key[1] == roster.version
+        ):
+            return
+        stores = {
+            id(getattr(player, "store", None)): getattr(player, "store", None)
+            for player in roster
+        }
+        if len(stores) == 1 and None not in stores.values():
+            self._store = next(iter(stores.values()))
+            self._player_indices = np.fromiter(
+                (p.index for p in roster), dtype=np.intp, count=len(roster)
+            )
+        else:
+            self._store = self._player_indices = None
+        self._rows_key = (roster, roster.version)
+
+    def _ratings_are_current(self):
+        key = self._ratings_key
+        return (
+            key is not None
+            and key[0] is self._players
+            and key[1] == self._players.version
+            and key[2] == Player.attribute_epoch
         )
 
-        self.players = [generate_player(pos) for pos in positions]
+    def get_ratings(self):
+        """Attack/defense/kicking ratings, recomputed only after the roster changes."""
+        if not self._ratings_are_current():
+            store = self.player_store
+            if store is not None:
+                self._ratings = compute_store_ratings(store, self._player_indices)
+            else:
+                self._ratings = compute_ratings(self._players)
+            self._rating_vector = ratings_to_array(self._ratings)
+            self._ratings_key = (
+                self._players,
+                self._players.version,
+                Player.attribute_epoch,
+            )
+        return self._ratings
+
+    def get_rating_vector(self):
+        """get_ratings as a float array in match_engine.RATING_KEYS order."""
+        self.get_ratings()
+        return self._rating_vector
+
+    def _generate_initial_squad(self, rng=random, store=None):
+        """Generates a basic squad of 15 players (into store, default PLAYER_STORE)."""
+        self.players = generate_players(SQUAD_POSITIONS, rng, store)
 
     def get_average_skill(self):
         """Calculates the average overall skill level of the team (derived from attributes)."""
-        if not self.players:
-            return 0
-        # Use the derived 'skill' attribute from Player class
-        total_skill = sum(player.skill for player in self.players)
-        return total_skill / len(self.players)
+        return self.get_average_attribute("skill")
 
     def get_average_attribute(self, attribute_name):
         """Calculates the average of a specific attribute for the team."""
         if not self.players:
             return 0
+        store = self.player_store
+        if store is not None and attribute_name in ATTRIBUTE_COLUMNS:
+            # Column reduction over the squad's rows
+            return float(store.column(attribute_name, self._player_indices).mean())
         try:
             total_attribute = sum(
                 getattr(player, attribute_name) for player in self.players
@@ -54,24 +266,46 @@ class Team:
         return self.name
 
 
-# --- Helper function to create placeholder teams ---
-def create_initial_teams(num_teams=4):
-    """Creates a list of initial teams for the league."""
-    team_names = [
-        "Harlequins",
-        "Saracens",
-        "Leicester Tigers",
-        "Exeter Chiefs",
-        "Northampton Saints",
-        "Sale Sharks",
-        "Bath Rugby",
-        "Bristol Bears",
+# --- Helper functions to create placeholder teams ---
+def generate_team_names(count, rng=random):
+    """
+    Returns `count` unique team names. The real clubs in TEAM_NAMES come first
+    (shuffled); bigger leagues add generated "<place> <nickname>" names, numbered once
+    those run out.
+    """
+    names = list(TEAM_NAMES)
+    rng.shuffle(names)
+    if count <= len(names):
+        return names[:count]
+    generated = [
+        f"{place} {nickname}" for place in PLACE_NAMES for nickname in NICKNAMES
     ]
-    random.shuffle(team_names)  # Use different teams each time
+    rng.shuffle(generated)
+    names.extend(generated)
+    extra_round = 2
+    while (
+        len(names) < count
+    ):  # Every combination used: go round again as "<name> 2", "<name> 3", ...
+        names.extend(f"{name} {extra_round}" for name in generated)
+        extra_round += 1
+    return names[:count]
 
-    if num_teams > len(team_names):
-        num_teams = len(team_names)
 
-    teams = [Team(team_names[0], player_controlled=True)]  # First team is player's
-    teams.extend([Team(team_names[i]) for i in range(1, num_teams)])
+def create_initial_teams(num_teams=4, rng=random, store=None):
+    """
+    Creates a list of initial teams for the league (rng: random module or a seeded
+    random.Random). Players go into store (a PlayerStore; default player.PLAYER_STORE).
+    """
+    team_names = generate_team_names(num_teams, rng)
+    # All squads in one bulk call, then handed out a squad per team
+    squad_size = len(SQUAD_POSITIONS)
+    players = generate_players(SQUAD_POSITIONS * num_teams, rng, store)
+    teams = [
+        Team(
+            name,
+            player_controlled=(i == 0),
+            players=players[i * squad_size : (i + 1) * squad_size],
+        )
+        for i, name in enumerate(team_names)
+    ]  # First team is player's
     return teams
@@ -0,0 +1,17 @@
+import pytest
+
+from game_state import Game
+
+
+def test_next_season_needs_the_season_played_out():
+    game = Game(seed=3, num_teams=8, division_size=4)
+    game.play_next_match_instant()
+    with pytest.raises(ValueError, match="season isn't over"):
+        game.start_next_season()
+    assert game.league_system.season == 1
+
+    while game.play_next_match_instant():
+        pass
+    game.start_next_season()
+    assert game.league_system.season == 2
+    assert game.current_fixture_index == 0
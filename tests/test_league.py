@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+from league import League
+from team import Team
+
+
+@pytest.fixture
+def league():
+    rng = random.Random(0)
+    league = League(
+        [Team(name, rng=rng) for name in ["Alpha", "Bravo", "Charlie", "Delta"]], rng
+    )
+    for fixture_index, (home, away) in enumerate(league.fixtures[:4]):
+        league.update_table(home, away, 10 + fixture_index, 12, fixture_index)
+    return league
+
+
+def test_projection_with_zero_runs(league):
+    projection = league.project_season(n_runs=0, seed=1)
+    assert set(projection) == set(league.table)
+    for team in projection.values():
+        assert team == {"positions": [0.0] * 4, "expected_points": 0.0}
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_projection_merges_every_run(league, workers):
+    projection = league.project_season(n_runs=7, workers=workers, seed=1)
+    assert projection == league.project_season(n_runs=7, workers=workers, seed=1)
+    for name, team in projection.items():
+        assert sum(team["positions"]) == pytest.approx(1.0)
+        assert team["expected_points"] >= league.table[name]["Pts"]
+    for position in range(4):
+        assert sum(
+            team["positions"][position] for team in projection.values()
+        ) == pytest.approx(1.0)
@@ -0,0 +1,97 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from proximity import ProximityIndex
+
+NUM_PLAYERS = 30
+HOME = slice(0, 15)
+AWAY = slice(15, 30)
+
+
+def brute_distance(points, i, j):
+    return math.hypot(points[i][0] - points[j][0], points[i][1] - points[j][1])
+
+
+def row_list(rows):
+    return list(range(NUM_PLAYERS))[rows] if isinstance(rows, slice) else list(rows)
+
+
+@pytest.fixture(params=[0, 1, 2])
+def points(request):
+    rng = random.Random(request.param)
+    return [(rng.uniform(100, 160), rng.uniform(80, 140)) for _ in range(NUM_PLAYERS)]
+
+
+@pytest.fixture
+def index(points):
+    xs, ys = zip(*points)
+    return ProximityIndex(xs, ys)
+
+
+ROWS = [HOME, AWAY, slice(None), [3, 17, 8, 29, 0]]
+
+
+def test_distances_match_brute_force(points, index):
+    for i in range(NUM_PLAYERS):
+        for j in range(NUM_PLAYERS):
+            assert index.distance(i, j) == pytest.approx(brute_distance(points, i, j))
+        expected = [brute_distance(points, i, j) for j in row_list(AWAY)]
+        np.testing.assert_allclose(index.distances(i, AWAY), expected)
+
+
+@pytest.mark.parametrize("rows", ROWS)
+@pytest.mark.parametrize("radius", [0.5, 5, 12.5, 40])
+def test_within_matches_brute_force(points, index, rows, radius):
+    for i in range(NUM_PLAYERS):
+        expected = [j for j in row_list(rows) if brute_distance(points, i, j) < radius]
+        assert index.within(i, radius, rows).tolist() == expected
+
+
+@pytest.mark.parametrize("rows", ROWS)
+def test_nearest_matches_brute_force(points, index, rows):
+    for i in range(NUM_PLAYERS):
+        candidates = [j for j in row_list(rows) if j != i]
+        nearest, distance = index.nearest(i, rows, exclude=i)
+        expected = min(candidates, key=lambda j: brute_distance(points, i, j))
+        assert nearest == expected
+        assert distance == pytest.approx(brute_distance(points, i, expected))
+
+
+@pytest.mark.parametrize("rows", ROWS)
+@pytest.mark.parametrize("k", [1, 3, 40])
+def test_k_nearest_matches_brute_force(points, index, rows, k):
+    for i in range(NUM_PLAYERS):
+        candidates = [j for j in row_list(rows) if j != i]
+        expected = sorted(candidates, key=lambda j: brute_distance(points, i, j))[:k]
+        assert index.k_nearest(i, k, rows, exclude=i).tolist() == expected
+
+
+@pytest.mark.parametrize("rows", ROWS)
+def test_nearest_to_point_matches_brute_force(points, index, rows):
+    for x, y in [(100, 80), (131.5, 107.25), (300, 300)]:
+        expected = min(
+            row_list(rows), key=lambda j: math.hypot(points[j][0] - x, points[j][1] - y)
+        )
+        nearest, distance = index.nearest_to_point(x, y, rows)
+        assert nearest == expected
+        assert distance == pytest.approx(
+            math.hypot(points[expected][0] - x, points[expected][1] - y)
+        )
+
+
+def test_ties_keep_row_order():
+    # Players 1-4 are all 3 away from player 0
+    index = ProximityIndex([0, 3, 0, -3, 0, 10], [0, 0, 3, 0, -3, 0])
+    assert index.k_nearest(0, 3, slice(None), exclude=0).tolist() == [1, 2, 3]
+    assert index.k_nearest(0, 3, [4, 3, 5, 2], exclude=0).tolist() == [4, 3, 2]
+    assert index.nearest(0, [5, 3, 1], exclude=0) == (3, 3.0)
+    assert index.within(0, 3, slice(None)).tolist() == [0]
+
+
+def test_nearest_with_nobody_left():
+    index = ProximityIndex([1.0, 2.0], [1.0, 2.0])
+    assert index.nearest(0, [0], exclude=0) == (None, float("inf"))
+    assert index.k_nearest(0, 3, slice(0, 1), exclude=0).tolist() == []
@@ -0,0 +1,132 @@
+import random
+
+import numpy as np
+
+from league import League
+from results import ResultsStore
+from sim_constants import POINTS_FOR_DRAW, POINTS_FOR_LOSS, POINTS_FOR_WIN
+from team import Team
+
+# (fixture, home, away, home score, away score, matchday), teams 0-3
+RESULTS = [
+    (0, 0, 1, 20, 10, 1),
+    (1, 2, 3, 7, 7, 1),
+    (2, 1, 2, 15, 3, 2),
+    (3, 3, 0, 12, 9, 2),
+    (4, 1, 0, 10, 10, 3),
+]
+
+
+def make_store(capacity=2):
+    store = ResultsStore(capacity)  # Small, so appending has to grow it
+    for result in RESULTS:
+        store.append(*result)
+    return store
+
+
+def make_league(names):
+    rng = random.Random(0)
+    return League([Team(name, rng=rng) for name in names], rng)
+
+
+def play(league, results):
+    teams = {team.name: team for team in league.teams}
+    for home, away, home_score, away_score in results:
+        league.update_table(teams[home], teams[away], home_score, away_score)
+
+
+def test_store_rows_and_indexes():
+    store = make_store()
+    assert len(store) == len(RESULTS)
+    assert store.rows.tolist() == [list(result) for result in RESULTS]
+    assert store.column("away_score").tolist() == [10, 7, 3, 9, 10]
+    assert store.by_team == {0: [0, 3, 4], 1: [0, 2, 4], 2: [1, 2], 3: [1, 3]}
+    assert store.by_pair == {(0, 1): [0, 4], (2, 3): [1], (1, 2): [2], (0, 3): [3]}
+    assert store.has_fixture(3) and not store.has_fixture(5)
+    assert store.team_rows(0, last=2) == [3, 4]
+
+
+def test_extend_matches_append():
+    store = ResultsStore()
+    store.extend(np.array(RESULTS))
+    assert store.rows.tolist() == make_store().rows.tolist()
+    assert store.by_pair == make_store().by_pair
+
+
+def test_team_queries():
+    store = make_store()
+    assert store.form(0) == ["W", "L", "D"]
+    assert store.form(0, last=1) == ["D"]
+    assert store.form(3) == ["D", "W"]
+    matchdays, points = store.points_history(0)
+    assert matchdays.tolist() == [1, 2, 3]
+    assert points.tolist() == [
+        POINTS_FOR_WIN,
+        POINTS_FOR_WIN + POINTS_FOR_LOSS,
+        POINTS_FOR_WIN + POINTS_FOR_LOSS + POINTS_FOR_DRAW,
+    ]
+    assert store.form(9) == []
+
+
+def test_head_to_head():
+    store = make_store()
+    assert store.head_to_head(0, 1) == {
+        "played": 2,
+        "W": 1,
+        "D": 1,
+        "L": 0,
+        "PF": 30,
+        "PA": 20,
+    }
+    assert store.head_to_head(1, 0) == {
+        "played": 2,
+        "W": 0,
+        "D": 1,
+        "L": 1,
+        "PF": 20,
+        "PA": 30,
+    }
+    assert store.head_to_head(0, 2)["played"] == 0
+
+
+def test_mini_league_points_only_counts_results_between_members():
+    store = make_store()
+    assert store.mini_league_points([0, 1]) == {
+        0: POINTS_FOR_WIN + POINTS_FOR_DRAW,
+        1: POINTS_FOR_LOSS + POINTS_FOR_DRAW,
+    }
+    assert store.mini_league_points([0, 1, 2]) == {
+        0: POINTS_FOR_WIN + POINTS_FOR_DRAW,
+        1: POINTS_FOR_LOSS + POINTS_FOR_DRAW + POINTS_FOR_WIN,
+        2: POINTS_FOR_LOSS,
+    }
+    assert store.mini_league_points([0, 2]) == {0: 0, 2: 0}
+
+
+def test_head_to_head_breaks_points_and_difference_ties():
+    league = make_league(["Alpha", "Bravo", "Charlie"])
+    # Alpha and Bravo finish level on points and difference; Bravo won their meeting
+    play(league, [("Bravo", "Alpha", 10, 5), ("Alpha", "Charlie", 20, 10)])
+    assert [name for name, _ in league.get_sorted_table()] == [
+        "Bravo",
+        "Alpha",
+        "Charlie",
+    ]
+
+
+def test_points_for_then_table_order_break_level_mini_leagues():
+    league = make_league(["Charlie", "Bravo", "Alpha"])
+    # A three-way tie with a level mini-league: Points For, then table order decide
+    play(
+        league,
+        [
+            ("Alpha", "Bravo", 20, 15),
+            ("Bravo", "Charlie", 10, 5),
+            ("Charlie", "Alpha", 10, 5),
+        ],
+    )
+    table = league.get_sorted_table()
+    assert {(stats["Pts"], stats["PD"]) for _, stats in table} == {
+        (POINTS_FOR_WIN + POINTS_FOR_LOSS, 0)
+    }
+    assert [name for name, _ in table] == ["Bravo", "Alpha", "Charlie"]
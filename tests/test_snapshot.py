@@ -0,0 +1,71 @@
+import pytest
+
+from game_state import Game
+from snapshot import load_game, save_game
+
+
+def names(fixtures):
+    return [(home.name, away.name) for home, away in fixtures]
+
+
+def state(game):
+    """Everything a season depends on, as plain values."""
+    return {
+        "season": game.league_system.season,
+        "current_fixture_index": game.current_fixture_index,
+        "last_match_result": game.last_match_result,
+        "last_fixture": names([game.last_fixture()]) if game.last_fixture() else None,
+        "player_team": game.player_team.name if game.player_team else None,
+        "divisions": [
+            {
+                "teams": [team.name for team in division.teams],
+                "fixtures": names(division.fixtures),
+                "table": division.get_sorted_table(),
+                "results": division.results_store.rows.tolist(),
+            }
+            for division in game.league_system.divisions
+        ],
+        "attributes": game.player_store.attributes[: len(game.player_store)].tolist(),
+    }
+
+
+def play_season_out(game):
+    while game.play_next_match_instant():
+        pass
+    return game.start_next_season()
+
+
+@pytest.fixture
+def game():
+    game = Game(seed=7, num_teams=8, division_size=4)
+    for _ in range(3):
+        game.play_next_match_instant()
+    return game
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_round_trip_restores_the_game(game, tmp_path, use_mmap):
+    path = tmp_path / "game.snap"
+    save_game(game, path)
+    loaded = load_game(path, use_mmap=use_mmap)
+    assert loaded.seed == game.seed
+    assert state(loaded) == state(game)
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_loaded_game_plays_into_the_same_next_season(game, tmp_path, use_mmap):
+    path = tmp_path / "game.snap"
+    save_game(game, path)
+    loaded = load_game(path, use_mmap=use_mmap)
+
+    assert play_season_out(loaded) == play_season_out(game)
+    assert state(loaded) == state(game)
+    # Playing the loaded game never writes back to the file
+    assert state(load_game(path)) != state(loaded)
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not_a_snapshot"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError, match="not a game snapshot"):
+        load_game(path)
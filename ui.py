@@ -1,7 +1,40 @@
 # ui.py
+import functools
+import weakref
 import pygame
 from constants import *  # Import all constants
 
+# How many distinct (text, font, color) surfaces to keep around
+TEXT_CACHE_SIZE = 1024
+
+# Pre-rendered surfaces that never change, keyed by name (see get_static_surface)
+_static_surfaces = {}
+# Rendered league tables: {league: (table_version, surface)}, dropped with the league
+_league_table_cache = weakref.WeakKeyDictionary()
+
+LEAGUE_TABLE_COL_WIDTHS = [150, 30, 30, 30, 30, 40, 40, 40, 40]  # Adjust as needed
+LEAGUE_TABLE_LINE_HEIGHT = FONT_SMALL_SIZE + 5
+
+
+# --- RENDER CACHES ---
+@functools.lru_cache(maxsize=TEXT_CACHE_SIZE)
+def render_text(text, font, color):
+    """Renders a text surface once per (text, font, color); shared, so only blit it."""
+    return font.render(text, True, color)
+
+
+def get_static_surface(key, size, paint, like=None):
+    """
+    Returns a surface of `size` that paint(surface) draws on once; later calls reuse it.
+    `like` is a surface whose pixel format should be matched (usually the screen).
+    """
+    cached = _static_surfaces.get(key)
+    if cached is None or cached.get_size() != tuple(size):
+        cached = pygame.Surface(size, 0, like) if like else pygame.Surface(size)
+        paint(cached)
+        _static_surfaces[key] = cached
+    return cached
+
 
 # --- CORE DRAWING FUNCTION ---
 def draw_text(surface, text, pos, font=FONT_DEFAULT, color=BLACK, center=False):
@@ -11,7 +44,7 @@ def draw_text(surface, text, pos, font=FONT_DEFAULT, color=BLACK, center=False):
         pygame.font.init()
 
     try:
-        text_surface = font.render(text, True, color)
+        text_surface = render_text(text, font, tuple(color))
         text_rect = text_surface.get_rect()
         if center:
             text_rect.center = pos
@@ -33,11 +66,32 @@ def draw_text(surface, text, pos, font=FONT_DEFAULT, color=BLACK, center=False):
 
 
 def draw_league_table(surface, league, start_pos):
-    """Draws the league table."""
+    """Draws the league table, reusing the render until league.table_version changes."""
+    version = getattr(league, "table_version", None)
+    cached = _league_table_cache.get(league) if version is not None else None
+    if cached is None or cached[0] != version:
+        table_surface = pygame.Surface(
+            (
+                sum(LEAGUE_TABLE_COL_WIDTHS),
+                (len(league.teams) + 2) * LEAGUE_TABLE_LINE_HEIGHT,
+            ),
+            0,
+            surface,
+        )
+        table_surface.fill(WHITE)  # Opaque: the league screen background is white
+        _draw_league_table_rows(table_surface, league, (0, 0))
+        cached = (version, table_surface)
+        if version is not None:
+            _league_table_cache[league] = cached
+    surface.blit(cached[1], start_pos)
+
+
+def _draw_league_table_rows(surface, league, start_pos):
+    """Draws the league table headers and rows (uncached)."""
     x, y = start_pos
-    col_widths = [150, 30, 30, 30, 30, 40, 40, 40, 40]  # Adjust as needed
+    col_widths = LEAGUE_TABLE_COL_WIDTHS
     headers = ["Team", "P", "W", "D", "L", "PF", "PA", "PD", "Pts"]
-    line_height = FONT_SMALL_SIZE + 5
+    line_height = LEAGUE_TABLE_LINE_HEIGHT
 
     # Draw headers
     current_x = x